@@ -1,28 +1,48 @@
 from pdf_tools.convert import (
+    ConversionCache,
     UnsupportedFileTypeError,
     convert_file_to_pdf,
+    convert_files_to_bytes,
+    convert_files_to_paths,
     convert_files_to_pdfs,
     convert_folder_to_pdfs,
+    convert_image_bytes_to_pdf,
     convert_image_to_pdf,
+    convert_images_to_one_pdf,
+    convert_word_bytes_to_pdf,
     convert_word_to_pdf,
+    iter_convert_files,
     unoserver_listener,
+    unoserver_pool,
+)
+from pdf_tools.merge import (
+    merge_pdfs,
+    merge_pdfs_to_bytes,
+    merge_pdfs_to_stream,
 )
-from pdf_tools.merge import merge_pdfs
 from pdf_tools.models import (
     ConversionBatchResult,
+    ConversionEvent,
     File,
     Files,
+    ImageOptions,
+    InMemoryPdf,
     SkippedFile,
     WatermarkOptions,
     WatermarkResult,
 )
 from pdf_tools.process import convert_and_merge_pdfs
+from pdf_tools.walk import walk_files
 from pdf_tools.watermark import add_text_watermark
 
 __all__ = [
     "ConversionBatchResult",
+    "ConversionEvent",
+    "ConversionCache",
     "File",
     "Files",
+    "ImageOptions",
+    "InMemoryPdf",
     "SkippedFile",
     "UnsupportedFileTypeError",
     "WatermarkOptions",
@@ -30,10 +50,20 @@ __all__ = [
     "add_text_watermark",
     "convert_and_merge_pdfs",
     "convert_file_to_pdf",
+    "convert_files_to_bytes",
+    "convert_files_to_paths",
     "convert_files_to_pdfs",
     "convert_folder_to_pdfs",
+    "convert_image_bytes_to_pdf",
+    "convert_images_to_one_pdf",
     "convert_image_to_pdf",
+    "convert_word_bytes_to_pdf",
     "convert_word_to_pdf",
+    "iter_convert_files",
     "merge_pdfs",
+    "merge_pdfs_to_bytes",
+    "merge_pdfs_to_stream",
     "unoserver_listener",
+    "unoserver_pool",
+    "walk_files",
 ]
@@ -0,0 +1,41 @@
+"""
+Asyncio-native entry points.
+
+Every helper here is a coroutine function mirroring the blocking API of the
+same name, for use inside an event loop::
+
+    from pdf_tools import aio
+
+    result = await aio.convert_files_to_pdfs(paths, output_dir="out")
+
+Office work talks to the :mod:`unoserver` listener asynchronously, CPU work
+runs on bounded executors, and cancellation stops the child processes a
+call started.  See :mod:`pdf_tools.convert.aio` for the details.
+"""
+
+from pdf_tools.convert.aio import (
+    convert_file_to_pdf,
+    convert_files_to_bytes,
+    convert_files_to_paths,
+    convert_files_to_pdfs,
+    convert_image_to_pdf,
+    convert_word_bytes_to_pdf,
+    convert_word_to_pdf,
+)
+from pdf_tools.merge.aio import merge_pdfs, merge_pdfs_to_bytes
+from pdf_tools.process.aio import convert_and_merge_pdfs
+from pdf_tools.watermark.aio import add_text_watermark
+
+__all__ = [
+    "add_text_watermark",
+    "convert_and_merge_pdfs",
+    "convert_file_to_pdf",
+    "convert_files_to_bytes",
+    "convert_files_to_paths",
+    "convert_files_to_pdfs",
+    "convert_image_to_pdf",
+    "convert_word_bytes_to_pdf",
+    "convert_word_to_pdf",
+    "merge_pdfs",
+    "merge_pdfs_to_bytes",
+]
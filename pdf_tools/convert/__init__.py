@@ -1,19 +1,34 @@
+from .cache import ConversionCache
 from .service import (
     UnsupportedFileTypeError,
     convert_file_to_pdf,
+    convert_files_to_bytes,
+    convert_files_to_paths,
     convert_files_to_pdfs,
     convert_folder_to_pdfs,
+    convert_image_bytes_to_pdf,
     convert_image_to_pdf,
+    convert_images_to_one_pdf,
+    convert_word_bytes_to_pdf,
     convert_word_to_pdf,
+    iter_convert_files,
 )
-from .unoserver_ctx import unoserver_listener
+from .unoserver_ctx import unoserver_listener, unoserver_pool
 
 __all__ = [
+    "ConversionCache",
     "UnsupportedFileTypeError",
     "convert_file_to_pdf",
+    "convert_files_to_bytes",
+    "convert_files_to_paths",
     "convert_files_to_pdfs",
     "convert_folder_to_pdfs",
+    "convert_image_bytes_to_pdf",
+    "convert_images_to_one_pdf",
     "convert_image_to_pdf",
+    "convert_word_bytes_to_pdf",
     "convert_word_to_pdf",
+    "iter_convert_files",
     "unoserver_listener",
+    "unoserver_pool",
 ]
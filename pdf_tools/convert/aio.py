@@ -0,0 +1,559 @@
+"""
+Awaitable counterparts of :mod:`pdf_tools.convert.service`.
+
+Use these helpers from code that already runs an :mod:`asyncio` event loop
+(e.g. a web service) instead of wrapping the blocking API in a thread.
+
+* **Word** documents are sent to the :mod:`unoserver` listener with
+  :class:`pdf_tools.convert.unoserver_client.AsyncUnoserverClient`; the
+  ``unoconvert`` fallback runs through
+  :func:`asyncio.create_subprocess_exec`.
+* **Images** are rendered on a bounded executor: a process pool with
+  *image_workers* > 1, otherwise one worker thread.
+* Cache lookups and output writes run in threads so the loop never blocks
+  on disk I/O.
+
+Batch helpers bound their concurrency three ways: each listener port in
+*xmlrpc_ports* converts one document at a time, *image_workers* caps image
+rendering, and *max_concurrency* caps the number of files in progress (new
+inputs are only read as slots free up).
+
+Cancelling a call kills any ``unoconvert`` child it started and terminates
+the image worker processes of the batch.  A listener keeps converting the
+document it already received; its result is simply not awaited.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import subprocess
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Sequence,
+)
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import asynccontextmanager, suppress
+from functools import partial
+from multiprocessing.queues import SimpleQueue
+from pathlib import Path
+from typing import TypeVar
+
+import typer
+
+from pdf_tools.convert.cache import ConversionCache
+from pdf_tools.convert.service import (
+    _DEFAULT_XMLRPC_PORT,
+    _UNOCONVERT_CMD,
+    SUPPORTED_WORD_FORMATS,
+    ConversionJob,
+    ConversionOutcome,
+    _cache_key,
+    _checked_output_path,
+    _converter_id,
+    _fetch_cached,
+    _image_render,
+    _output_dir_handler,
+    _render_image,
+)
+from pdf_tools.convert.unoserver_client import (
+    AsyncUnoserverClient,
+    OfficeProtocolError,
+)
+from pdf_tools.convert.unoserver_ctx import (
+    assert_office_ready,
+    recover_office,
+)
+from pdf_tools.models.files import (
+    ConversionBatchResult,
+    File,
+    FileInput,
+    FilesInput,
+    SkippedFile,
+    coerce_file,
+    iter_files,
+)
+from pdf_tools.models.images import ImageOptions
+
+__all__ = [
+    "convert_file_to_pdf",
+    "convert_files_to_bytes",
+    "convert_files_to_paths",
+    "convert_files_to_pdfs",
+    "convert_image_to_pdf",
+    "convert_word_bytes_to_pdf",
+    "convert_word_to_pdf",
+]
+
+_T = TypeVar("_T")
+
+
+async def _unoconvert(args: Sequence[str], data: bytes | None = None) -> bytes:
+    """Run ``unoconvert`` with *args*, killing it if the call is cancelled."""
+    proc = await asyncio.create_subprocess_exec(
+        _UNOCONVERT_CMD,
+        *args,
+        stdin=subprocess.DEVNULL if data is None else subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await proc.communicate(data)
+    except BaseException:
+        with suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+        raise
+    if proc.returncode:
+        raise subprocess.CalledProcessError(
+            proc.returncode, [_UNOCONVERT_CMD, *args], stdout, stderr
+        )
+    return stdout
+
+
+async def _run_unoconvert(src: Path, dst: Path, xmlrpc_port: int) -> None:
+    try:
+        await _unoconvert(["--port", str(xmlrpc_port), str(src), str(dst)])
+    except subprocess.CalledProcessError as ex:
+        raise RuntimeError(
+            f"LibreOffice failed to convert '{src}' → '{dst}'. "
+            f"Exit code {ex.returncode}. Stderr:\n{ex.stderr.decode()}."
+        ) from ex
+
+
+async def _run_unoconvert_bytes(data: bytes, xmlrpc_port: int) -> bytes:
+    try:
+        return await _unoconvert(
+            ["--port", str(xmlrpc_port), "--convert-to", "pdf", "-", "-"],
+            data,
+        )
+    except subprocess.CalledProcessError as ex:
+        raise RuntimeError(
+            "LibreOffice failed to convert in-memory document. "
+            f"Exit code {ex.returncode}. Stderr:\n{ex.stderr.decode()}."
+        ) from ex
+
+
+async def _run_xmlrpc(src: Path, dst: Path, xmlrpc_port: int) -> None:
+    try:
+        await AsyncUnoserverClient(xmlrpc_port).convert(
+            inpath=src, outpath=dst
+        )
+    except OfficeProtocolError as ex:
+        typer.echo(f"{ex}; falling back to {_UNOCONVERT_CMD}.")
+        await _run_unoconvert(src, dst, xmlrpc_port)
+    except (RuntimeError, ConnectionError) as ex:
+        raise RuntimeError(
+            f"LibreOffice failed to convert '{src}' → '{dst}': {ex}"
+        ) from ex
+
+
+async def _word_bytes_once(data: bytes, xmlrpc_port: int) -> bytes:
+    try:
+        result = await AsyncUnoserverClient(xmlrpc_port).convert(indata=data)
+    except OfficeProtocolError as ex:
+        typer.echo(f"{ex}; falling back to {_UNOCONVERT_CMD}.")
+        return await _run_unoconvert_bytes(data, xmlrpc_port)
+    except (RuntimeError, ConnectionError) as ex:
+        raise RuntimeError(
+            f"LibreOffice failed to convert in-memory document: {ex}"
+        ) from ex
+    if result is None:
+        raise RuntimeError("unoserver returned no data for the document.")
+    return result
+
+
+async def _retry_after_crash(
+    convert: Callable[[], Awaitable[_T]], xmlrpc_port: int, label: str
+) -> _T:
+    """Await *convert*, retrying once if the listener crashed underneath."""
+    try:
+        return await convert()
+    except RuntimeError:
+        if not await asyncio.to_thread(recover_office, xmlrpc_port):
+            raise
+        typer.echo(f"Retrying {label} on restarted listener {xmlrpc_port}.")
+        return await convert()
+
+
+async def _office_ready(xmlrpc_port: int) -> None:
+    await asyncio.to_thread(
+        assert_office_ready, xmlrpc_port, require_unoconvert=False
+    )
+
+
+async def convert_word_to_pdf(
+    file: FileInput,
+    output_path: str | Path | None = None,
+    overwrite: bool = False,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+) -> File:
+    """Convert a Word document to PDF on disk without blocking the loop.
+
+    Behaves like :func:`pdf_tools.convert.service.convert_word_to_pdf` with
+    the ``"xmlrpc"`` backend, including the ``unoconvert`` fallback and the
+    single retry after a listener crash.
+    """
+    file = coerce_file(file)
+    await _office_ready(xmlrpc_port)
+    typer.echo(f"Converting {file.path.resolve()}")
+    new_path = _checked_output_path(file, output_path, overwrite)
+    await _retry_after_crash(
+        partial(_run_xmlrpc, file.absolute_path, new_path, xmlrpc_port),
+        xmlrpc_port,
+        str(file.path),
+    )
+    typer.echo(f"Converted {new_path}")
+    return File(path=new_path, bookmark_name=file.bookmark_name)
+
+
+async def convert_word_bytes_to_pdf(
+    data: bytes, xmlrpc_port: int = _DEFAULT_XMLRPC_PORT
+) -> bytes:
+    """Convert an in-memory Word document and return the PDF bytes.
+
+    See :func:`pdf_tools.convert.service.convert_word_bytes_to_pdf`.
+    """
+    await _office_ready(xmlrpc_port)
+    return await _retry_after_crash(
+        partial(_word_bytes_once, data, xmlrpc_port),
+        xmlrpc_port,
+        "in-memory document",
+    )
+
+
+async def _render(
+    file: File, executor: Executor | None, options: ImageOptions | None
+) -> bytes:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, _render_image, file, _image_render(options)
+    )
+
+
+async def convert_image_to_pdf(
+    file: FileInput,
+    output_path: str | Path | None = None,
+    overwrite: bool = False,
+    options: ImageOptions | None = None,
+    executor: Executor | None = None,
+) -> File:
+    """Convert a raster image to PDF, rendering it on *executor*.
+
+    See :func:`pdf_tools.convert.service.convert_image_to_pdf`, including
+    *options*.  With no *executor* the loop's default thread pool is used.
+
+    Raises
+    ------
+    RuntimeError
+        If the image cannot be decoded or converted.
+    """
+    file = coerce_file(file)
+    typer.echo(f"Converting {file.path.resolve()}")
+    new_path = _checked_output_path(file, output_path, overwrite)
+    pdf_bytes = await _render(file, executor, options)
+    await asyncio.to_thread(new_path.write_bytes, pdf_bytes)
+    return File(path=new_path, bookmark_name=file.bookmark_name)
+
+
+class _Workers:
+    """Listener ports, image executor and image settings of one batch."""
+
+    def __init__(
+        self,
+        xmlrpc_ports: Sequence[int] | None,
+        executor: Executor,
+        image_options: ImageOptions | None,
+    ) -> None:
+        self.executor = executor
+        self.image_options = image_options
+        self._ports: asyncio.Queue[int] = asyncio.Queue()
+        for port in xmlrpc_ports or [_DEFAULT_XMLRPC_PORT]:
+            self._ports.put_nowait(port)
+
+    @property
+    def office_slots(self) -> int:
+        return self._ports.qsize()
+
+    async def on_listener(self, job: Callable[[int], Awaitable[_T]]) -> _T:
+        """Await ``job(port)`` once a listener is free."""
+        port = await self._ports.get()
+        try:
+            return await job(port)
+        finally:
+            self._ports.put_nowait(port)
+
+
+def _record_pid(pids: SimpleQueue[int]) -> None:
+    """Image worker initializer: report the worker's PID to the parent."""
+    pids.put(os.getpid())
+
+
+def _kill_workers(executor: Executor, pids: SimpleQueue[int] | None) -> None:
+    """Stop image workers that are still rendering for an aborted batch."""
+    executor.shutdown(wait=False, cancel_futures=True)
+    while pids is not None and not pids.empty():
+        with suppress(ProcessLookupError):
+            os.kill(pids.get(), signal.SIGTERM)
+
+
+@asynccontextmanager
+async def _batch_workers(
+    xmlrpc_ports: Sequence[int] | None,
+    image_workers: int,
+    image_options: ImageOptions | None,
+) -> AsyncIterator[_Workers]:
+    executor: Executor
+    pids: SimpleQueue[int] | None = None
+    if image_workers > 1:
+        pids = multiprocessing.SimpleQueue()
+        executor = ProcessPoolExecutor(
+            max_workers=image_workers,
+            initializer=_record_pid,
+            initargs=(pids,),
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        yield _Workers(xmlrpc_ports, executor, image_options)
+    except BaseException:
+        _kill_workers(executor, pids)
+        raise
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _gather_bounded(
+    jobs: Iterable[Callable[[], Awaitable[_T]]], limit: int
+) -> list[_T]:
+    """Await every job with at most *limit* running; keep input order.
+
+    *jobs* is read lazily, one entry per free slot.  If any job raises (or
+    the caller is cancelled) the remaining jobs are cancelled.
+    """
+    slots = asyncio.Semaphore(limit)
+
+    async def _run(job: Callable[[], Awaitable[_T]]) -> _T:
+        try:
+            return await job()
+        finally:
+            slots.release()
+
+    tasks: list[asyncio.Task[_T]] = []
+    async with asyncio.TaskGroup() as group:
+        for job in jobs:
+            await slots.acquire()
+            tasks.append(group.create_task(_run(job)))
+    return [task.result() for task in tasks]
+
+
+async def _convert_file(
+    file: File,
+    output_path: str | Path | None,
+    overwrite: bool,
+    cache: ConversionCache | None,
+    workers: _Workers,
+) -> File:
+    converter = _converter_id(file, workers.image_options)
+    key = None
+    if cache is not None:
+        key = await asyncio.to_thread(_cache_key, cache, file, converter)
+        cached = await asyncio.to_thread(
+            _fetch_cached, file, output_path, overwrite, cache, key
+        )
+        if cached is not None:
+            return cached
+    if file.type.lower() in SUPPORTED_WORD_FORMATS:
+        result = await workers.on_listener(
+            partial(convert_word_to_pdf, file, output_path, overwrite)
+        )
+    else:
+        result = await convert_image_to_pdf(
+            file,
+            output_path,
+            overwrite,
+            workers.image_options,
+            workers.executor,
+        )
+    if cache is not None and key is not None:
+        await asyncio.to_thread(cache.store, key, result.path)
+    return result
+
+
+async def _convert_job(
+    file: File,
+    output_path: str | Path | None,
+    overwrite: bool,
+    cache: ConversionCache | None,
+    workers: _Workers,
+) -> ConversionOutcome:
+    try:
+        return await _convert_file(
+            file, output_path, overwrite, cache, workers
+        )
+    except (RuntimeError, ValueError, OSError) as ex:
+        return SkippedFile(path=file.path, reason=str(ex))
+
+
+async def convert_file_to_pdf(
+    file: FileInput,
+    output_path: str | Path | None = None,
+    overwrite: bool = False,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+    cache: ConversionCache | None = None,
+    image_options: ImageOptions | None = None,
+) -> File:
+    """Convert any supported file; see the blocking
+    :func:`pdf_tools.convert.service.convert_file_to_pdf`.
+    """
+    async with _batch_workers([xmlrpc_port], 1, image_options) as workers:
+        return await _convert_file(
+            coerce_file(file), output_path, overwrite, cache, workers
+        )
+
+
+def _default_concurrency(workers: _Workers, image_workers: int) -> int:
+    return 2 * (workers.office_slots + image_workers)
+
+
+async def convert_files_to_paths(
+    jobs: Iterable[ConversionJob],
+    overwrite: bool = False,
+    xmlrpc_ports: Sequence[int] | None = None,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    max_concurrency: int | None = None,
+    image_options: ImageOptions | None = None,
+) -> list[ConversionOutcome]:
+    """Convert each ``(file, output_path)`` job, skipping failures.
+
+    Parameters
+    ----------
+    jobs : :class:`Iterable[tuple[File | str | Path, str | Path | None]]`
+        Inputs and their destinations; read lazily as slots free up.
+    max_concurrency : `int` | `None`, optional
+        Files converted at the same time.  Defaults to twice the number of
+        listeners plus image workers.
+
+    Returns
+    -------
+    list[File | SkippedFile]
+        One outcome per job, in input order.
+    """
+    async with _batch_workers(
+        xmlrpc_ports, image_workers, image_options
+    ) as workers:
+        limit = max_concurrency or _default_concurrency(workers, image_workers)
+        return await _gather_bounded(
+            (
+                partial(
+                    _convert_job,
+                    coerce_file(file),
+                    output_path,
+                    overwrite,
+                    cache,
+                    workers,
+                )
+                for file, output_path in jobs
+            ),
+            limit,
+        )
+
+
+async def convert_files_to_pdfs(
+    files: FilesInput,
+    output_dir: str | Path | None = None,
+    overwrite: bool = False,
+    xmlrpc_ports: Sequence[int] | None = None,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    max_concurrency: int | None = None,
+    image_options: ImageOptions | None = None,
+) -> ConversionBatchResult:
+    """Convert many files to PDFs in *output_dir*, skipping failures.
+
+    See :func:`pdf_tools.convert.service.convert_files_to_pdfs` and, for
+    the concurrency options, :func:`convert_files_to_paths`.
+    """
+    target_dir = Path.cwd() if output_dir is None else Path(output_dir)
+    hits, misses = (0, 0) if cache is None else (cache.hits, cache.misses)
+    outcomes = await convert_files_to_paths(
+        (
+            (file, _output_dir_handler(file.path, target_dir))
+            for file in iter_files(files)
+        ),
+        overwrite=overwrite,
+        xmlrpc_ports=xmlrpc_ports,
+        cache=cache,
+        image_workers=image_workers,
+        max_concurrency=max_concurrency,
+        image_options=image_options,
+    )
+    return ConversionBatchResult(
+        converted=[o for o in outcomes if isinstance(o, File)],
+        skipped=[o for o in outcomes if isinstance(o, SkippedFile)],
+        cache_hits=0 if cache is None else cache.hits - hits,
+        cache_misses=0 if cache is None else cache.misses - misses,
+    )
+
+
+async def _bytes_job(
+    file: File, cache: ConversionCache | None, workers: _Workers
+) -> bytes | SkippedFile:
+    try:
+        converter = _converter_id(file, workers.image_options)
+        key = None
+        if cache is not None:
+            key = await asyncio.to_thread(_cache_key, cache, file, converter)
+            cached = await asyncio.to_thread(cache.fetch_bytes, key)
+            if cached is not None:
+                typer.echo(f"Reused cached PDF for {file.path.resolve()}")
+                return cached
+        typer.echo(f"Converting {file.path.resolve()}")
+        if file.type.lower() in SUPPORTED_WORD_FORMATS:
+            data = await asyncio.to_thread(file.absolute_path.read_bytes)
+            pdf = await workers.on_listener(
+                partial(convert_word_bytes_to_pdf, data)
+            )
+        else:
+            pdf = await _render(file, workers.executor, workers.image_options)
+        if cache is not None and key is not None:
+            await asyncio.to_thread(cache.store_bytes, key, pdf)
+        return pdf
+    except (RuntimeError, ValueError, OSError) as ex:
+        return SkippedFile(path=file.path, reason=str(ex))
+
+
+async def convert_files_to_bytes(
+    files: FilesInput,
+    xmlrpc_ports: Sequence[int] | None = None,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    max_concurrency: int | None = None,
+    image_options: ImageOptions | None = None,
+) -> list[bytes | SkippedFile]:
+    """Convert each file to PDF bytes in memory, skipping failures.
+
+    See :func:`pdf_tools.convert.service.convert_files_to_bytes` and, for
+    the concurrency options, :func:`convert_files_to_paths`.
+    """
+    async with _batch_workers(
+        xmlrpc_ports, image_workers, image_options
+    ) as workers:
+        limit = max_concurrency or _default_concurrency(workers, image_workers)
+        return await _gather_bounded(
+            (
+                partial(_bytes_job, file, cache, workers)
+                for file in iter_files(files)
+            ),
+            limit,
+        )
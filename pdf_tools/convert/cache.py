@@ -0,0 +1,205 @@
+"""Content-addressed on-disk cache for converted PDFs.
+
+Letterheads, forms and exhibit images are converted over and over.  A
+:class:`ConversionCache` stores each produced PDF under a key derived from
+the *content* of the source file plus the identity of the converter (Word
+vs. image path, library versions and options), so an identical input
+becomes a file copy instead of a LibreOffice or Pillow run.
+
+Entries live in ``<directory>/<key[:2]>/<key>.pdf``.  The cache is bounded
+by *max_bytes*; the least recently used entries (by modification time,
+which is refreshed on every hit) are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+__all__ = ["ConversionCache"]
+
+_CHUNK_SIZE = 1024 * 1024
+_DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# Content hashes remembered by ConversionCache.key_for_file.
+_MAX_REMEMBERED_DIGESTS = 4096
+
+
+class ConversionCache:
+    """Size-bounded LRU cache of converted PDFs keyed by content hash.
+
+    Parameters
+    ----------
+    directory : `str` | :class:`Path`
+        Cache root; created if missing.  Safe to share between batches.
+    max_bytes : `int`, default 1 GiB
+        Upper bound for the total size of cached PDFs.
+    link : `bool`, default ``False``
+        Hard-link hits into place instead of copying them.  Faster and
+        space-saving, but editing an output in place would also change the
+        cached entry.
+
+    Attributes
+    ----------
+    hits, misses : `int`
+        Lookup counters since the cache object was created.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        link: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._digests: OrderedDict[
+            tuple[str, int, int, int], hashlib._Hash
+        ] = OrderedDict()
+        self._size = sum(entry.stat().st_size for entry in self._entries())
+
+    @staticmethod
+    def key_for_bytes(data: bytes, converter: str) -> str:
+        """Return the cache key for in-memory *data*."""
+        digest = hashlib.sha256(data)
+        digest.update(b"\0" + converter.encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def key_for_path(path: Path, converter: str) -> str:
+        """Return the cache key for the file at *path*, hashed in chunks."""
+        digest = _content_digest(path)
+        digest.update(b"\0" + converter.encode())
+        return digest.hexdigest()
+
+    def key_for_file(self, path: Path, converter: str) -> str:
+        """Return :meth:`key_for_path`, reading each file only once.
+
+        The content hash is remembered by path, size and modification time,
+        so a batch that looks a file up ahead of converting it (see
+        ``image_workers``) does not hash it twice.
+        """
+        stat = os.stat(path)
+        ident = (os.fspath(path), stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(ident)
+            if digest is not None:
+                self._digests.move_to_end(ident)
+        if digest is None:
+            digest = _content_digest(path)
+            with self._lock:
+                self._digests[ident] = digest
+                if len(self._digests) > _MAX_REMEMBERED_DIGESTS:
+                    self._digests.popitem(last=False)
+        digest = digest.copy()
+        digest.update(b"\0" + converter.encode())
+        return digest.hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        """Whether an entry exists, without counting a lookup."""
+        return self._entry_path(key).is_file()
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        """Materialise the entry for *key* at *destination* if present."""
+        entry = self._entry_path(key)
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return False
+        destination.unlink(missing_ok=True)
+        if self.link:
+            try:
+                os.link(entry, destination)
+            except OSError:
+                shutil.copyfile(entry, destination)
+        else:
+            shutil.copyfile(entry, destination)
+        self._count(hit=True)
+        return True
+
+    def fetch_bytes(self, key: str) -> bytes | None:
+        """Return the cached PDF for *key*, or `None` on a miss."""
+        entry = self._entry_path(key)
+        try:
+            data = entry.read_bytes()
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        os.utime(entry)
+        self._count(hit=True)
+        return data
+
+    def store(self, key: str, produced: Path) -> None:
+        """Copy a freshly converted PDF into the cache."""
+        self._store(key, lambda tmp: shutil.copyfile(produced, tmp))
+
+    def store_bytes(self, key: str, data: bytes) -> None:
+        """Add an in-memory PDF to the cache."""
+        self._store(key, lambda tmp: Path(tmp).write_bytes(data))
+
+    def _store(self, key: str, write: Callable[[str], object]) -> None:
+        entry = self._entry_path(key)
+        entry.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=entry.parent, suffix=".part")
+        os.close(fd)
+        try:
+            write(tmp)
+            size = os.path.getsize(tmp)
+            with self._lock:
+                # A re-stored key replaces its entry; count only the change.
+                try:
+                    size -= entry.stat().st_size
+                except FileNotFoundError:
+                    pass
+                os.replace(tmp, entry)
+                self._size += size
+                if self._size > self.max_bytes:
+                    self._evict()
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _evict(self) -> None:
+        entries = sorted(
+            ((entry.stat(), entry) for entry in self._entries()),
+            key=lambda item: item[0].st_mtime,
+        )
+        self._size = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in entries:
+            if self._size <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            self._size -= stat.st_size
+
+    def _entries(self) -> list[Path]:
+        return list(self.directory.glob("??/*.pdf"))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def _count(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+def _content_digest(path: Path) -> hashlib._Hash:
+    """Return a SHA-256 object fed with the bytes of *path*."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        while chunk := source.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest
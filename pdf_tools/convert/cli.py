@@ -6,34 +6,106 @@ Commands
 * ``file-to-pdf``     – convert a **single** file.
 * ``files-to-pdfs``   – convert an explicit list *or* JSON bundle of paths.
 * ``folder-to-pdfs``  – convert **every** supported file in a directory.
+* ``daemon-start`` / ``daemon-stop`` / ``daemon-status`` – manage the
+  persistent LibreOffice listener used by ``--daemon``.
 
 Each command wraps :func:`pdf_tools.convert.service.convert_file_to_pdf`,
 ensuring that business logic stays in the service layer while the CLI focuses
 on parameter parsing, user feedback, and error handling.
 """
 
-from collections.abc import Sequence
-from contextlib import nullcontext
+import contextlib
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, TypeAlias
 
 import typer
 
 from pdf_tools.cli import AsyncTyper
+from pdf_tools.convert.cache import ConversionCache
 from pdf_tools.convert.service import (
     convert_file_to_pdf,
     convert_files_to_pdfs,
+    convert_folder_to_pdfs,
+)
+from pdf_tools.convert.unoserver_ctx import pool_ports
+from pdf_tools.convert.unoserver_daemon import (
+    daemon_status,
+    office_context,
+    start_daemon,
+    stop_daemon,
 )
-from pdf_tools.convert.unoserver_ctx import unoserver_listener
 from pdf_tools.models.files import ConversionBatchResult, File, Files
+from pdf_tools.models.images import ImageOptions
+from pdf_tools.typings import PageSizeName
 
 cli = AsyncTyper(no_args_is_help=True)
 
+# Options shared with ``process convert-and-merge-pdfs``.
+_DpiOption: TypeAlias = Annotated[
+    int | None,
+    typer.Option(
+        min=1, help="Downsample images larger than the page at this DPI."
+    ),
+]
+_PageSizeOption: TypeAlias = Annotated[
+    PageSizeName,
+    typer.Option(help="Page size the --dpi budget is computed for."),
+]
+_JpegQualityOption: TypeAlias = Annotated[
+    int | None,
+    typer.Option(min=1, max=95, help="Re-encode every image as JPEG (1-95)."),
+]
+_MaxPixelsOption: TypeAlias = Annotated[
+    int | None,
+    typer.Option(min=1, help="Skip images with more pixels than this."),
+]
+_MaxMemoryOption: TypeAlias = Annotated[
+    int | None,
+    typer.Option(
+        min=1, help="Decode large images within this many megabytes."
+    ),
+]
+_CacheDirOption: TypeAlias = Annotated[
+    Path | None,
+    typer.Option(help="Reuse conversions of identical inputs stored here."),
+]
+_CacheMaxSizeOption: TypeAlias = Annotated[
+    int,
+    typer.Option(min=1, help="Cache size limit in megabytes."),
+]
+_DEFAULT_PAGE_SIZE = PageSizeName(ImageOptions().page_size)
+_DEFAULT_CACHE_MAX_SIZE = 1024
+
 
-def _requires_office(files: Sequence[File]) -> bool:
+def _requires_office(files: Iterable[File]) -> bool:
     return any(file.type.lower() in {"doc", "docx"} for file in files)
 
 
+def _open_cache(
+    cache_dir: Path | None, cache_max_size: int
+) -> ConversionCache | None:
+    if cache_dir is None:
+        return None
+    return ConversionCache(cache_dir, max_bytes=cache_max_size * 1024 * 1024)
+
+
+def _image_options(
+    dpi: int | None,
+    page_size: PageSizeName,
+    jpeg_quality: int | None,
+    max_pixels: int | None,
+    max_memory_mb: int | None,
+) -> ImageOptions:
+    return ImageOptions(
+        dpi=dpi,
+        page_size=page_size.value,
+        jpeg_quality=jpeg_quality,
+        max_pixels=max_pixels,
+        max_memory_mb=max_memory_mb,
+    )
+
+
 def _echo_batch_result(result: ConversionBatchResult) -> None:
     for skipped in result.skipped:
         typer.secho(
@@ -41,11 +113,18 @@ def _echo_batch_result(result: ConversionBatchResult) -> None:
             fg="yellow",
         )
 
-    typer.secho(
+    summary = (
         f"Converted {len(result.converted)} file(s); "
-        f"{len(result.skipped)} skipped.",
-        fg="green",
+        f"{len(result.skipped)} skipped"
     )
+    if result.unchanged:
+        summary += f"; {len(result.unchanged)} unchanged"
+    typer.secho(f"{summary}.", fg="green")
+    if result.cache_hits or result.cache_misses:
+        typer.echo(
+            f"Cache: {result.cache_hits} hit(s), "
+            f"{result.cache_misses} miss(es)."
+        )
 
 
 @cli.command()
@@ -58,16 +137,31 @@ def file_to_pdf(
         bool,
         typer.Option(help="Overwrite output file if it already exists."),
     ] = False,
+    daemon: Annotated[
+        bool,
+        typer.Option(
+            help="Reuse (or start) a persistent LibreOffice listener."
+        ),
+    ] = False,
+    dpi: _DpiOption = None,
+    page_size: _PageSizeOption = _DEFAULT_PAGE_SIZE,
+    jpeg_quality: _JpegQualityOption = None,
+    max_pixels: _MaxPixelsOption = None,
+    max_memory_mb: _MaxMemoryOption = None,
 ) -> File:
     """Convert one document to PDF and output to the same directory."""
-    context = (
-        unoserver_listener(uno_port=2002)
-        if path.suffix.lower() in {".doc", ".docx"}
-        else nullcontext()
+    context = office_context(
+        path.suffix.lower() in {".doc", ".docx"}, daemon=daemon
     )
     with context:
         try:
-            return convert_file_to_pdf(path, overwrite=overwrite_existing)
+            return convert_file_to_pdf(
+                path,
+                overwrite=overwrite_existing,
+                image_options=_image_options(
+                    dpi, page_size, jpeg_quality, max_pixels, max_memory_mb
+                ),
+            )
         except ValueError as ex:
             raise typer.BadParameter(str(ex)) from ex
 
@@ -99,6 +193,33 @@ def files_to_pdfs(
         bool,
         typer.Option(help="Overwrite output files if they already exist."),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="Number of LibreOffice workers for Word conversions.",
+        ),
+    ] = 1,
+    image_workers: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="Number of processes for image conversions.",
+        ),
+    ] = 1,
+    daemon: Annotated[
+        bool,
+        typer.Option(
+            help="Reuse (or start) a persistent LibreOffice listener."
+        ),
+    ] = False,
+    cache_dir: _CacheDirOption = None,
+    cache_max_size: _CacheMaxSizeOption = _DEFAULT_CACHE_MAX_SIZE,
+    dpi: _DpiOption = None,
+    page_size: _PageSizeOption = _DEFAULT_PAGE_SIZE,
+    jpeg_quality: _JpegQualityOption = None,
+    max_pixels: _MaxPixelsOption = None,
+    max_memory_mb: _MaxMemoryOption = None,
 ) -> ConversionBatchResult:
     """Convert many documents to PDFs.
 
@@ -119,16 +240,18 @@ def files_to_pdfs(
     else:
         files = [File.model_validate({"path": p}) for p in file_paths]
 
-    context = (
-        unoserver_listener(uno_port=2002)
-        if _requires_office(files)
-        else nullcontext()
-    )
-    with context:
+    context = office_context(_requires_office(files), workers, daemon)
+    with context as xmlrpc_ports:
         result = convert_files_to_pdfs(
             files,
             output_dir=output_dir,
             overwrite=overwrite_existing,
+            xmlrpc_ports=xmlrpc_ports,
+            cache=_open_cache(cache_dir, cache_max_size),
+            image_workers=image_workers,
+            image_options=_image_options(
+                dpi, page_size, jpeg_quality, max_pixels, max_memory_mb
+            ),
         )
 
     _echo_batch_result(result)
@@ -141,9 +264,7 @@ def files_to_pdfs(
 def folder_to_pdfs(
     input_dir: Annotated[
         Path,
-        typer.Argument(
-            help="Directory whose immediate children will be converted."
-        ),
+        typer.Argument(help="Directory whose files will be converted."),
     ],
     output_dir: Annotated[
         Path,
@@ -157,26 +278,137 @@ def folder_to_pdfs(
         bool,
         typer.Option(help="Overwrite output files if they already exist."),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="Number of LibreOffice workers for Word conversions.",
+        ),
+    ] = 1,
+    image_workers: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="Number of processes for image conversions.",
+        ),
+    ] = 1,
+    daemon: Annotated[
+        bool,
+        typer.Option(
+            help="Reuse (or start) a persistent LibreOffice listener."
+        ),
+    ] = False,
+    cache_dir: _CacheDirOption = None,
+    cache_max_size: _CacheMaxSizeOption = _DEFAULT_CACHE_MAX_SIZE,
+    incremental: Annotated[
+        bool,
+        typer.Option(help="Skip sources unchanged since the last run."),
+    ] = False,
+    recursive: Annotated[
+        bool,
+        typer.Option(help="Also convert files in subfolders."),
+    ] = False,
+    include: Annotated[
+        list[str] | None,
+        typer.Option(help="Only use files matching this glob (repeatable)."),
+    ] = None,
+    exclude: Annotated[
+        list[str] | None,
+        typer.Option(help="Skip files and folders matching this glob."),
+    ] = None,
+    max_depth: Annotated[
+        int | None,
+        typer.Option(
+            min=0, help="Subfolder levels to descend with --recursive."
+        ),
+    ] = None,
+    dpi: _DpiOption = None,
+    page_size: _PageSizeOption = _DEFAULT_PAGE_SIZE,
+    jpeg_quality: _JpegQualityOption = None,
+    max_pixels: _MaxPixelsOption = None,
+    max_memory_mb: _MaxMemoryOption = None,
 ) -> ConversionBatchResult:
     """Convert every supported file in *input_dir*.
 
-    The scan is non-recursive; it only checks the folder's first level.
+    By default only the folder's first level is scanned; ``--recursive``
+    descends into subfolders and mirrors them below the output directory.
+    With ``--incremental``, sources unchanged since the previous run are
+    skipped using a manifest kept in the output directory.
     """
     folder = Path(input_dir)
-    files = [File.model_validate({"path": file}) for file in folder.iterdir()]
-    context = (
-        unoserver_listener(uno_port=2002)
-        if _requires_office(files)
-        else nullcontext()
-    )
-    with context:
-        result = convert_files_to_pdfs(
-            files,
+    include, exclude = include or [], exclude or []
+    depth = max_depth if recursive else 0
+    with contextlib.ExitStack() as office:
+        # LibreOffice starts on the first Word document the walk reaches.
+        result = convert_folder_to_pdfs(
+            folder,
             output_dir=output_dir,
             overwrite=overwrite_existing,
+            xmlrpc_ports=[xmlrpc for _, xmlrpc in pool_ports(workers)],
+            cache=_open_cache(cache_dir, cache_max_size),
+            incremental=incremental,
+            image_workers=image_workers,
+            recursive=True,
+            include=include,
+            exclude=exclude,
+            max_depth=depth,
+            image_options=_image_options(
+                dpi, page_size, jpeg_quality, max_pixels, max_memory_mb
+            ),
+            start_office=lambda: office.enter_context(
+                office_context(True, workers, daemon)
+            ),
         )
 
     _echo_batch_result(result)
-    if not result.converted:
+    if not result.converted and not result.unchanged:
         raise typer.Exit(code=1)
     return result
+
+
+@cli.command()
+def daemon_start(
+    workers: Annotated[
+        int,
+        typer.Option(min=1, help="Number of LibreOffice listeners."),
+    ] = 1,
+    idle_timeout: Annotated[
+        float,
+        typer.Option(help="Seconds of inactivity before shutting down."),
+    ] = 600.0,
+) -> None:
+    """Start persistent LibreOffice listeners for ``--daemon`` commands."""
+    for uno_port, xmlrpc_port in pool_ports(workers):
+        info = start_daemon(
+            uno_port=uno_port,
+            xmlrpc_port=xmlrpc_port,
+            idle_timeout=idle_timeout,
+        )
+        typer.echo(f"unoserver daemon pid {info.pid} on port {xmlrpc_port}")
+
+
+@cli.command()
+def daemon_stop(
+    workers: Annotated[
+        int,
+        typer.Option(min=1, help="Number of LibreOffice listeners."),
+    ] = 1,
+) -> None:
+    """Stop persistent LibreOffice listeners."""
+    for _, xmlrpc_port in pool_ports(workers):
+        if stop_daemon(xmlrpc_port):
+            typer.echo(f"Stopped unoserver daemon on port {xmlrpc_port}")
+
+
+@cli.command("daemon-status")
+def show_daemon_status(
+    workers: Annotated[
+        int,
+        typer.Option(min=1, help="Number of LibreOffice listeners."),
+    ] = 1,
+) -> None:
+    """Report which persistent LibreOffice listeners are running."""
+    for _, xmlrpc_port in pool_ports(workers):
+        info = daemon_status(xmlrpc_port)
+        state = "stopped" if info is None else f"running (pid {info.pid})"
+        typer.echo(f"port {xmlrpc_port}: {state}")
@@ -0,0 +1,167 @@
+"""Process-pool rendering for image conversion batches.
+
+Decoding and re-encoding an image with :mod:`Pillow` is CPU-bound, so a
+thread pool does not help.  :func:`image_render_pool` renders the PDFs for
+a stream of images on a :class:`ProcessPoolExecutor` and hands them back
+to the calling thread in input order, which keeps output writes, caching
+and error reporting in the parent process.
+
+Work is submitted in chunks of several images to amortise pickling, and at
+most a few chunks per worker are in flight at once.  The image stream is
+pulled lazily, so a 20k-image batch (or a directory walk that is still
+running) never holds more than a handful of rendered PDFs in memory.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Protocol
+
+__all__ = ["ImageRenderPool", "RenderSource", "image_render_pool"]
+
+Render = Callable[[Path], bytes]
+RenderItem = tuple[int, Path]
+
+
+class RenderSource(Protocol):
+    """Hands out the image renderer for each position of a batch."""
+
+    def bind(self, position: int) -> Render: ...
+
+
+_CHUNK_SIZE = 8
+_CHUNKS_PER_WORKER = 2
+
+
+def _render_chunk(
+    render: Render, paths: Sequence[Path]
+) -> list[bytes | Exception]:
+    outcomes: list[bytes | Exception] = []
+    for path in paths:
+        try:
+            outcomes.append(render(path))
+        except (OSError, ValueError) as ex:
+            outcomes.append(ex)
+    return outcomes
+
+
+class ImageRenderPool:
+    """Render images ahead of use on *executor*, in stream order.
+
+    Parameters
+    ----------
+    executor : :class:`concurrent.futures.Executor`
+        Pool the chunks are submitted to.
+    render : ``Callable[[Path], bytes]``
+        Picklable, module-level function producing the PDF for one image.
+    items : :class:`Iterable[tuple[int, Path]]`
+        ``(position, path)`` pairs with increasing positions, pulled lazily.
+    workers : `int`
+        Worker count of *executor*; bounds the number of chunks in flight.
+    chunk_size : `int`, default ``8``
+        Images per task.
+
+    Notes
+    -----
+    :meth:`bind` returns the renderer for one position.  Positions that
+    were never announced (or were already consumed) render inline, so
+    callers may skip entries freely.  Errors raised by *render* in a worker
+    are re-raised by the call for that position.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        render: Render,
+        items: Iterable[RenderItem],
+        workers: int,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> None:
+        self._executor = executor
+        self._render = render
+        self._items = iter(items)
+        self._chunk_size = chunk_size
+        self._window = workers * _CHUNKS_PER_WORKER
+        self._exhausted = False
+        self._pulled_upto = -1
+        self._in_flight: deque[
+            tuple[list[RenderItem], Future[list[bytes | Exception]]]
+        ] = deque()
+        self._pending: set[int] = set()
+        self._ready: dict[int, bytes | Exception] = {}
+        self._fill()
+
+    def bind(self, position: int) -> Render:
+        """Return a renderer that serves *position* from the pool."""
+        return partial(self._take, position)
+
+    def _take(self, position: int, path: Path) -> bytes:
+        while position not in self._ready:
+            if position in self._pending or (
+                not self._exhausted and self._pulled_upto < position
+            ):
+                self._collect_oldest()
+            else:
+                return self._render(path)
+        outcome = self._ready.pop(position)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def _fill(self) -> None:
+        while not self._exhausted and len(self._in_flight) < self._window:
+            chunk = list(islice(self._items, self._chunk_size))
+            if not chunk:
+                self._exhausted = True
+                break
+            future = self._executor.submit(
+                _render_chunk, self._render, [path for _, path in chunk]
+            )
+            self._in_flight.append((chunk, future))
+            self._pending.update(position for position, _ in chunk)
+            self._pulled_upto = chunk[-1][0]
+
+    def _collect_oldest(self) -> None:
+        chunk, future = self._in_flight.popleft()
+        try:
+            outcomes = future.result()
+        except Exception as ex:  # e.g. BrokenProcessPool
+            outcomes = [ex] * len(chunk)
+        for (position, _), outcome in zip(chunk, outcomes, strict=True):
+            self._ready[position] = outcome
+            self._pending.discard(position)
+        self._fill()
+
+
+class _Inline:
+    """Render every position on the calling thread."""
+
+    def __init__(self, render: Render) -> None:
+        self._render = render
+
+    def bind(self, position: int) -> Render:
+        return self._render
+
+
+@contextmanager
+def image_render_pool(
+    items: Iterable[RenderItem],
+    render: Render,
+    workers: int,
+) -> Iterator[RenderSource]:
+    """Yield a renderer source for *items* backed by *workers* processes.
+
+    With a single worker no processes are started and every position
+    renders inline.
+    """
+    if workers <= 1:
+        yield _Inline(render)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield ImageRenderPool(executor, render, items, workers)
@@ -0,0 +1,309 @@
+"""Helpers for images too large to decode whole.
+
+Pillow decodes a TIFF in one go, so a 20000 x 20000 RGB plot needs 1.2 GB
+of pixels before anything is encoded.  Baseline TIFFs store those pixels
+as independently compressed strips (or tiles), though.  :func:`iter_bands`
+reads them one at a time with Pillow's own decoders and yields full-width
+horizontal bands, which :func:`png_from_bands` streams into a PNG and
+:func:`reduce_bands` shrinks by an integer factor.  Peak memory is then a
+few bands rather than the whole image.  Uncompressed, PackBits and Deflate
+strips in chunky (interleaved) layout are supported; anything else raises
+:class:`ValueError`.
+
+:mod:`img2pdf` embeds the compressed data of a non-interlaced PNG as is,
+but asks Pillow for its EXIF data first, and Pillow decodes the whole
+image to look for it unless an ``eXIf`` chunk comes before the pixels.
+:func:`png_with_exif` adds an empty one without touching the pixels.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from io import BytesIO
+from typing import Any
+
+from PIL import Image
+
+__all__ = ["iter_bands", "png_from_bands", "png_with_exif", "reduce_bands"]
+
+# Baseline TIFF tag numbers.
+_BITS_PER_SAMPLE = 258
+_COMPRESSION = 259
+_FILL_ORDER = 266
+_STRIP_OFFSETS = 273
+_SAMPLES_PER_PIXEL = 277
+_ROWS_PER_STRIP = 278
+_STRIP_BYTE_COUNTS = 279
+_PLANAR = 284
+_PREDICTOR = 317
+_TILE_WIDTH = 322
+_TILE_LENGTH = 323
+_TILE_OFFSETS = 324
+_TILE_BYTE_COUNTS = 325
+
+_UNCOMPRESSED, _PACKBITS, _DEFLATE = 1, 32773, (8, 32946)
+_PNG_MODES = {"1": (1, 0), "L": (8, 0), "RGB": (8, 2)}
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_HEADER_END = len(_PNG_SIGNATURE) + 25  # IHDR is always first.
+# A little-endian TIFF header followed by a directory with no entries.
+_EMPTY_EXIF = b"II*\x00\x08\x00\x00\x00" + b"\x00" * 6
+_IDAT_SIZE = 1 << 16
+
+
+def _tag(image: Image.Image, tag: int, default: Any = None) -> Any:
+    return image.tag_v2.get(tag, default)  # type: ignore[attr-defined]
+
+
+def _check_layout(image: Image.Image) -> int:
+    """Return the compression of *image* if its strips can be decoded."""
+    compression = _tag(image, _COMPRESSION, _UNCOMPRESSED)
+    if compression not in (_UNCOMPRESSED, _PACKBITS, *_DEFLATE):
+        raise ValueError(
+            f"TIFF compression {compression} cannot be decoded strip by strip"
+        )
+    samples = _tag(image, _SAMPLES_PER_PIXEL, 1)
+    if samples != 1 and _tag(image, _PLANAR, 1) != 1:
+        raise ValueError("planar TIFFs cannot be decoded strip by strip")
+    if _tag(image, _FILL_ORDER, 1) != 1 or _tag(image, _PREDICTOR, 1) != 1:
+        raise ValueError(
+            "TIFFs with a predictor or reversed bit order cannot be decoded "
+            "strip by strip"
+        )
+    return int(compression)
+
+
+def _read(image: Image.Image, offset: int, count: int) -> bytes:
+    fp = image.fp  # type: ignore[attr-defined]
+    fp.seek(offset)
+    data: bytes = fp.read(count)
+    if len(data) < count:
+        raise ValueError("TIFF strip is truncated")
+    return data
+
+
+def _decode(
+    image: Image.Image,
+    data: bytes,
+    compression: int,
+    size: tuple[int, int],
+) -> Image.Image:
+    rawmode = image.tile[0].args[0]  # type: ignore[attr-defined]
+    if compression == _PACKBITS:
+        return Image.frombytes(image.mode, size, data, "packbits", rawmode)
+    if compression in _DEFLATE:
+        data = zlib.decompress(data)
+    return Image.frombytes(image.mode, size, data, "raw", rawmode)
+
+
+def _row_bytes(image: Image.Image) -> int:
+    bits = _tag(image, _BITS_PER_SAMPLE, (1,))
+    bits = bits if isinstance(bits, tuple) else (bits,)
+    per_pixel = sum(bits)
+    if len(bits) == 1:
+        per_pixel *= _tag(image, _SAMPLES_PER_PIXEL, 1)
+    return int(image.width * per_pixel + 7) // 8
+
+
+def _strip_bands(
+    image: Image.Image, compression: int, max_bytes: int
+) -> Iterator[Image.Image]:
+    width, height = image.size
+    rows_per_strip = min(_tag(image, _ROWS_PER_STRIP, height), height)
+    offsets = _tag(image, _STRIP_OFFSETS)
+    counts = _tag(image, _STRIP_BYTE_COUNTS)
+    decoded_row = width * len(image.getbands())
+    for index, (offset, count) in enumerate(zip(offsets, counts, strict=True)):
+        top = index * rows_per_strip
+        rows = min(rows_per_strip, height - top)
+        if rows <= 0:
+            break
+        if rows * decoded_row <= max_bytes:
+            data = _read(image, offset, count)
+            yield _decode(image, data, compression, (width, rows))
+        elif compression == _UNCOMPRESSED:
+            # Raw strips can be split anywhere on a row boundary.
+            stride = _row_bytes(image)
+            step = max(1, max_bytes // decoded_row)
+            for row in range(0, rows, step):
+                part = min(step, rows - row)
+                data = _read(image, offset + row * stride, part * stride)
+                yield _decode(image, data, compression, (width, part))
+        else:
+            raise ValueError(
+                f"a TIFF strip of {rows} rows does not fit the memory limit"
+            )
+
+
+def _tile_bands(
+    image: Image.Image, compression: int, max_bytes: int
+) -> Iterator[Image.Image]:
+    width, height = image.size
+    tile_width = _tag(image, _TILE_WIDTH)
+    tile_length = _tag(image, _TILE_LENGTH)
+    offsets = _tag(image, _TILE_OFFSETS)
+    counts = _tag(image, _TILE_BYTE_COUNTS)
+    if width * tile_length * len(image.getbands()) > max_bytes:
+        raise ValueError(
+            f"a row of {tile_length}-pixel TIFF tiles does not fit the "
+            "memory limit"
+        )
+    across = -(-width // tile_width)
+    for top in range(0, height, tile_length):
+        band = Image.new(image.mode, (width, min(tile_length, height - top)))
+        first = top // tile_length * across
+        for column in range(across):
+            data = _read(
+                image, offsets[first + column], counts[first + column]
+            )
+            tile = _decode(image, data, compression, (tile_width, tile_length))
+            band.paste(tile, (column * tile_width, 0))
+        yield band
+
+
+def iter_bands(image: Image.Image, max_bytes: int) -> Iterator[Image.Image]:
+    """Yield the current frame of *image* as full-width bands, top to bottom.
+
+    Parameters
+    ----------
+    image : :class:`PIL.Image.Image`
+        An opened, not yet loaded, TIFF image.
+    max_bytes : `int`
+        Upper bound for the decoded size of one band.  Uncompressed strips
+        are split to fit it; compressed strips or rows of tiles that exceed
+        it raise :class:`ValueError`.
+
+    Raises
+    ------
+    ValueError
+        If the compression or layout of *image* is not supported, or a
+        strip cannot be decoded.
+    """
+    compression = _check_layout(image)
+    if _tag(image, _TILE_OFFSETS) is not None:
+        return _tile_bands(image, compression, max_bytes)
+    return _strip_bands(image, compression, max_bytes)
+
+
+def _png_chunk(out: BytesIO, kind: bytes, data: bytes) -> None:
+    out.write(struct.pack(">I", len(data)))
+    out.write(kind)
+    out.write(data)
+    out.write(struct.pack(">I", zlib.crc32(kind + data)))
+
+
+def _png_mode(mode: str) -> str:
+    """Return the mode that bands of *mode* are encoded in."""
+    return mode if mode in _PNG_MODES else "RGB"
+
+
+def png_from_bands(
+    size: tuple[int, int],
+    mode: str,
+    bands: Iterable[Image.Image],
+    dpi: tuple[float, float] | None = None,
+) -> bytes:
+    """Encode *bands* as one non-interlaced PNG of *size*.
+
+    Rows are deflated as they arrive, so only the compressed PNG and the
+    current band are held in memory.  The PNG carries an empty ``eXIf``
+    chunk (see :func:`png_with_exif`).  Bands that are not bilevel,
+    greyscale or RGB are converted to RGB; *mode* is that of the bands.
+    """
+    target = _png_mode(mode)
+    bit_depth, colour_type = _PNG_MODES[target]
+    out = BytesIO()
+    out.write(_PNG_SIGNATURE)
+    header = struct.pack(">II5B", *size, bit_depth, colour_type, 0, 0, 0)
+    _png_chunk(out, b"IHDR", header)
+    _png_chunk(out, b"eXIf", _EMPTY_EXIF)
+    if dpi is not None:
+        per_metre = [round(value / 0.0254) for value in dpi]
+        _png_chunk(out, b"pHYs", struct.pack(">IIB", *per_metre, 1))
+    compressor = zlib.compressobj(6)
+    pending = bytearray()
+    for band in bands:
+        if band.mode != target:
+            band = band.convert(target)
+        data = band.tobytes()
+        stride = len(data) // band.height
+        for row in range(0, len(data), stride):
+            pending += compressor.compress(b"\0" + data[row : row + stride])
+            if len(pending) >= _IDAT_SIZE:
+                _png_chunk(out, b"IDAT", bytes(pending))
+                pending.clear()
+    pending += compressor.flush()
+    _png_chunk(out, b"IDAT", bytes(pending))
+    _png_chunk(out, b"IEND", b"")
+    return out.getvalue()
+
+
+def _has_exif(data: bytes) -> bool:
+    position = len(_PNG_SIGNATURE)
+    while position + 8 <= len(data):
+        length, kind = struct.unpack_from(">I4s", data, position)
+        if kind == b"eXIf":
+            return True
+        if kind == b"IDAT":
+            return False
+        position += length + 12
+    return False
+
+
+def png_with_exif(data: bytes) -> bytes:
+    """Return PNG *data* with an empty ``eXIf`` chunk before its pixels.
+
+    Only chunk headers are read; PNGs that already carry EXIF data before
+    their pixels are returned unchanged.
+    """
+    if not data.startswith(_PNG_SIGNATURE) or _has_exif(data):
+        return data
+    chunk = BytesIO()
+    _png_chunk(chunk, b"eXIf", _EMPTY_EXIF)
+    return data[:_PNG_HEADER_END] + chunk.getvalue() + data[_PNG_HEADER_END:]
+
+
+def _stack(top: Image.Image | None, bottom: Image.Image) -> Image.Image:
+    if top is None:
+        return bottom
+    stacked = Image.new(
+        bottom.mode, (bottom.width, top.height + bottom.height)
+    )
+    stacked.paste(top, (0, 0))
+    stacked.paste(bottom, (0, top.height))
+    return stacked
+
+
+def reduce_bands(
+    size: tuple[int, int],
+    mode: str,
+    bands: Iterable[Image.Image],
+    factor: int,
+) -> Image.Image:
+    """Box-reduce *bands* by *factor*, as :meth:`Image.reduce` would.
+
+    Rows are buffered until a multiple of *factor* is available, so the
+    result matches reducing the whole image at once.  Bilevel bands are
+    reduced as greyscale and other modes Pillow cannot reduce as RGB.
+    """
+    target = "L" if mode == "1" else _png_mode(mode)
+    width, height = size
+    reduced = Image.new(target, (-(-width // factor), -(-height // factor)))
+    pending: Image.Image | None = None
+    top = 0
+    for band in bands:
+        pending = _stack(pending, band.convert(target))
+        ready = pending.height - pending.height % factor
+        if ready:
+            chunk = pending.crop((0, 0, width, ready)).reduce(factor)
+            reduced.paste(chunk, (0, top))
+            top += chunk.height
+            pending = (
+                pending.crop((0, ready, width, pending.height))
+                if ready < pending.height
+                else None
+            )
+    if pending is not None:
+        reduced.paste(pending.reduce(factor), (0, top))
+    return reduced
@@ -0,0 +1,143 @@
+"""Manifest that lets folder conversions skip unchanged sources.
+
+Incremental runs of :func:`pdf_tools.convert.service.convert_folder_to_pdfs`
+record, per source path relative to the input folder, the size,
+modification time and SHA-256 of the source together with the PDF it
+produced (relative to the output folder) and the image settings used.  On
+the next run a source whose size and mtime still match is skipped without
+being opened; if only the mtime moved (e.g. a sync tool touched it) the
+hash decides.  Changed image settings always reconvert.
+
+The manifest is a JSON file named :data:`MANIFEST_NAME` in the output
+directory and is replaced atomically on save.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+__all__ = [
+    "MANIFEST_NAME",
+    "ConversionManifest",
+    "ManifestEntry",
+    "file_sha256",
+]
+
+MANIFEST_NAME = ".pdf-tools-manifest.json"
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of the file at *path*."""
+    with open(path, "rb") as source:
+        return hashlib.file_digest(source, "sha256").hexdigest()
+
+
+class ManifestEntry(BaseModel):
+    """State of one source file when its PDF was last produced."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    output: str
+    options: str = ""
+
+
+class ConversionManifest(BaseModel):
+    """Source-to-output records for one output directory."""
+
+    version: int = 1
+    entries: dict[str, ManifestEntry] = Field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> ConversionManifest:
+        """Read the manifest at *path*, or start empty if it is unusable."""
+        try:
+            return cls.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError):
+            return cls()
+
+    def save(self, path: Path) -> None:
+        """Atomically write the manifest to *path*."""
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as out:
+                out.write(self.model_dump_json(indent=2))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def up_to_date(
+        self, key: str, source: Path, output_dir: Path, options: str = ""
+    ) -> Path | None:
+        """Return the recorded output of *source* if it is still current.
+
+        *options* is the fingerprint of the settings the output should
+        have been produced with (see
+        :attr:`pdf_tools.models.images.ImageOptions.fingerprint`).
+        Touch-only changes (same size and content, new mtime) refresh the
+        entry in place so the next run takes the fast path again.
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry.options != options:
+            return None
+        output = output_dir / entry.output
+        if not output.is_file():
+            return None
+        stat = source.stat()
+        if (stat.st_size, stat.st_mtime_ns) == (entry.size, entry.mtime_ns):
+            return output
+        if stat.st_size != entry.size or file_sha256(source) != entry.sha256:
+            return None
+        entry.mtime_ns = stat.st_mtime_ns
+        return output
+
+    def adopt(
+        self,
+        key: str,
+        source: Path,
+        output: Path,
+        output_dir: Path,
+        options: str = "",
+    ) -> bool:
+        """Record an untracked *output* that is newer than *source*.
+
+        Outputs the manifest already knows about are never adopted: their
+        entry says how they were made, even if that is now out of date.
+        """
+        if key in self.entries or not output.is_file():
+            return False
+        if output.stat().st_mtime_ns < source.stat().st_mtime_ns:
+            return False
+        self.record(key, source, output, output_dir, options)
+        return True
+
+    def record(
+        self,
+        key: str,
+        source: Path,
+        output: Path,
+        output_dir: Path,
+        options: str = "",
+    ) -> None:
+        """Remember that *output* was produced from the current *source*."""
+        stat = source.stat()
+        self.entries[key] = ManifestEntry(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=file_sha256(source),
+            output=output.relative_to(output_dir).as_posix(),
+            options=options,
+        )
+
+    def prune(self, keys: Iterable[str]) -> None:
+        """Drop entries for sources that are no longer present."""
+        keep = set(keys)
+        for key in [key for key in self.entries if key not in keep]:
+            del self.entries[key]
@@ -8,7 +8,8 @@ inputs.
 
 Supported input types & back-ends
 ---------------------------------
-* **Microsoft Word** (``.doc``/``.docx``) → LibreOffice :mod:`unoconvert` CLI.
+* **Microsoft Word** (``.doc``/``.docx``) → LibreOffice via the
+  :mod:`unoserver` XMLRPC API, falling back to the :mod:`unoconvert` CLI.
 * **Raster images** (``.jpg``/``.jpeg``/``.png``/``.tiff``/``.bmp``) →
   :mod:`Pillow` + :mod:`img2pdf`.
 
@@ -19,39 +20,92 @@ for a custom logger.
 
 Design notes
 ------------
-* All functions are **blocking** and may run external processes; call them in a
-  ThreadPool if you need async flows.
+* All functions are **blocking** and may run external processes; code running
+  in an event loop should use the awaitable variants in
+  :mod:`pdf_tools.convert.aio` instead.
+* Batch helpers accept the XMLRPC ports of several listeners (see
+  :func:`pdf_tools.convert.unoserver_ctx.unoserver_pool`) and spread Word
+  conversions across them while keeping results in input order.
 * The helpers never *overwrite* an existing file unless the caller explicitly
   points *output_path* to an existing location.
+* An optional :class:`pdf_tools.convert.cache.ConversionCache` short-cuts
+  repeated conversions of identical inputs into a file copy.
 """
 
+import shutil
 import subprocess
-from collections.abc import Sequence
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import AbstractContextManager
+from functools import lru_cache, partial
 from io import BytesIO
+from itertools import tee
 from pathlib import Path
-from typing import Final
+from queue import Queue
+from typing import Final, Generic, Literal, TypeAlias, TypeVar
 
 import img2pdf  # type: ignore
+import PIL
 import typer
-from PIL import Image
+from PIL import Image, ImageSequence
+from pypdf import PdfReader
 
-from pdf_tools.convert.unoserver_ctx import assert_office_ready
+from pdf_tools.convert.cache import ConversionCache
+from pdf_tools.convert.image_pool import (
+    Render,
+    RenderSource,
+    image_render_pool,
+)
+from pdf_tools.convert.large_images import (
+    iter_bands,
+    png_from_bands,
+    png_with_exif,
+    reduce_bands,
+)
+from pdf_tools.convert.manifest import MANIFEST_NAME, ConversionManifest
+from pdf_tools.convert.unoserver_client import (
+    OfficeProtocolError,
+    get_client,
+)
+from pdf_tools.convert.unoserver_ctx import (
+    _DEFAULT_XMLRPC_PORT,
+    assert_office_ready,
+    recover_office,
+)
+from pdf_tools.merge.stream import PdfStreamWriter
 from pdf_tools.models.files import (
     ConversionBatchResult,
+    ConversionEvent,
     File,
     FileInput,
     FilesInput,
+    InMemoryPdf,
     SkippedFile,
     coerce_file,
-    coerce_files,
+    iter_files,
 )
+from pdf_tools.models.images import ImageOptions
+from pdf_tools.walk import walk_files
 
 __all__: Sequence[str] = [
     "convert_word_to_pdf",
+    "convert_word_bytes_to_pdf",
     "convert_image_to_pdf",
+    "convert_image_bytes_to_pdf",
+    "convert_images_to_one_pdf",
     "convert_file_to_pdf",
+    "convert_files_to_bytes",
     "convert_files_to_pdfs",
+    "convert_files_to_paths",
     "convert_folder_to_pdfs",
+    "iter_convert_files",
     "UnsupportedFileTypeError",
 ]
 
@@ -61,6 +115,23 @@ SUPPORTED_FILE_FORMATS: set[str] = (
     SUPPORTED_IMAGE_FORMATS | SUPPORTED_WORD_FORMATS
 )
 _UNOCONVERT_CMD: Final[str] = "unoconvert"
+_DEFAULT_JPEG_QUALITY: Final = 85
+_MB: Final = 1024 * 1024
+# img2pdf rejections that the RGB/PNG normalisation can still handle.
+_IMG2PDF_ERRORS: Final = (
+    img2pdf.AlphaChannelError,
+    img2pdf.ExifOrientationError,
+    img2pdf.ImageOpenError,
+    img2pdf.JpegColorspaceError,
+    img2pdf.UnsupportedColorspaceError,
+    ValueError,
+)
+
+OfficeBackend: TypeAlias = Literal["xmlrpc", "unoconvert"]
+ConversionJob: TypeAlias = tuple[FileInput, str | Path | None]
+ConversionOutcome: TypeAlias = File | SkippedFile
+_T = TypeVar("_T")
+_J = TypeVar("_J")
 
 
 class UnsupportedFileTypeError(ValueError):
@@ -87,6 +158,23 @@ def _resolve_output_path(file: File, output_path: str | Path | None) -> Path:
     return path
 
 
+def _checked_output_path(
+    file: File, output_path: str | Path | None, overwrite: bool
+) -> Path:
+    """Resolve the PDF path for *file*, refusing unusable destinations."""
+    new_path = _resolve_output_path(file, output_path)
+    if new_path.exists() and overwrite is False and new_path.is_file():
+        raise FileExistsError(f"File {new_path} already exists. Exiting.")
+    if new_path.is_dir():
+        raise ValueError(f"Path {new_path} is a directory.")
+    if new_path.parent.exists() is False:
+        raise FileNotFoundError(
+            f"Output directory {new_path.parent} does not exist. "
+            f"Please create it or choose an existing directory."
+        )
+    return new_path
+
+
 def _output_dir_handler(input_path: Path, output_dir: Path) -> Path:
     """
     Create an output path from given input file and output directory.
@@ -112,10 +200,81 @@ def _output_dir_handler(input_path: Path, output_dir: Path) -> Path:
     return (output_dir / name).with_suffix(".pdf")
 
 
+def _run_unoconvert(src: Path, dst: Path, xmlrpc_port: int) -> None:
+    try:
+        subprocess.run(
+            [
+                _UNOCONVERT_CMD,
+                "--port",
+                str(xmlrpc_port),
+                str(src),
+                str(dst),
+            ],
+            check=True,
+            capture_output=True,
+        )
+    except subprocess.CalledProcessError as ex:
+        raise RuntimeError(
+            f"LibreOffice failed to convert '{src}' → '{dst}'. "
+            f"Exit code {ex.returncode}. Stderr:\n{ex.stderr.decode()}."
+        ) from ex
+
+
+def _run_unoconvert_bytes(data: bytes, xmlrpc_port: int) -> bytes:
+    try:
+        completed = subprocess.run(
+            [
+                _UNOCONVERT_CMD,
+                "--port",
+                str(xmlrpc_port),
+                "--convert-to",
+                "pdf",
+                "-",
+                "-",
+            ],
+            input=data,
+            check=True,
+            capture_output=True,
+        )
+    except subprocess.CalledProcessError as ex:
+        raise RuntimeError(
+            "LibreOffice failed to convert in-memory document. "
+            f"Exit code {ex.returncode}. Stderr:\n{ex.stderr.decode()}."
+        ) from ex
+    return completed.stdout
+
+
+def _run_xmlrpc(src: Path, dst: Path, xmlrpc_port: int) -> None:
+    try:
+        get_client(xmlrpc_port).convert(inpath=src, outpath=dst)
+    except OfficeProtocolError as ex:
+        typer.echo(f"{ex}; falling back to {_UNOCONVERT_CMD}.")
+        _run_unoconvert(src, dst, xmlrpc_port)
+    except (RuntimeError, ConnectionError) as ex:
+        raise RuntimeError(
+            f"LibreOffice failed to convert '{src}' → '{dst}': {ex}"
+        ) from ex
+
+
+def _retry_after_crash(
+    convert: Callable[[], _T], xmlrpc_port: int, label: str
+) -> _T:
+    """Run *convert*, retrying once if the listener crashed underneath it."""
+    try:
+        return convert()
+    except RuntimeError:
+        if not recover_office(xmlrpc_port):
+            raise
+        typer.echo(f"Retrying {label} on restarted listener {xmlrpc_port}.")
+        return convert()
+
+
 def convert_word_to_pdf(
     file: FileInput,
     output_path: str | Path | None = None,
     overwrite: bool = False,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+    backend: OfficeBackend = "xmlrpc",
 ) -> File:
     """Convert a Word document (``.doc``, ``.docx``) to PDF on disk.
 
@@ -130,6 +289,14 @@ def convert_word_to_pdf(
         file.
     overwrite : `bool`, default ``False``
         Overwrite output file if it already exists.
+    xmlrpc_port : `int`, default ``2003``
+        XMLRPC port of the :mod:`unoserver` listener that performs the
+        conversion.
+    backend : ``"xmlrpc"`` | ``"unoconvert"``, default ``"xmlrpc"``
+        ``"xmlrpc"`` calls the listener through this thread's cached
+        :class:`pdf_tools.convert.unoserver_client.UnoserverClient` and falls
+        back to the CLI if the listener rejects the call signature.
+        ``"unoconvert"`` always spawns the ``unoconvert`` CLI.
 
     Returns
     -------
@@ -142,54 +309,413 @@ def convert_word_to_pdf(
     FileExistsError
         If `overwrite` is False and the output path already exists.
     RuntimeError
-        If LibreOffice exits with a non-zero status.
+        If LibreOffice fails to convert the document.  A failure caused by
+        the listener crashing is retried once after
+        :func:`pdf_tools.convert.unoserver_ctx.recover_office` brings it
+        back.
     FileNotFoundError
         If `output_path`'s parent directory does not exist.
     """
     file = coerce_file(file)
-    assert_office_ready()
+    assert_office_ready(
+        xmlrpc_port, require_unoconvert=backend == "unoconvert"
+    )
     typer.echo(f"Converting {file.path.resolve()}")
-    new_path = _resolve_output_path(file, output_path)
+    new_path = _checked_output_path(file, output_path, overwrite)
+    run = _run_xmlrpc if backend == "xmlrpc" else _run_unoconvert
+    _retry_after_crash(
+        partial(run, file.absolute_path, new_path, xmlrpc_port),
+        xmlrpc_port,
+        str(file.path),
+    )
 
-    if new_path.exists() and overwrite is False:
-        raise FileExistsError(f"File {new_path} already exists. Exiting.")
-    if new_path.is_dir():
-        raise ValueError(f"Path {new_path} is a directory.")
-    if new_path.parent.exists() is False:
-        raise FileNotFoundError(
-            f"Output directory {new_path.parent} does not exist. "
-            f"Please create it or choose an existing directory."
+    typer.echo(f"Converted {new_path}")
+    _file_data = {"path": new_path, "bookmark_name": file.bookmark_name}
+    return File.model_validate(_file_data)
+
+
+def _is_embeddable(image: Image.Image) -> bool:
+    """Whether img2pdf can take the original bytes of *image* as-is.
+
+    JPEGs are copied verbatim into the PDF and alpha-free PNGs keep their
+    compressed pixel data; single-page TIFFs in plain modes are handled by
+    img2pdf directly.  Anything with transparency or an exotic mode goes
+    through the RGB/PNG normalisation instead.
+    """
+    if "transparency" in image.info:
+        return False
+    if image.format == "JPEG":
+        return image.mode in {"RGB", "L", "CMYK"}
+    if image.format == "PNG":
+        return image.mode in {"RGB", "L", "1", "P"}
+    if image.format == "TIFF":
+        return (
+            image.mode in {"RGB", "L", "1", "CMYK"}
+            and getattr(image, "n_frames", 1) == 1
+        )
+    return False
+
+
+def _reencodes(image: Image.Image, options: ImageOptions | None) -> bool:
+    """Whether *options* require *image* to be resampled or recompressed."""
+    return options is not None and (
+        options.jpeg_quality is not None
+        or options.target_size(*image.size) is not None
+    )
+
+
+def _scaled_dpi(image: Image.Image, scale: float) -> tuple[float, float]:
+    """Return the DPI that keeps the page size of *image* after scaling."""
+    x_dpi, y_dpi = image.info.get("dpi") or (96, 96)
+    return (x_dpi or 96) * scale, (y_dpi or 96) * scale
+
+
+def _draft_size(
+    image: Image.Image,
+    target: tuple[int, int] | None,
+    memory_limit: int | None,
+) -> tuple[int, int] | None:
+    """Return the size to request from :meth:`Image.draft` for *image*.
+
+    JPEGs decode at 1/2, 1/4 or 1/8 scale, rounding up like libjpeg; the
+    smallest reduction whose decoded pixels fit *memory_limit* bytes is
+    used unless *target* is smaller.
+    """
+    if memory_limit is None:
+        return target
+    bands = len(image.getbands())
+    for scale in (1, 2, 4, 8):
+        decoded = -(-image.width // scale), -(-image.height // scale)
+        if decoded[0] * decoded[1] * bands <= memory_limit:
+            break
+    else:
+        raise ValueError(
+            f"Image of {image.width}x{image.height} pixels cannot be "
+            f"decoded within {memory_limit // _MB} MB"
         )
+    if target is not None and target[0] <= decoded[0]:
+        return target
+    # Pillow picks the largest scale with ``width // requested >= scale``,
+    # so request the rounded-down size to get exactly *decoded* back.
+    return max(1, image.width // scale), max(1, image.height // scale)
+
+
+def _page_bytes(
+    image: Image.Image,
+    options: ImageOptions | None,
+    memory_limit: int | None = None,
+) -> bytes:
+    """Encode one page for :mod:`img2pdf`, applying *options*.
+
+    Oversized images are decoded at a reduced scale where the format allows
+    it (:meth:`Image.draft` for JPEG), then shrunk with :meth:`Image.resize`
+    using ``reducing_gap`` so most of the work happens in the cheap integer
+    :meth:`Image.reduce` step.  A *memory_limit* in bytes forces the
+    reduced-scale decode even without a target size.  Pages are JPEG when
+    a quality applies and lossless PNG otherwise; bilevel and greyscale
+    pages keep their mode.
+    """
+    quality = None if options is None else options.jpeg_quality
+    target = None if options is None else options.target_size(*image.size)
+    dpi = image.info.get("dpi")
+    if target is not None or memory_limit is not None:
+        if quality is None and image.format == "JPEG":
+            quality = _DEFAULT_JPEG_QUALITY
+        width = image.width
+        image.draft(None, _draft_size(image, target, memory_limit))
+        if image.width != width:
+            dpi = _scaled_dpi(image, image.width / width)
+    if options is not None and target is not None:
+        if image.mode in {"1", "P"}:
+            image = image.convert("L" if image.mode == "1" else "RGB")
+        image = image.resize(
+            target, Image.Resampling.LANCZOS, reducing_gap=3.0
+        )
+        dpi = (options.dpi, options.dpi)
+    modes = {"1", "L", "RGB"} if quality is None else {"L", "RGB", "CMYK"}
+    if image.mode not in modes:
+        image = image.convert("RGB")
+    save_options: dict[str, object] = {} if dpi is None else {"dpi": dpi}
+    buffer = BytesIO()
+    if quality is None:
+        image.save(buffer, format="PNG", **save_options)
+    else:
+        image.save(buffer, format="JPEG", quality=quality, **save_options)
+    return buffer.getvalue()
+
+
+def _open_image(source: Path | BytesIO) -> Image.Image:
     try:
-        subprocess.run(
-            [
-                _UNOCONVERT_CMD,
-                str(file.absolute_path),
-                str(new_path),
-            ],
-            check=True,
-            capture_output=True,
+        return Image.open(source)
+    except Image.DecompressionBombError as ex:
+        raise ValueError(str(ex)) from ex
+
+
+def _check_pixels(image: Image.Image, options: ImageOptions | None) -> None:
+    limit = None if options is None else options.max_pixels
+    pixels = image.width * image.height
+    if limit is not None and pixels > limit:
+        raise ValueError(
+            f"Image has {pixels} pixels, more than the limit of {limit}"
         )
-    except subprocess.CalledProcessError as ex:
+
+
+def _memory_limit(
+    image: Image.Image, options: ImageOptions | None
+) -> int | None:
+    """Return the memory limit in bytes if decoding *image* would exceed it."""
+    if options is None or options.max_memory_mb is None:
+        return None
+    limit = options.max_memory_mb * _MB
+    decoded = image.width * image.height * len(image.getbands())
+    return limit if decoded > limit else None
+
+
+def _embeds_undecoded(image: Image.Image) -> bool:
+    """Whether :mod:`img2pdf` embeds *image* without decoding its pixels."""
+    if image.format == "JPEG":
+        return True
+    if image.format == "PNG":
+        return not image.info.get("interlace")
+    return (
+        image.format == "TIFF"
+        and image.info.get("compression") == "group4"
+        and len(image.tag_v2.get(273, ())) == 1  # type: ignore[attr-defined]
+    )
+
+
+def _tiff_page_in_bands(
+    image: Image.Image, options: ImageOptions, memory_limit: int
+) -> bytes:
+    """Encode a TIFF page from strips decoded a few at a time."""
+    bands = iter_bands(image, memory_limit // 4)
+    target = options.target_size(*image.size)
+    if target is not None:
+        factor = min(image.width // target[0], image.height // target[1])
+        reduced = reduce_bands(image.size, image.mode, bands, max(1, factor))
+        reduced.info["dpi"] = _scaled_dpi(image, reduced.width / image.width)
+        return _page_bytes(reduced, options)
+    if options.jpeg_quality is not None:
+        raise ValueError(
+            "Image is too large to re-encode as JPEG within the memory "
+            "limit; set a target DPI to downsample it"
+        )
+    return png_from_bands(image.size, image.mode, bands, image.info.get("dpi"))
+
+
+def _page_within_memory(
+    image: Image.Image, options: ImageOptions, memory_limit: int
+) -> bytes:
+    """Encode *image*, whose decoded pixels exceed *memory_limit* bytes."""
+    if image.format == "JPEG":
+        return _page_bytes(image, options, memory_limit)
+    if image.format == "TIFF":
+        return _tiff_page_in_bands(image, options, memory_limit)
+    raise ValueError(
+        f"{image.format} image of {image.width}x{image.height} pixels "
+        f"cannot be decoded within {memory_limit // _MB} MB"
+    )
+
+
+def _frame_page(frame: Image.Image, options: ImageOptions | None) -> bytes:
+    memory_limit = _memory_limit(frame, options)
+    if options is not None and memory_limit is not None:
+        return _page_within_memory(frame, options, memory_limit)
+    return _page_bytes(frame, options)
+
+
+def _tiff_frame_pages(
+    source: Path | BytesIO, options: ImageOptions | None
+) -> Iterator[bytes]:
+    """Yield the :mod:`img2pdf` input of each frame of a multi-page TIFF."""
+    if isinstance(source, BytesIO):
+        source.seek(0)
+    with _open_image(source) as image:
+        for frame in ImageSequence.Iterator(image):
+            yield _frame_page(frame, options)
+
+
+def _image_pages(
+    source: Path | BytesIO,
+    options: ImageOptions | None = None,
+    passthrough: bool = True,
+) -> Iterable[bytes]:
+    """Encode *source* as the :mod:`img2pdf` input of each of its pages.
+
+    Frames of a multi-page TIFF are returned as an iterator that decodes
+    and encodes them one at a time, as they are consumed.  With
+    *passthrough*, embeddable images are returned as their original bytes.
+    Images whose pixels would not fit ``options.max_memory_mb`` are passed
+    through if :mod:`img2pdf` does not need to decode them, and otherwise
+    decoded at a reduced scale (JPEG) or strip by strip (TIFF).
+    """
+    if isinstance(source, BytesIO):
+        source.seek(0)
+    with _open_image(source) as image:
+        image_format = (image.format or "").lower()
+        if image_format not in SUPPORTED_IMAGE_FORMATS:
+            raise ValueError(
+                f"Unsupported image format '{image.format}'. "
+                f"Supported formats: "
+                f"{', '.join(sorted(SUPPORTED_IMAGE_FORMATS))}."
+            )
+        _check_pixels(image, options)
+        if image.format == "TIFF" and getattr(image, "n_frames", 1) > 1:
+            return _tiff_frame_pages(source, options)
+        memory_limit = _memory_limit(image, options)
+        if (
+            passthrough
+            and not _reencodes(image, options)
+            and _is_embeddable(image)
+            and (memory_limit is None or _embeds_undecoded(image))
+        ):
+            raw = (
+                source.getvalue()
+                if isinstance(source, BytesIO)
+                else source.read_bytes()
+            )
+            if memory_limit is not None and image.format == "PNG":
+                return [png_with_exif(raw)]
+            return [raw]
+        if options is not None and memory_limit is not None:
+            return [_page_within_memory(image, options, memory_limit)]
+        if _reencodes(image, options):
+            return [_page_bytes(image, options)]
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+    return [buffer.getvalue()]
+
+
+def _image_to_pdf_bytes(
+    source: Path | BytesIO, options: ImageOptions | None = None
+) -> bytes:
+    # Module-level so process pools can pickle it by reference.
+    pages = _image_pages(source, options)
+    if isinstance(pages, Iterator):
+        return _frames_to_pdf(pages)
+    pdf_bytes: bytes
+    try:
+        pdf_bytes = img2pdf.convert(pages)
+    except _IMG2PDF_ERRORS:
+        pdf_bytes = img2pdf.convert(
+            _image_pages(source, options, passthrough=False)
+        )
+    return pdf_bytes
+
+
+def _frames_to_pdf(pages: Iterable[bytes]) -> bytes:
+    """Write each page to the PDF as soon as it is encoded.
+
+    Every page becomes a one-page :mod:`img2pdf` document whose objects go
+    straight to a :class:`pdf_tools.merge.stream.PdfStreamWriter`, so only
+    one frame is held besides the PDF written so far.
+    """
+    output = BytesIO()
+    writer = PdfStreamWriter(output)
+    for page in pages:
+        writer.append(PdfReader(BytesIO(img2pdf.convert(page))))
+    writer.finish()
+    return output.getvalue()
+
+
+def convert_word_bytes_to_pdf(
+    data: bytes,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+) -> bytes:
+    """Convert an in-memory Word document and return the PDF bytes.
+
+    The document is streamed to the :mod:`unoserver` listener and the PDF
+    comes back in the XMLRPC response, so nothing touches the local disk.
+    Listeners that reject the XMLRPC call are driven through ``unoconvert``
+    reading stdin and writing stdout instead.
+
+    Parameters
+    ----------
+    data : `bytes`
+        Contents of a ``.doc`` or ``.docx`` file.
+    xmlrpc_port : `int`, default ``2003``
+        XMLRPC port of the listener that performs the conversion.
+
+    Returns
+    -------
+    bytes
+        The converted PDF.
+
+    Raises
+    ------
+    RuntimeError
+        If no listener is running or LibreOffice fails to convert the
+        document.
+    """
+    assert_office_ready(xmlrpc_port, require_unoconvert=False)
+    return _retry_after_crash(
+        partial(_word_bytes_once, data, xmlrpc_port),
+        xmlrpc_port,
+        "in-memory document",
+    )
+
+
+def _word_bytes_once(data: bytes, xmlrpc_port: int) -> bytes:
+    try:
+        result = get_client(xmlrpc_port).convert(indata=data)
+    except OfficeProtocolError as ex:
+        typer.echo(f"{ex}; falling back to {_UNOCONVERT_CMD}.")
+        return _run_unoconvert_bytes(data, xmlrpc_port)
+    except (RuntimeError, ConnectionError) as ex:
         raise RuntimeError(
-            f"LibreOffice failed to convert '{file.path}' → '{new_path}'. "
-            f"Exit code {ex.returncode}. Stderr:\n{ex.stderr.decode()}."
+            f"LibreOffice failed to convert in-memory document: {ex}"
         ) from ex
+    if result is None:
+        raise RuntimeError("unoserver returned no data for the document.")
+    return result
 
-    typer.echo(f"Converted {new_path}")
-    _file_data = {"path": new_path, "bookmark_name": file.bookmark_name}
-    return File.model_validate(_file_data)
+
+def convert_image_bytes_to_pdf(
+    data: bytes, options: ImageOptions | None = None
+) -> bytes:
+    """Convert an in-memory raster image and return the PDF bytes.
+
+    Parameters
+    ----------
+    data : `bytes`
+        Encoded image in one of the supported formats.
+    options : :class:`ImageOptions` | `None`, optional
+        Downsampling and recompression settings; see
+        :func:`convert_image_to_pdf`.
+
+    Returns
+    -------
+    bytes
+        A one-page PDF wrapping the image.
+
+    Raises
+    ------
+    RuntimeError
+        If :mod:`Pillow` cannot decode the image or its format is not
+        supported.
+    """
+    try:
+        return _image_to_pdf_bytes(BytesIO(data), options)
+    except (OSError, ValueError) as ex:
+        raise RuntimeError(
+            f"Could not convert in-memory image to PDF: {ex}."
+        ) from ex
 
 
 def convert_image_to_pdf(
     file: FileInput,
     output_path: str | Path | None = None,
     overwrite: bool = False,
+    options: ImageOptions | None = None,
 ) -> File:
     """Convert a single raster image to a *vector-wrapped* PDF.
 
-    The routine uses :mod:`Pillow` to normalise color mode and :mod:`img2pdf`
-    to wrap the image bytes without re-encoding (lossless).
+    JPEGs, alpha-free PNGs and plain single-page TIFFs are handed to
+    :mod:`img2pdf` unchanged, so JPEG data is embedded without re-encoding.
+    Other images are normalised to RGB with :mod:`Pillow` and wrapped as a
+    lossless PNG.  Multi-page TIFFs become one PDF page per frame.
 
     Parameters
     ----------
@@ -202,6 +728,10 @@ def convert_image_to_pdf(
         with ``.pdf`` extension.
     overwrite : bool, default ``False``
         Overwrite output file if it already exists.
+    options : :class:`ImageOptions` | `None`, optional
+        Downsample images larger than a page at a target DPI and/or
+        recompress them as JPEG, which shrinks phone photos considerably.
+        Images that need neither still take the passthrough above.
 
     Returns
     -------
@@ -219,47 +749,264 @@ def convert_image_to_pdf(
     FileExistsError
         If `overwrite` is False and the output path already exists.
     """
-    file = coerce_file(file)
-    typer.echo(f"Converting {file.path.resolve()}")
-    new_path = _resolve_output_path(file, output_path)
+    return _convert_image(
+        coerce_file(file), output_path, overwrite, _image_render(options)
+    )
 
-    if new_path.exists() and overwrite is False and new_path.is_file():
-        raise FileExistsError(f"File {new_path} already exists. Exiting.")
-    if new_path.is_dir():
-        raise ValueError(f"Path {new_path} is a directory.")
-    if new_path.parent.exists() is False:
-        raise FileNotFoundError(
-            f"Output directory {new_path.parent} does not exist. "
-            f"Please create it or choose an existing directory."
-        )
+
+def _pages_or_reason(
+    path: Path, options: ImageOptions | None
+) -> list[bytes] | str:
+    # Module-level so process pools can pickle it by reference.
     try:
-        with Image.open(file.absolute_path) as image:
-            image_format = (image.format or "").lower()
-            if image_format not in SUPPORTED_IMAGE_FORMATS:
-                raise ValueError(
-                    f"Unsupported image format '{image.format}'. "
-                    f"Supported formats: "
-                    f"{', '.join(sorted(SUPPORTED_IMAGE_FORMATS))}."
+        return list(_image_pages(path, options))
+    except (OSError, ValueError) as ex:
+        return str(ex)
+
+
+def _encode_images(
+    paths: Sequence[Path],
+    image_workers: int,
+    options: ImageOptions | None,
+) -> list[list[bytes] | str]:
+    encode = partial(_pages_or_reason, options=options)
+    if image_workers <= 1 or len(paths) <= 1:
+        return [encode(path) for path in paths]
+    chunk_size = max(1, len(paths) // (4 * image_workers))
+    with ProcessPoolExecutor(max_workers=image_workers) as executor:
+        return list(executor.map(encode, paths, chunksize=chunk_size))
+
+
+def convert_images_to_one_pdf(
+    files: FilesInput,
+    image_workers: int = 1,
+    image_options: ImageOptions | None = None,
+) -> tuple[InMemoryPdf | None, list[SkippedFile]]:
+    """Convert several images into one multi-page PDF in a single pass.
+
+    Each image is encoded exactly as :func:`convert_image_to_pdf` would
+    encode it, but all pages go to a single :mod:`img2pdf` call, so no
+    one-page PDF is written and parsed again per image.
+
+    Parameters
+    ----------
+    files : :class:`Iterable[File | str | Path]`
+        Images in page order.
+    image_workers : `int`, default ``1``
+        Number of processes used to decode and encode the images.
+    image_options : :class:`ImageOptions` | `None`, optional
+        Downsampling and recompression settings; see
+        :func:`convert_image_to_pdf`.
+
+    Returns
+    -------
+    tuple[InMemoryPdf | None, list[SkippedFile]]
+        The combined PDF, whose :attr:`InMemoryPdf.outline` marks the first
+        page of every image, and the images that could not be converted.
+        The PDF is `None` when no image could be converted.
+    """
+    images = list(iter_files(files))
+    typer.echo(f"Converting {len(images)} image(s) to one PDF")
+    encoded = _encode_images(
+        [file.absolute_path for file in images], image_workers, image_options
+    )
+    converted: list[File] = []
+    pages: list[bytes] = []
+    outline: list[tuple[str, int]] = []
+    skipped: list[SkippedFile] = []
+    for file, outcome in zip(images, encoded, strict=True):
+        if isinstance(outcome, str):
+            reason = (
+                f"Could not convert image '{file.path}' to PDF: {outcome}."
+            )
+            skipped.append(SkippedFile(path=file.path, reason=reason))
+            continue
+        converted.append(file)
+        outline.append((file.bookmark_name or file.name, len(pages)))
+        pages.extend(outcome)
+    if not converted:
+        return None, skipped
+    try:
+        data = img2pdf.convert(pages)
+    except _IMG2PDF_ERRORS:
+        # An embedded original was rejected; encoding every image again
+        # keeps the page count, so the outline stays valid.
+        data = img2pdf.convert(
+            [
+                page
+                for file in converted
+                for page in _image_pages(
+                    file.absolute_path, image_options, passthrough=False
                 )
-            if image.mode != "RGB":
-                image = image.convert("RGB")
-            buffer = BytesIO()
-            image.save(buffer, format="PNG")
-            with open(new_path, "wb") as pdf:
-                pdf_bytes = img2pdf.convert(buffer.getvalue())
-                pdf.write(pdf_bytes)
+            ]
+        )
+    document = InMemoryPdf(data=data, name=converted[0].name, outline=outline)
+    return document, skipped
+
+
+def _convert_image(
+    file: File,
+    output_path: str | Path | None,
+    overwrite: bool,
+    render: Render,
+) -> File:
+    typer.echo(f"Converting {file.path.resolve()}")
+    new_path = _checked_output_path(file, output_path, overwrite)
+    pdf_bytes = _render_image(file, render)
+    with open(new_path, "wb") as pdf:
+        pdf.write(pdf_bytes)
+    _file_data = {"path": new_path, "bookmark_name": file.bookmark_name}
+    return File.model_validate(_file_data)
+
+
+def _render_image(file: File, render: Render) -> bytes:
+    try:
+        return render(file.absolute_path)
     except (OSError, ValueError) as ex:
         raise RuntimeError(
             f"Could not convert image '{file.path}' to PDF: {ex}."
         ) from ex
-    _file_data = {"path": new_path, "bookmark_name": file.bookmark_name}
-    return File.model_validate(_file_data)
+
+
+def _image_render(options: ImageOptions | None) -> Render:
+    """Return the picklable renderer that applies *options*."""
+    if options is None:
+        return _image_to_pdf_bytes
+    return partial(_image_to_pdf_bytes, options=options)
+
+
+def _image_renderer(
+    files: Iterable[File],
+    image_workers: int,
+    cache: ConversionCache | None,
+    image_options: ImageOptions | None,
+) -> AbstractContextManager[RenderSource]:
+    """Return a context yielding the image renderers for a batch.
+
+    *files* is the batch in job order.  With several *image_workers*, every
+    image that is not already cached is rendered ahead of time on a process
+    pool while the batch is consumed.
+    """
+    items = (
+        (position, file.absolute_path)
+        for position, file in enumerate(files)
+        if file.type.lower() in SUPPORTED_IMAGE_FORMATS
+        and not _is_cached(file, cache, image_options)
+    )
+    return image_render_pool(
+        items, _image_render(image_options), image_workers
+    )
+
+
+def _with_lookahead(
+    jobs: Iterable[tuple[File, _J]], image_workers: int
+) -> tuple[Iterator[tuple[File, _J]], Iterator[File]]:
+    """Split *jobs* into the job stream and the renderer's file stream."""
+    if image_workers <= 1:
+        return iter(jobs), iter(())
+    stream, lookahead = tee(jobs)
+    return stream, (file for file, _ in lookahead)
+
+
+def _is_cached(
+    file: File,
+    cache: ConversionCache | None,
+    image_options: ImageOptions | None,
+) -> bool:
+    if cache is None:
+        return False
+    try:
+        converter = _converter_id(file, image_options)
+        key = _cache_key(cache, file, converter)
+    except OSError:
+        return False
+    return key in cache
+
+
+def _converter_id(
+    file: File, image_options: ImageOptions | None = None
+) -> str:
+    """Identify the converter (and its options) that handles *file*."""
+    file_type = file.type.lower()
+    if file_type in SUPPORTED_WORD_FORMATS:
+        return "word:libreoffice"
+    if file_type in SUPPORTED_IMAGE_FORMATS:
+        converter = (
+            f"image:img2pdf-{img2pdf.__version__}:pillow-{PIL.__version__}"
+            ":passthrough:tiff-frames-streamed"
+        )
+        fingerprint = _options_fingerprint(file, image_options)
+        return f"{converter}:{fingerprint}" if fingerprint else converter
+    raise UnsupportedFileTypeError(file)
+
+
+def _cache_key(cache: ConversionCache, file: File, converter: str) -> str:
+    """Return *cache*'s key for *file* as converted by *converter*.
+
+    Word keys also name the LibreOffice version, so entries made by an
+    older LibreOffice are not reused after an upgrade.
+    """
+    if converter.startswith("word:"):
+        converter = f"{converter}:{_libreoffice_version()}"
+    return cache.key_for_file(file.absolute_path, converter)
+
+
+@lru_cache(maxsize=1)
+def _libreoffice_version() -> str:
+    """Return ``soffice --version`` for the LibreOffice on ``$PATH``."""
+    soffice = shutil.which("soffice") or shutil.which("libreoffice")
+    if soffice is None:
+        return "unknown"
+    try:
+        result = subprocess.run(
+            [soffice, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return result.stdout.strip() or "unknown"
+
+
+def _options_fingerprint(
+    file: File, image_options: ImageOptions | None
+) -> str:
+    """Return the settings that shape the PDF of *file*, if any."""
+    if image_options is None:
+        return ""
+    if file.type.lower() not in SUPPORTED_IMAGE_FORMATS:
+        return ""
+    return image_options.fingerprint
+
+
+def _fetch_cached(
+    file: File,
+    output_path: str | Path | None,
+    overwrite: bool,
+    cache: ConversionCache,
+    key: str,
+) -> File | None:
+    new_path = _resolve_output_path(file, output_path)
+    writable = (
+        (overwrite or not new_path.exists())
+        and not new_path.is_dir()
+        and new_path.parent.exists()
+    )
+    if not writable or not cache.fetch(key, new_path):
+        return None
+    typer.echo(f"Reused cached PDF for {file.path.resolve()}")
+    return File(path=new_path, bookmark_name=file.bookmark_name)
 
 
 def convert_file_to_pdf(
     file: FileInput,
     output_path: str | Path | None = None,
     overwrite: bool = False,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+    cache: ConversionCache | None = None,
+    image_options: ImageOptions | None = None,
 ) -> File:
     """Dispatch `file` to the appropriate conversion helper.
 
@@ -276,6 +1023,13 @@ def convert_file_to_pdf(
         Desired output path.  Passed verbatim to the underlying helper.
     overwrite : `bool`, default ``False``
         Overwrite output file if it already exists.
+    xmlrpc_port : `int`, default ``2003``
+        Listener port used when *file* is a Word document.
+    cache : :class:`ConversionCache` | `None`, optional
+        Reuse a previously converted PDF of identical content instead of
+        running the converter, and store new results.
+    image_options : :class:`ImageOptions` | `None`, optional
+        Downsampling and recompression settings for images.
 
     Returns
     -------
@@ -287,53 +1041,601 @@ def convert_file_to_pdf(
     UnsupportedFileTypeError
         If an unsupported file type is provided.
     """
-    file = coerce_file(file)
-    file_type = file.type.lower()
+    return _convert_file(
+        coerce_file(file),
+        output_path,
+        overwrite,
+        xmlrpc_port,
+        cache,
+        image_options,
+        _image_render(image_options),
+    )
 
-    if file_type in SUPPORTED_WORD_FORMATS:
-        return convert_word_to_pdf(file, output_path, overwrite=overwrite)
 
-    if file_type in SUPPORTED_IMAGE_FORMATS:
-        return convert_image_to_pdf(file, output_path, overwrite=overwrite)
+def _convert_file(
+    file: File,
+    output_path: str | Path | None,
+    overwrite: bool,
+    xmlrpc_port: int,
+    cache: ConversionCache | None,
+    image_options: ImageOptions | None,
+    render: Render,
+) -> File:
+    converter = _converter_id(file, image_options)
+    if cache is None:
+        return _dispatch(file, output_path, overwrite, xmlrpc_port, render)
 
-    raise UnsupportedFileTypeError(file)
+    key = _cache_key(cache, file, converter)
+    cached = _fetch_cached(file, output_path, overwrite, cache, key)
+    if cached is not None:
+        return cached
+    result = _dispatch(file, output_path, overwrite, xmlrpc_port, render)
+    cache.store(key, result.path)
+    return result
 
 
-def convert_files_to_pdfs(
+def _dispatch(
+    file: File,
+    output_path: str | Path | None,
+    overwrite: bool,
+    xmlrpc_port: int,
+    render: Render,
+) -> File:
+    if file.type.lower() in SUPPORTED_WORD_FORMATS:
+        return convert_word_to_pdf(
+            file, output_path, overwrite=overwrite, xmlrpc_port=xmlrpc_port
+        )
+    return _convert_image(file, output_path, overwrite, render)
+
+
+def _convert_job(
+    file: File,
+    output_path: str | Path | None,
+    overwrite: bool,
+    cache: ConversionCache | None,
+    image_options: ImageOptions | None,
+    render: Render,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+) -> ConversionOutcome:
+    try:
+        return _convert_file(
+            file,
+            output_path,
+            overwrite,
+            xmlrpc_port,
+            cache,
+            image_options,
+            render,
+        )
+    except (RuntimeError, ValueError, OSError) as ex:
+        return SkippedFile(path=file.path, reason=str(ex))
+
+
+def _with_free_port(job: Callable[[int], _T], ports: Queue[int]) -> _T:
+    port = ports.get()
+    try:
+        return job(port)
+    finally:
+        ports.put(port)
+
+
+def _run_office_jobs(
+    jobs: Iterable[tuple[File, Callable[[int], _T]]],
+    xmlrpc_ports: Sequence[int] | None,
+) -> list[_T]:
+    """Run ``job(port)`` for each entry; results are in input order."""
+    finished = sorted(
+        _iter_office_jobs(jobs, xmlrpc_ports, ordered=False),
+        key=lambda item: item[0],
+    )
+    return [result for _, _, result in finished]
+
+
+class _Completions(Generic[_T]):
+    """Results of submitted jobs, released in completion or input order."""
+
+    def __init__(self, ordered: bool) -> None:
+        self._ordered = ordered
+        self._next_index = 0
+        self.running: dict[Future[_T], tuple[int, File]] = {}
+        self.finished: dict[int, tuple[File, _T]] = {}
+
+    def __len__(self) -> int:
+        return len(self.running) + len(self.finished)
+
+    def collect(self, block: bool) -> None:
+        if block and self.running:
+            done, _ = wait(self.running, return_when=FIRST_COMPLETED)
+        else:
+            done = {future for future in self.running if future.done()}
+        for future in done:
+            index, file = self.running.pop(future)
+            self.finished[index] = (file, future.result())
+
+    def release(self) -> Iterator[tuple[int, File, _T]]:
+        if not self._ordered:
+            for index in list(self.finished):
+                yield index, *self.finished.pop(index)
+            return
+        while self._next_index in self.finished:
+            yield self._next_index, *self.finished.pop(self._next_index)
+            self._next_index += 1
+
+
+def _iter_office_jobs(
+    jobs: Iterable[tuple[File, Callable[[int], _T]]],
+    xmlrpc_ports: Sequence[int] | None,
+    ordered: bool,
+    max_in_flight: int | None = None,
+) -> Iterator[tuple[int, File, _T]]:
+    """Yield ``(index, file, job(port))`` as jobs finish.
+
+    *jobs* is consumed lazily, so work starts with the first entry.  With a
+    single port everything runs on the calling thread, in order.  Otherwise
+    Word jobs go to a thread pool with one thread per listener while the
+    remaining jobs run inline.  Once *max_in_flight* jobs are started but
+    not yet yielded, no further input is read until one is yielded.
+    """
+    ports = list(xmlrpc_ports or [_DEFAULT_XMLRPC_PORT])
+    if len(ports) == 1:
+        for index, (file, job) in enumerate(jobs):
+            yield index, file, job(ports[0])
+        return
+
+    limit = max_in_flight or sys.maxsize
+    free_ports: Queue[int] = Queue()
+    for port in ports:
+        free_ports.put(port)
+    completions: _Completions[_T] = _Completions(ordered)
+    with ThreadPoolExecutor(max_workers=len(ports)) as pool:
+        for index, (file, job) in enumerate(jobs):
+            if file.type.lower() in SUPPORTED_WORD_FORMATS:
+                future = pool.submit(_with_free_port, job, free_ports)
+                completions.running[future] = (index, file)
+            else:
+                completions.finished[index] = (file, job(ports[0]))
+            completions.collect(block=False)
+            yield from completions.release()
+            while len(completions) >= limit:
+                completions.collect(block=True)
+                yield from completions.release()
+        while completions.running:
+            completions.collect(block=True)
+            yield from completions.release()
+
+
+def convert_files_to_paths(
+    jobs: Iterable[ConversionJob],
+    overwrite: bool = False,
+    xmlrpc_ports: Sequence[int] | None = None,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    image_options: ImageOptions | None = None,
+) -> list[ConversionOutcome]:
+    """Convert each ``(file, output_path)`` job, skipping failures.
+
+    With more than one entry in *xmlrpc_ports*, Word documents are
+    dispatched concurrently, one per listener, while other inputs convert
+    on the calling thread.  With *image_workers* above one, images are
+    decoded and encoded on a process pool of that size; outputs are still
+    written, and failures captured, on the calling thread.
+
+    Parameters
+    ----------
+    jobs : :class:`Iterable[tuple[File | str | Path, Path | None]]`
+        Source files paired with the destination handed to
+        :func:`convert_file_to_pdf`.  Consumed lazily, e.g. straight from
+        :func:`pdf_tools.walk.walk_files`.
+    overwrite : `bool`, default ``False``
+        Overwrite output files if they already exist.
+    xmlrpc_ports : :class:`Sequence[int]` | `None`, optional
+        XMLRPC ports of running listeners, e.g. the value yielded by
+        :func:`pdf_tools.convert.unoserver_ctx.unoserver_pool`.  Defaults
+        to the single listener on port 2003.
+    cache : :class:`ConversionCache` | `None`, optional
+        Content-addressed cache consulted before each conversion.
+    image_workers : `int`, default ``1``
+        Number of processes used to render images.
+    image_options : :class:`ImageOptions` | `None`, optional
+        Downsampling and recompression settings for images; see
+        :func:`convert_image_to_pdf`.
+
+    Returns
+    -------
+    list[File | SkippedFile]
+        One outcome per job, in input order.
+    """
+    finished = sorted(
+        _iter_conversions(
+            jobs,
+            overwrite,
+            xmlrpc_ports,
+            cache,
+            image_workers,
+            image_options,
+            False,
+            None,
+        ),
+        key=lambda item: item[0],
+    )
+    return [outcome for _, _, outcome in finished]
+
+
+def _iter_conversions(
+    jobs: Iterable[ConversionJob],
+    overwrite: bool,
+    xmlrpc_ports: Sequence[int] | None,
+    cache: ConversionCache | None,
+    image_workers: int,
+    image_options: ImageOptions | None,
+    ordered: bool,
+    max_in_flight: int | None,
+) -> Iterator[tuple[int, File, ConversionOutcome]]:
+    stream, lookahead = _with_lookahead(
+        ((coerce_file(file), output_path) for file, output_path in jobs),
+        image_workers,
+    )
+    renderer = _image_renderer(lookahead, image_workers, cache, image_options)
+    with renderer as renderers:
+        yield from _iter_office_jobs(
+            (
+                (
+                    file,
+                    partial(
+                        _convert_job,
+                        file,
+                        output_path,
+                        overwrite,
+                        cache,
+                        image_options,
+                        renderers.bind(position),
+                    ),
+                )
+                for position, (file, output_path) in enumerate(stream)
+            ),
+            xmlrpc_ports,
+            ordered,
+            max_in_flight,
+        )
+
+
+def iter_convert_files(
     files: FilesInput,
     output_dir: str | Path | None = None,
     overwrite: bool = False,
-) -> ConversionBatchResult:
-    """Convert many files to PDFs, skipping failures."""
+    xmlrpc_ports: Sequence[int] | None = None,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    ordered: bool = False,
+    max_in_flight: int | None = None,
+    image_options: ImageOptions | None = None,
+) -> Iterator[ConversionEvent]:
+    """Convert files to PDFs, yielding each result as soon as it exists.
+
+    Takes the same options as :func:`convert_files_to_pdfs`, but instead
+    of one :class:`ConversionBatchResult` at the end it yields a
+    :class:`ConversionEvent` per input, so callers can upload or index a
+    PDF while the rest of the batch is still converting.
+
+    Parameters
+    ----------
+    files : :class:`Iterable[File | str | Path]`
+        Inputs to convert; may be a lazy iterator such as
+        :func:`pdf_tools.walk.walk_files`.
+    output_dir : `str` | :class:`Path` | `None`, optional
+        Directory the PDFs are written to.  Defaults to the current
+        working directory.
+    ordered : `bool`, default ``False``
+        Yield events in input order instead of completion order.  Only
+        matters when several *xmlrpc_ports* convert Word files in parallel.
+    max_in_flight : `int` | `None`, optional
+        Upper bound on conversions started but not yet yielded; no more
+        input is read while the bound is reached.  Defaults to twice the
+        number of listeners.
+
+    Yields
+    ------
+    ConversionEvent
+        The input position, source and converted or skipped outcome.
+    """
     target_dir = Path.cwd() if output_dir is None else Path(output_dir)
-    converted: list[File] = []
-    skipped: list[SkippedFile] = []
+    ports = list(xmlrpc_ports or [_DEFAULT_XMLRPC_PORT])
+    for index, source, outcome in _iter_conversions(
+        (
+            (file, _output_dir_handler(file.path, target_dir))
+            for file in iter_files(files)
+        ),
+        overwrite,
+        ports,
+        cache,
+        image_workers,
+        image_options,
+        ordered,
+        max_in_flight or 2 * len(ports),
+    ):
+        yield ConversionEvent(index=index, source=source, outcome=outcome)
+
 
-    for file in coerce_files(files):
-        try:
-            converted.append(
-                convert_file_to_pdf(
+def _convert_bytes_job(
+    file: File,
+    cache: ConversionCache | None,
+    image_options: ImageOptions | None,
+    render: Render,
+    xmlrpc_port: int,
+) -> bytes | SkippedFile:
+    try:
+        converter = _converter_id(file, image_options)
+        key = None
+        if cache is not None:
+            key = _cache_key(cache, file, converter)
+            cached = cache.fetch_bytes(key)
+            if cached is not None:
+                typer.echo(f"Reused cached PDF for {file.path.resolve()}")
+                return cached
+        typer.echo(f"Converting {file.path.resolve()}")
+        if file.type.lower() in SUPPORTED_WORD_FORMATS:
+            pdf = convert_word_bytes_to_pdf(
+                file.absolute_path.read_bytes(), xmlrpc_port
+            )
+        else:
+            pdf = _render_image(file, render)
+        if cache is not None and key is not None:
+            cache.store_bytes(key, pdf)
+        return pdf
+    except (RuntimeError, ValueError, OSError) as ex:
+        return SkippedFile(path=file.path, reason=str(ex))
+
+
+def convert_files_to_bytes(
+    files: FilesInput,
+    xmlrpc_ports: Sequence[int] | None = None,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    image_options: ImageOptions | None = None,
+) -> list[bytes | SkippedFile]:
+    """Convert each file to PDF bytes in memory, skipping failures.
+
+    Word documents go through :func:`convert_word_bytes_to_pdf` and images
+    through the same path as :func:`convert_image_bytes_to_pdf`; nothing
+    is written to disk.  Word conversions are spread across *xmlrpc_ports*
+    and images across *image_workers* exactly like
+    :func:`convert_files_to_paths`.
+
+    Returns
+    -------
+    list[bytes | SkippedFile]
+        PDF bytes or the skip reason for each input, in input order.
+    """
+    stream, lookahead = _with_lookahead(
+        ((file, None) for file in iter_files(files)), image_workers
+    )
+    renderer = _image_renderer(lookahead, image_workers, cache, image_options)
+    with renderer as renderers:
+        return _run_office_jobs(
+            (
+                (
                     file,
-                    output_path=_output_dir_handler(file.path, target_dir),
-                    overwrite=overwrite,
+                    partial(
+                        _convert_bytes_job,
+                        file,
+                        cache,
+                        image_options,
+                        renderers.bind(position),
+                    ),
                 )
-            )
-        except (RuntimeError, ValueError, OSError) as ex:
-            skipped.append(SkippedFile(path=file.path, reason=str(ex)))
+                for position, (file, _) in enumerate(stream)
+            ),
+            xmlrpc_ports,
+        )
+
+
+def _starting_office(
+    jobs: Iterable[tuple[File, Path]],
+    start_office: Callable[[], object] | None,
+) -> Iterator[tuple[File, Path]]:
+    """Yield *jobs*, calling *start_office* before the first Word job."""
+    jobs = iter(jobs)
+    if start_office is None:
+        yield from jobs
+        return
+    for file, target in jobs:
+        if file.type.lower() in SUPPORTED_WORD_FORMATS:
+            start_office()
+            yield file, target
+            break
+        yield file, target
+    yield from jobs
+
+
+def _batch_result(
+    jobs: Iterable[ConversionJob],
+    overwrite: bool,
+    xmlrpc_ports: Sequence[int] | None,
+    cache: ConversionCache | None,
+    image_workers: int,
+    image_options: ImageOptions | None,
+) -> ConversionBatchResult:
+    hits, misses = (0, 0) if cache is None else (cache.hits, cache.misses)
+    outcomes = convert_files_to_paths(
+        jobs,
+        overwrite=overwrite,
+        xmlrpc_ports=xmlrpc_ports,
+        cache=cache,
+        image_workers=image_workers,
+        image_options=image_options,
+    )
+    return ConversionBatchResult(
+        converted=[o for o in outcomes if isinstance(o, File)],
+        skipped=[o for o in outcomes if isinstance(o, SkippedFile)],
+        cache_hits=0 if cache is None else cache.hits - hits,
+        cache_misses=0 if cache is None else cache.misses - misses,
+    )
+
+
+def convert_files_to_pdfs(
+    files: FilesInput,
+    output_dir: str | Path | None = None,
+    overwrite: bool = False,
+    xmlrpc_ports: Sequence[int] | None = None,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    image_options: ImageOptions | None = None,
+) -> ConversionBatchResult:
+    """Convert many files to PDFs, skipping failures.
+
+    Pass several listener ports in *xmlrpc_ports* to convert Word documents
+    in parallel, and *image_workers* to render images on a process pool;
+    see :func:`convert_files_to_paths`.  *image_options* downsamples and
+    recompresses images.  With a *cache*, the result also reports how many
+    conversions were served from it.
+    """
+    target_dir = Path.cwd() if output_dir is None else Path(output_dir)
+    return _batch_result(
+        (
+            (file, _output_dir_handler(file.path, target_dir))
+            for file in iter_files(files)
+        ),
+        overwrite,
+        xmlrpc_ports,
+        cache,
+        image_workers,
+        image_options,
+    )
+
 
-    return ConversionBatchResult(converted=converted, skipped=skipped)
+def _mirrored_output(file: File, root: Path, output_dir: Path) -> Path:
+    """Mirror the location of *file* below *root* into *output_dir*."""
+    relative = file.path.relative_to(root)
+    output = output_dir / relative.parent / f"{relative.stem}.pdf"
+    if file.type.lower() in SUPPORTED_FILE_FORMATS:
+        output.parent.mkdir(parents=True, exist_ok=True)
+    return output
 
 
 def convert_folder_to_pdfs(
     input_dir: str | Path,
     output_dir: str | Path | None = None,
     overwrite: bool = False,
+    xmlrpc_ports: Sequence[int] | None = None,
+    cache: ConversionCache | None = None,
+    incremental: bool = False,
+    image_workers: int = 1,
+    recursive: bool = False,
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+    max_depth: int | None = None,
+    image_options: ImageOptions | None = None,
+    start_office: Callable[[], object] | None = None,
 ) -> ConversionBatchResult:
-    """Convert immediate children of a folder to PDFs."""
-    folder = Path(input_dir)
-    files = [File(path=file) for file in folder.iterdir()]
-    return convert_files_to_pdfs(
-        files,
-        output_dir=output_dir,
-        overwrite=overwrite,
+    """Convert the files of a folder to PDFs.
+
+    The folder is walked lazily with :func:`pdf_tools.walk.walk_files`, so
+    conversion starts with the first file found.  By default only its
+    immediate children are converted; with ``recursive=True`` subfolders
+    are descended (up to *max_depth* levels) and their PDFs are written to
+    the matching subfolder of *output_dir*.  *include* and *exclude* are
+    glob patterns passed to the walker.
+
+    With ``incremental=True`` a manifest in *output_dir* (see
+    :mod:`pdf_tools.convert.manifest`) records what each source produced.
+    Sources unchanged since the last run are reported in
+    :attr:`ConversionBatchResult.unchanged` without being opened; new and
+    modified sources are (re)converted, replacing their previous output.
+    Existing outputs that the manifest does not know yet are adopted when
+    they are newer than their source, unless *overwrite* is set.
+
+    *start_office*, if given, is called once, just before the first Word
+    document that needs converting is handed to a listener on
+    *xmlrpc_ports*.  The CLI starts LibreOffice there, so folders without
+    Word documents never start it and the walk is not done twice.
+    """
+    root = Path(input_dir)
+    target_dir = Path.cwd() if output_dir is None else Path(output_dir)
+    files = walk_files(
+        root,
+        include=include,
+        exclude=(*exclude, MANIFEST_NAME),
+        max_depth=max_depth if recursive else 0,
+    )
+    if incremental:
+        return _convert_incrementally(
+            files,
+            root,
+            target_dir,
+            overwrite,
+            xmlrpc_ports,
+            cache,
+            image_workers,
+            image_options,
+            start_office,
+        )
+    jobs = ((file, _mirrored_output(file, root, target_dir)) for file in files)
+    return _batch_result(
+        _starting_office(jobs, start_office),
+        overwrite,
+        xmlrpc_ports,
+        cache,
+        image_workers,
+        image_options,
     )
+
+
+def _convert_incrementally(
+    files: Iterable[File],
+    root: Path,
+    output_dir: Path,
+    overwrite: bool,
+    xmlrpc_ports: Sequence[int] | None,
+    cache: ConversionCache | None,
+    image_workers: int,
+    image_options: ImageOptions | None,
+    start_office: Callable[[], object] | None,
+) -> ConversionBatchResult:
+    manifest_path = output_dir / MANIFEST_NAME
+    manifest = ConversionManifest.load(manifest_path)
+    seen: set[str] = set()
+    pending: list[tuple[str, File, Path]] = []
+    unchanged: list[File] = []
+
+    def _jobs() -> Iterator[tuple[File, Path]]:
+        for file in files:
+            key = file.path.relative_to(root).as_posix()
+            seen.add(key)
+            source = file.absolute_path
+            options = _options_fingerprint(file, image_options)
+            output = manifest.up_to_date(key, source, output_dir, options)
+            target = _mirrored_output(file, root, output_dir)
+            convertible = file.type.lower() in SUPPORTED_FILE_FORMATS
+            if output is None and convertible and not overwrite:
+                if manifest.adopt(key, source, target, output_dir, options):
+                    output = target
+            if output is None:
+                pending.append((key, file, target))
+                yield file, target
+            else:
+                unchanged.append(
+                    File(path=output, bookmark_name=file.bookmark_name)
+                )
+
+    result = _batch_result(
+        _starting_office(_jobs(), start_office),
+        True,
+        xmlrpc_ports,
+        cache,
+        image_workers,
+        image_options,
+    )
+    produced = {file.path for file in result.converted}
+    for key, file, target in pending:
+        if target in produced:
+            manifest.record(
+                key,
+                file.absolute_path,
+                target,
+                output_dir,
+                _options_fingerprint(file, image_options),
+            )
+    manifest.prune(seen)
+    manifest.save(manifest_path)
+    result.unchanged = unchanged
+    return result
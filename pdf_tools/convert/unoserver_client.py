@@ -0,0 +1,204 @@
+"""Minimal in-process client for the :mod:`unoserver` XMLRPC API.
+
+Running ``unoconvert`` starts a fresh Python interpreter and imports
+unoserver's client for every document.  :class:`UnoserverClient` calls the
+listener's ``convert`` method directly through :mod:`xmlrpc.client`, and
+:func:`get_client` keeps one client per thread and port so a batch worker
+reuses the same proxy for all of its documents.
+:class:`AsyncUnoserverClient` makes the same call over :mod:`asyncio`
+streams for use inside an event loop.
+
+The ``unoconvert`` CLI remains available as a fallback; see
+:func:`pdf_tools.convert.service.convert_word_to_pdf`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import xmlrpc.client
+from pathlib import Path
+from typing import Any
+
+__all__ = [
+    "AsyncUnoserverClient",
+    "OfficeProtocolError",
+    "UnoserverClient",
+    "get_client",
+]
+
+_DEFAULT_HOST = "127.0.0.1"
+_UNSUPPORTED_MARKERS = ("is not supported", "TypeError")
+
+_local = threading.local()
+
+
+class OfficeProtocolError(RuntimeError):
+    """Raised when the listener does not speak the expected XMLRPC API."""
+
+
+def _convert_params(
+    inpath: Path | None,
+    indata: bytes | None,
+    outpath: Path | None,
+    convert_to: str,
+) -> tuple[Any, ...]:
+    if (inpath is None) == (indata is None):
+        raise ValueError("Pass exactly one of inpath or indata.")
+    return (
+        None if inpath is None else str(inpath.resolve()),
+        None if indata is None else xmlrpc.client.Binary(indata),
+        None if outpath is None else str(outpath.resolve()),
+        convert_to,
+    )
+
+
+def _fault_error(fault: xmlrpc.client.Fault) -> RuntimeError:
+    if any(m in fault.faultString for m in _UNSUPPORTED_MARKERS):
+        return OfficeProtocolError(fault.faultString)
+    return RuntimeError(fault.faultString)
+
+
+def _http_error(port: int, status: int, reason: str) -> OfficeProtocolError:
+    return OfficeProtocolError(
+        f"unoserver on port {port} returned HTTP {status}: {reason}"
+    )
+
+
+def _unwrap(result: object) -> bytes | None:
+    if isinstance(result, xmlrpc.client.Binary):
+        return result.data
+    return None
+
+
+class UnoserverClient:
+    """XMLRPC proxy bound to one :mod:`unoserver` listener.
+
+    Parameters
+    ----------
+    port : `int`, default ``2003``
+        XMLRPC port of the listener.
+    host : `str`, default ``"127.0.0.1"``
+        Interface the listener is bound to.  Paths are passed to the server
+        as-is, so the listener must share this machine's filesystem.
+    """
+
+    def __init__(self, port: int = 2003, host: str = _DEFAULT_HOST) -> None:
+        self.port = port
+        self.host = host
+        self._proxy = xmlrpc.client.ServerProxy(
+            f"http://{host}:{port}", allow_none=True
+        )
+
+    def convert(
+        self,
+        *,
+        inpath: Path | None = None,
+        indata: bytes | None = None,
+        outpath: Path | None = None,
+        convert_to: str = "pdf",
+    ) -> bytes | None:
+        """Convert a document and return the result bytes, if any.
+
+        Exactly one of *inpath* and *indata* must be given.  When *outpath*
+        is set the listener writes the result there and ``None`` is
+        returned; otherwise the converted document comes back as bytes.
+
+        Raises
+        ------
+        ValueError
+            If both or neither of *inpath* and *indata* are given.
+        OfficeProtocolError
+            If the listener rejects the call signature (e.g. an old
+            unoserver release).
+        RuntimeError
+            If LibreOffice fails to convert the document.
+        ConnectionError
+            If the listener cannot be reached.
+        """
+        params = _convert_params(inpath, indata, outpath, convert_to)
+        try:
+            result = self._proxy.convert(*params)
+        except xmlrpc.client.Fault as ex:
+            raise _fault_error(ex) from ex
+        except xmlrpc.client.ProtocolError as ex:
+            raise _http_error(self.port, ex.errcode, ex.errmsg) from ex
+        return _unwrap(result)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection."""
+        self._proxy("close")()
+
+
+class AsyncUnoserverClient:
+    """Awaitable counterpart of :class:`UnoserverClient`.
+
+    Each call opens its own connection, so one client can serve several
+    concurrent conversions.  Cancelling a call closes the connection; the
+    listener still finishes the document it was given.
+
+    Parameters
+    ----------
+    port : `int`, default ``2003``
+        XMLRPC port of the listener.
+    host : `str`, default ``"127.0.0.1"``
+        Interface the listener is bound to.
+    """
+
+    def __init__(self, port: int = 2003, host: str = _DEFAULT_HOST) -> None:
+        self.port = port
+        self.host = host
+
+    async def convert(
+        self,
+        *,
+        inpath: Path | None = None,
+        indata: bytes | None = None,
+        outpath: Path | None = None,
+        convert_to: str = "pdf",
+    ) -> bytes | None:
+        """Convert a document; see :meth:`UnoserverClient.convert`."""
+        params = _convert_params(inpath, indata, outpath, convert_to)
+        body = xmlrpc.client.dumps(params, "convert", allow_none=True)
+        status, reason, payload = await self._post(body.encode())
+        if status != 200:
+            raise _http_error(self.port, status, reason)
+        try:
+            (result,), _ = xmlrpc.client.loads(payload)
+        except xmlrpc.client.Fault as ex:
+            raise _fault_error(ex) from ex
+        return _unwrap(result)
+
+    async def _post(self, body: bytes) -> tuple[int, str, bytes]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(
+                b"POST /RPC2 HTTP/1.0\r\n"
+                + f"Host: {self.host}:{self.port}\r\n".encode()
+                + b"Content-Type: text/xml\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+            head, _, payload = (await reader.read()).partition(b"\r\n\r\n")
+        finally:
+            writer.close()
+        status_line = head.split(b"\r\n", 1)[0].decode("latin-1")
+        version, _, rest = status_line.partition(" ")
+        status, _, reason = rest.partition(" ")
+        if not version.startswith("HTTP/") or not status.isdigit():
+            raise ConnectionError(
+                f"unoserver on port {self.port} sent no HTTP response."
+            )
+        return int(status), reason, payload
+
+
+def get_client(port: int, host: str = _DEFAULT_HOST) -> UnoserverClient:
+    """Return this thread's cached client for *host*:*port*."""
+    clients: dict[tuple[str, int], UnoserverClient] = (
+        _local.__dict__.setdefault("clients", {})
+    )
+    key = (host, port)
+    if key not in clients:
+        clients[key] = UnoserverClient(port=port, host=host)
+    return clients[key]
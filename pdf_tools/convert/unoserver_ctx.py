@@ -1,8 +1,22 @@
-"""Context manager that starts a transient :mod:`unoserver` listener.
+"""Context managers that start transient :mod:`unoserver` listeners.
 
 The listener exposes an XMLRPC server for :mod:`unoconvert` and manages a
 LibreOffice UNO socket behind it. By default the XMLRPC server listens on
 127.0.0.1:2003 and LibreOffice listens on 127.0.0.1:2002.
+
+A single ``soffice`` process converts one document at a time, so
+:func:`unoserver_pool` can launch several listeners on distinct port pairs
+and hand their XMLRPC ports to the batch helpers in
+:mod:`pdf_tools.convert.service`.
+
+Health checks
+-------------
+:func:`assert_office_ready` remembers a successful probe for
+``_READY_TTL_S`` seconds, so a batch does not re-run ``shutil.which`` and a
+TCP connect for every file.  Listeners started by this module are tracked
+per XMLRPC port; when a conversion fails, :func:`recover_office` restarts a
+listener whose process has died so the caller can retry the document.
+Start-up probes poll with exponential backoff.
 """
 
 from __future__ import annotations
@@ -11,13 +25,20 @@ import contextlib
 import shutil
 import socket
 import subprocess
+import threading
 import time
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 
 import typer
 
-__all__ = ["assert_office_ready", "unoserver_listener"]
+__all__ = [
+    "assert_office_ready",
+    "pool_ports",
+    "recover_office",
+    "unoserver_listener",
+    "unoserver_pool",
+]
 
 _UNOSERVER_CMD = shutil.which(
     "unoserver"
@@ -25,29 +46,177 @@ _UNOSERVER_CMD = shutil.which(
 _DEFAULT_XMLRPC_PORT = 2003
 _DEFAULT_UNO_PORT = 2002
 _STARTUP_TIMEOUT_S = 15
+_POOL_PORT_STEP = 2
+_READY_TTL_S = 30.0
+_BACKOFF_INITIAL_S = 0.05
+_BACKOFF_MAX_S = 1.0
+
+_ready_since: dict[int, float] = {}
+_listeners: dict[int, _ManagedListener] = {}
+
+
+def _port_is_open(port: int) -> bool:
+    with socket.socket() as sock:
+        return sock.connect_ex(("127.0.0.1", port)) == 0  # 0 => success
 
 
-def _wait_until_port_listens(port: int, timeout: int) -> None:
+def _wait_until_port_listens(port: int, timeout: float) -> None:
     deadline = time.time() + timeout
+    delay = _BACKOFF_INITIAL_S
     while time.time() < deadline:
-        with socket.socket() as sock:
-            if sock.connect_ex(("127.0.0.1", port)) == 0:  # 0 => success
-                return
-        time.sleep(0.25)
+        if _port_is_open(port):
+            return
+        time.sleep(min(delay, max(deadline - time.time(), 0)))
+        delay = min(delay * 2, _BACKOFF_MAX_S)
     raise TimeoutError(
         f"unoserver did not open port {port} within {timeout}s."
     )
 
 
+def _unoserver_cmd(
+    *,
+    uno_port: int,
+    xmlrpc_port: int,
+    soffice_path: Path | None,
+) -> list[str]:
+    if _UNOSERVER_CMD is None:
+        raise FileNotFoundError(
+            "The 'unoserver' executable was not found on $PATH. "
+            "Install it with:  pip install unoserver"
+        )
+    if xmlrpc_port == uno_port:
+        raise ValueError("xmlrpc_port and uno_port must be different.")
+
+    cmd = [
+        _UNOSERVER_CMD,
+        "--interface",
+        "127.0.0.1",
+        "--port",
+        str(xmlrpc_port),
+        "--uno-port",
+        str(uno_port),
+    ]
+    if soffice_path is not None:
+        if not soffice_path.exists():
+            raise FileNotFoundError(
+                f"soffice binary not found at {soffice_path}"
+            )
+        cmd.extend(["--soffice", str(soffice_path)])
+    return cmd
+
+
+def _start_unoserver(cmd: Sequence[str]) -> subprocess.Popen[bytes]:
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _stop_unoserver(proc: subprocess.Popen[bytes]) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+class _ManagedListener:
+    """A unoserver process started by this module, restartable on crash."""
+
+    def __init__(self, cmd: Sequence[str], xmlrpc_port: int) -> None:
+        self.cmd = list(cmd)
+        self.xmlrpc_port = xmlrpc_port
+        self.restarts = 0
+        self.proc = _start_unoserver(self.cmd)
+        self._lock = threading.Lock()
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def restart(self) -> None:
+        with self._lock:
+            if self.alive() and _port_is_open(self.xmlrpc_port):
+                return  # another thread already restarted it
+            typer.echo(
+                f"unoserver on port {self.xmlrpc_port} died; restarting..."
+            )
+            _stop_unoserver(self.proc)
+            self.proc = _start_unoserver(self.cmd)
+            self.restarts += 1
+            _wait_until_port_listens(self.xmlrpc_port, _STARTUP_TIMEOUT_S)
+
+    def stop(self) -> None:
+        _stop_unoserver(self.proc)
+
+
+@contextlib.contextmanager
+def _managed(listeners: Sequence[_ManagedListener]) -> Iterator[None]:
+    for listener in listeners:
+        _listeners[listener.xmlrpc_port] = listener
+    try:
+        yield
+    finally:
+        for listener in listeners:
+            _listeners.pop(listener.xmlrpc_port, None)
+            _ready_since.pop(listener.xmlrpc_port, None)
+            listener.stop()
+
+
+def recover_office(xmlrpc_port: int = _DEFAULT_XMLRPC_PORT) -> bool:
+    """Bring a crashed listener back after a failed conversion.
+
+    Listeners started by :func:`unoserver_listener` or
+    :func:`unoserver_pool` are restarted if their process has exited or
+    their port no longer accepts connections.  For external listeners
+    (e.g. a daemon whose supervisor restarts it) the port is polled with
+    backoff until it reopens.
+
+    Returns
+    -------
+    bool
+        `True` if the listener was down and is reachable again, meaning the
+        failed document is worth retrying; `False` if the listener looked
+        healthy (the document itself is the problem) or stayed down.
+    """
+    _ready_since.pop(xmlrpc_port, None)
+    listener = _listeners.get(xmlrpc_port)
+    if listener is None:
+        if _port_is_open(xmlrpc_port):
+            return False
+        try:
+            _wait_until_port_listens(xmlrpc_port, _STARTUP_TIMEOUT_S)
+        except TimeoutError:
+            return False
+        return True
+    if listener.alive() and _port_is_open(xmlrpc_port):
+        return False
+    try:
+        listener.restart()
+    except TimeoutError:
+        return False
+    return True
+
+
 def assert_office_ready(
     xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
     *,
     port: int | None = None,
+    require_unoconvert: bool = True,
 ) -> None:
-    """Fail fast with guidance if LibreOffice/`unoserver` is not usable."""
+    """Fail fast with guidance if LibreOffice/`unoserver` is not usable.
+
+    Pass ``require_unoconvert=False`` when conversions go through the
+    XMLRPC client and only the listener itself is needed.  A successful
+    check is cached per port for a short time; a managed listener found
+    dead is restarted before waiting for its port.
+    """
     if port is not None:
         xmlrpc_port = port
-    if shutil.which("unoconvert") is None:
+    checked_at = _ready_since.get(xmlrpc_port)
+    if checked_at is not None and time.monotonic() - checked_at < _READY_TTL_S:
+        return
+    if require_unoconvert and shutil.which("unoconvert") is None:
         raise RuntimeError(
             "LibreOffice’s `unoconvert` CLI is not on PATH.\n"
             "Install LibreOffice, then either:\n"
@@ -55,8 +224,11 @@ def assert_office_ready(
             "  • `pipx install unoserver --system-site-packages`   (system)\n"
             "  • or run conversions with the bundled LibreOffice python.\n"
         )
+    listener = _listeners.get(xmlrpc_port)
     try:
-        _wait_until_port_listens(xmlrpc_port, 15)
+        if listener is not None and not listener.alive():
+            listener.restart()
+        _wait_until_port_listens(xmlrpc_port, _STARTUP_TIMEOUT_S)
     except TimeoutError as te:
         raise RuntimeError(
             "No unoserver XMLRPC listener detected "
@@ -64,6 +236,7 @@ def assert_office_ready(
             "Start one with:  unoserver --interface 127.0.0.1 "
             "--port 2003 --uno-port 2002 &\n"
         ) from te
+    _ready_since[xmlrpc_port] = time.monotonic()
 
 
 @contextlib.contextmanager
@@ -98,44 +271,104 @@ def unoserver_listener(
     """
     if port is not None:
         uno_port = port
-    if _UNOSERVER_CMD is None:
-        raise FileNotFoundError(
-            "The 'unoserver' executable was not found on $PATH. "
-            "Install it with:  pip install unoserver"
-        )
-
-    if xmlrpc_port == uno_port:
-        raise ValueError("xmlrpc_port and uno_port must be different.")
-
-    cmd = [
-        _UNOSERVER_CMD,
-        "--interface",
-        "127.0.0.1",
-        "--port",
-        str(xmlrpc_port),
-        "--uno-port",
-        str(uno_port),
-    ]
-    if soffice_path is not None:
-        if not soffice_path.exists():
-            raise FileNotFoundError(
-                f"soffice binary not found at {soffice_path}"
-            )
-        cmd.extend(["--soffice", str(soffice_path)])
+    cmd = _unoserver_cmd(
+        uno_port=uno_port, xmlrpc_port=xmlrpc_port, soffice_path=soffice_path
+    )
 
     typer.echo("Starting unoserver...")
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
+    listener = _ManagedListener(cmd, xmlrpc_port)
 
-    try:
+    with _managed([listener]):
         _wait_until_port_listens(xmlrpc_port, _STARTUP_TIMEOUT_S)
         yield  # ---- caller executes batch work here ----
-    finally:
-        proc.terminate()
-        try:
-            proc.wait(timeout=10)
-        except subprocess.TimeoutExpired:
-            proc.kill()
+
+
+def pool_ports(
+    workers: int,
+    *,
+    uno_port: int = _DEFAULT_UNO_PORT,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+) -> list[tuple[int, int]]:
+    """Return the ``(uno_port, xmlrpc_port)`` pair for each pool worker.
+
+    Worker *i* binds ``uno_port + 2 * i`` and ``xmlrpc_port + 2 * i`` so the
+    default base ports yield 2002/2003, 2004/2005, 2006/2007, ...
+
+    Raises
+    ------
+    ValueError
+        If *workers* is not positive or two workers would share a port.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    pairs = [
+        (uno_port + _POOL_PORT_STEP * i, xmlrpc_port + _POOL_PORT_STEP * i)
+        for i in range(workers)
+    ]
+    ports = [port for pair in pairs for port in pair]
+    if len(set(ports)) != len(ports):
+        raise ValueError(
+            f"Ports for {workers} worker(s) overlap; choose uno_port and "
+            "xmlrpc_port so that they differ by an odd number."
+        )
+    return pairs
+
+
+@contextlib.contextmanager
+def unoserver_pool(
+    workers: int = 1,
+    *,
+    uno_port: int = _DEFAULT_UNO_PORT,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+    soffice_path: Path | None = None,
+) -> Iterator[list[int]]:
+    """Launch *workers* unoserver/soffice pairs for parallel conversions.
+
+    Every worker gets its own port pair (see :func:`pool_ports`) and, because
+    :mod:`unoserver` creates a temporary LibreOffice profile per process,
+    its own user installation.  All listeners start concurrently and the
+    context waits until every XMLRPC port accepts connections.
+
+    Parameters
+    ----------
+    workers
+        Number of listeners to start (default 1).
+    uno_port
+        UNO port of the first worker (default 2002).
+    xmlrpc_port
+        XMLRPC port of the first worker (default 2003).
+    soffice_path
+        Custom path to the LibreOffice ``soffice`` binary.
+
+    Yields
+    ------
+    list[int]
+        XMLRPC ports of the running listeners, in worker order.  Pass them
+        to :func:`pdf_tools.convert.service.convert_files_to_pdfs` as
+        ``xmlrpc_ports``.
+
+    Raises
+    ------
+    FileNotFoundError
+        If :mod:`unoserver` (or `soffice` when explicitly provided) is not
+        found.
+    TimeoutError
+        If a listener does not start within the allotted timeout.
+    """
+    pairs = pool_ports(workers, uno_port=uno_port, xmlrpc_port=xmlrpc_port)
+    cmds = [
+        _unoserver_cmd(
+            uno_port=uno, xmlrpc_port=xmlrpc, soffice_path=soffice_path
+        )
+        for uno, xmlrpc in pairs
+    ]
+
+    typer.echo(f"Starting {workers} unoserver worker(s)...")
+    listeners: list[_ManagedListener] = []
+    with _managed(listeners):
+        for cmd, (_, xmlrpc) in zip(cmds, pairs, strict=True):
+            listeners.append(_ManagedListener(cmd, xmlrpc))
+            _listeners[xmlrpc] = listeners[-1]
+        for _, xmlrpc in pairs:
+            _wait_until_port_listens(xmlrpc, _STARTUP_TIMEOUT_S)
+        yield [xmlrpc for _, xmlrpc in pairs]
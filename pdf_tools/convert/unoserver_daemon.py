@@ -0,0 +1,424 @@
+"""Persistent :mod:`unoserver` daemon shared across CLI invocations.
+
+:func:`pdf_tools.convert.unoserver_ctx.unoserver_listener` cold-starts
+LibreOffice for every command and terminates it afterwards.  The helpers in
+this module keep a warm listener alive between invocations instead:
+
+* :func:`start_daemon` spawns a detached supervisor
+  (``python -m pdf_tools.convert.unoserver_daemon``) that runs ``unoserver``
+  and records itself in a PID file.  A lock file serialises concurrent
+  starts, so racing cron jobs end up sharing one daemon.
+* :func:`office_daemon` attaches to a running daemon (starting one if
+  needed) and holds a *lease* while the caller converts documents.
+* The supervisor restarts ``unoserver`` if it crashes, and stops it and
+  exits once no lease is held and nothing has used it for ``idle_timeout``
+  seconds.
+
+State lives in ``$PDF_TOOLS_STATE_DIR`` (default: ``pdf-tools-<user>`` in the
+system temp directory).  Daemon mode relies on POSIX signals and file locks
+and is not available on Windows, although the module itself imports there.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import getpass
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from types import FrameType
+
+import typer
+from pydantic import BaseModel, ValidationError
+
+from pdf_tools.convert.unoserver_ctx import (
+    _DEFAULT_UNO_PORT,
+    _DEFAULT_XMLRPC_PORT,
+    _STARTUP_TIMEOUT_S,
+    _port_is_open,
+    _start_unoserver,
+    _stop_unoserver,
+    _unoserver_cmd,
+    _wait_until_port_listens,
+    pool_ports,
+    unoserver_pool,
+)
+
+__all__ = [
+    "DaemonInfo",
+    "daemon_status",
+    "office_context",
+    "office_daemon",
+    "start_daemon",
+    "stop_daemon",
+]
+
+_DEFAULT_IDLE_TIMEOUT_S = 600.0
+_POLL_INTERVAL_S = 1.0
+_STATE_DIR_ENV = "PDF_TOOLS_STATE_DIR"
+
+
+class DaemonInfo(BaseModel):
+    """Contents of a daemon's PID file."""
+
+    pid: int
+    uno_port: int
+    xmlrpc_port: int
+    idle_timeout: float
+
+
+def _state_dir() -> Path:
+    base = os.environ.get(_STATE_DIR_ENV)
+    path = (
+        Path(base)
+        if base
+        else Path(tempfile.gettempdir()) / f"pdf-tools-{getpass.getuser()}"
+    )
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _pid_file(xmlrpc_port: int) -> Path:
+    return _state_dir() / f"unoserver-{xmlrpc_port}.pid"
+
+
+def _lock_file(xmlrpc_port: int) -> Path:
+    return _state_dir() / f"unoserver-{xmlrpc_port}.lock"
+
+
+def _activity_file(xmlrpc_port: int) -> Path:
+    return _state_dir() / f"unoserver-{xmlrpc_port}.last-used"
+
+
+def _lease_dir(xmlrpc_port: int) -> Path:
+    path = _state_dir() / f"unoserver-{xmlrpc_port}.leases"
+    path.mkdir(exist_ok=True)
+    return path
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _has_live_leases(xmlrpc_port: int) -> bool:
+    """Return True if a live process holds a lease; drop stale ones."""
+    live = False
+    for lease in _lease_dir(xmlrpc_port).iterdir():
+        pid = int(lease.name.split("-", 1)[0])
+        if _pid_alive(pid):
+            live = True
+        else:
+            lease.unlink(missing_ok=True)
+    return live
+
+
+def _idle(activity: Path, idle_timeout: float) -> bool:
+    return time.time() - activity.stat().st_mtime > idle_timeout
+
+
+@contextlib.contextmanager
+def _start_lock(xmlrpc_port: int) -> Iterator[None]:
+    """Serialise daemon starts and the supervisor's decision to exit."""
+    # Imported here so the CLI, which imports this module for
+    # office_context, still loads on Windows.
+    import fcntl
+
+    with open(_lock_file(xmlrpc_port), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _lease(xmlrpc_port: int) -> Iterator[None]:
+    lease = _lease_dir(xmlrpc_port) / f"{os.getpid()}-{uuid.uuid4().hex}"
+    lease.touch()
+    try:
+        yield
+    finally:
+        lease.unlink(missing_ok=True)
+        _activity_file(xmlrpc_port).touch()
+
+
+def _live_supervisor(xmlrpc_port: int) -> DaemonInfo | None:
+    """Return the supervisor recorded for *xmlrpc_port* if it is alive.
+
+    Its listener may be down while it restarts a crashed ``unoserver``.  A
+    PID file whose supervisor has died is removed.
+    """
+    pid_file = _pid_file(xmlrpc_port)
+    try:
+        info = DaemonInfo.model_validate_json(pid_file.read_text())
+    except (FileNotFoundError, ValidationError):
+        return None
+    if not _pid_alive(info.pid):
+        pid_file.unlink(missing_ok=True)
+        return None
+    return info
+
+
+def daemon_status(
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+) -> DaemonInfo | None:
+    """Return the running daemon on *xmlrpc_port*, or `None`.
+
+    A daemon that is restarting ``unoserver`` is not reported until its
+    port listens again.  A PID file whose supervisor has died is removed
+    as a side effect.
+    """
+    info = _live_supervisor(xmlrpc_port)
+    if info is None or not _port_is_open(xmlrpc_port):
+        return None
+    return info
+
+
+def _wait_for_daemon(
+    proc: subprocess.Popen[bytes], xmlrpc_port: int, timeout: float
+) -> DaemonInfo:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        info = daemon_status(xmlrpc_port)
+        if info is not None:
+            return info
+        if proc.poll() is not None:
+            raise RuntimeError(
+                f"unoserver daemon on port {xmlrpc_port} exited with code "
+                f"{proc.returncode} during start-up."
+            )
+        time.sleep(0.25)
+    raise TimeoutError(
+        f"unoserver daemon did not open port {xmlrpc_port} within {timeout}s."
+    )
+
+
+def start_daemon(
+    *,
+    uno_port: int = _DEFAULT_UNO_PORT,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+    idle_timeout: float = _DEFAULT_IDLE_TIMEOUT_S,
+    soffice_path: Path | None = None,
+) -> DaemonInfo:
+    """Return the daemon on *xmlrpc_port*, starting it if necessary.
+
+    Parameters
+    ----------
+    uno_port
+        TCP port LibreOffice binds to (default 2002).
+    xmlrpc_port
+        TCP port the unoserver XMLRPC server binds to (default 2003).  It
+        also identifies the daemon's PID and lock files.
+    idle_timeout
+        Seconds without a lease or use after which the daemon shuts down.
+    soffice_path
+        Custom path to the LibreOffice ``soffice`` binary.
+
+    Raises
+    ------
+    FileNotFoundError
+        If :mod:`unoserver` (or `soffice` when explicitly provided) is not
+        found.
+    TimeoutError
+        If the daemon does not start within the allotted timeout.
+    """
+    # Validate the command here so configuration errors surface in the
+    # caller rather than in the detached supervisor.
+    _unoserver_cmd(
+        uno_port=uno_port, xmlrpc_port=xmlrpc_port, soffice_path=soffice_path
+    )
+    with _start_lock(xmlrpc_port):
+        info = _live_supervisor(xmlrpc_port)
+        if info is not None:
+            # A closed port means the supervisor is restarting unoserver;
+            # a second supervisor would fight it for the same ports.
+            if not _port_is_open(xmlrpc_port):
+                _wait_until_port_listens(xmlrpc_port, _STARTUP_TIMEOUT_S)
+            # Count this as use, so the daemon cannot reach its idle
+            # timeout before the caller takes a lease.
+            _activity_file(xmlrpc_port).touch()
+            return info
+        typer.echo(f"Starting unoserver daemon on port {xmlrpc_port}...")
+        cmd = [
+            sys.executable,
+            "-m",
+            "pdf_tools.convert.unoserver_daemon",
+            "--uno-port",
+            str(uno_port),
+            "--xmlrpc-port",
+            str(xmlrpc_port),
+            "--idle-timeout",
+            str(idle_timeout),
+        ]
+        if soffice_path is not None:
+            cmd.extend(["--soffice", str(soffice_path)])
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        return _wait_for_daemon(proc, xmlrpc_port, _STARTUP_TIMEOUT_S + 5)
+
+
+def stop_daemon(xmlrpc_port: int = _DEFAULT_XMLRPC_PORT) -> bool:
+    """Ask the daemon on *xmlrpc_port* to shut down.
+
+    Returns
+    -------
+    bool
+        `True` if a running daemon was signalled.
+    """
+    info = _live_supervisor(xmlrpc_port)
+    if info is None:
+        return False
+    os.kill(info.pid, signal.SIGTERM)
+    return True
+
+
+@contextlib.contextmanager
+def office_daemon(
+    workers: int = 1,
+    *,
+    uno_port: int = _DEFAULT_UNO_PORT,
+    xmlrpc_port: int = _DEFAULT_XMLRPC_PORT,
+    idle_timeout: float = _DEFAULT_IDLE_TIMEOUT_S,
+    soffice_path: Path | None = None,
+) -> Iterator[list[int]]:
+    """Attach to (or start) persistent listeners for the duration of a batch.
+
+    Drop-in alternative to
+    :func:`pdf_tools.convert.unoserver_ctx.unoserver_pool`: one daemon is
+    ensured per port pair from
+    :func:`pdf_tools.convert.unoserver_ctx.pool_ports`, and the listeners
+    are left running on exit so later invocations skip LibreOffice start-up.
+
+    Yields
+    ------
+    list[int]
+        XMLRPC ports of the attached daemons.
+    """
+    pairs = pool_ports(workers, uno_port=uno_port, xmlrpc_port=xmlrpc_port)
+    with contextlib.ExitStack() as stack:
+        for uno, xmlrpc in pairs:
+            start_daemon(
+                uno_port=uno,
+                xmlrpc_port=xmlrpc,
+                idle_timeout=idle_timeout,
+                soffice_path=soffice_path,
+            )
+            stack.enter_context(_lease(xmlrpc))
+        yield [xmlrpc for _, xmlrpc in pairs]
+
+
+def office_context(
+    needed: bool,
+    workers: int = 1,
+    daemon: bool = False,
+) -> contextlib.AbstractContextManager[list[int] | None]:
+    """Pick the listener context for a CLI command.
+
+    Returns a no-op context when *needed* is false, :func:`office_daemon`
+    when *daemon* is set, and a transient
+    :func:`pdf_tools.convert.unoserver_ctx.unoserver_pool` otherwise.
+    """
+    if not needed:
+        return contextlib.nullcontext(None)
+    if daemon:
+        return office_daemon(workers)
+    return unoserver_pool(workers)
+
+
+def _supervise(
+    *,
+    uno_port: int,
+    xmlrpc_port: int,
+    idle_timeout: float,
+    soffice_path: Path | None,
+) -> None:
+    """Run unoserver until signalled or idle, restarting it on crash."""
+    stop = threading.Event()
+
+    def _on_signal(_signum: int, _frame: FrameType | None) -> None:
+        stop.set()
+
+    signal.signal(signal.SIGTERM, _on_signal)
+    signal.signal(signal.SIGINT, _on_signal)
+    cmd = _unoserver_cmd(
+        uno_port=uno_port,
+        xmlrpc_port=xmlrpc_port,
+        soffice_path=soffice_path,
+    )
+    proc = _start_unoserver(cmd)
+    pid_file = _pid_file(xmlrpc_port)
+    activity = _activity_file(xmlrpc_port)
+    # Once the supervisor decides to exit it holds the start lock until
+    # unoserver is stopped, so start_daemon never returns a dying daemon.
+    exiting = contextlib.ExitStack()
+    try:
+        _wait_until_port_listens(xmlrpc_port, _STARTUP_TIMEOUT_S)
+        activity.touch()
+        info = DaemonInfo(
+            pid=os.getpid(),
+            uno_port=uno_port,
+            xmlrpc_port=xmlrpc_port,
+            idle_timeout=idle_timeout,
+        )
+        pid_file.write_text(info.model_dump_json())
+        while not stop.wait(_POLL_INTERVAL_S):
+            if proc.poll() is not None:
+                proc = _start_unoserver(cmd)
+                _wait_until_port_listens(xmlrpc_port, _STARTUP_TIMEOUT_S)
+                continue
+            if _has_live_leases(xmlrpc_port):
+                activity.touch()
+            elif _idle(activity, idle_timeout):
+                exiting.enter_context(_start_lock(xmlrpc_port))
+                if not _has_live_leases(xmlrpc_port) and _idle(
+                    activity, idle_timeout
+                ):
+                    break
+                exiting.close()
+    finally:
+        with exiting:
+            pid_file.unlink(missing_ok=True)
+            _stop_unoserver(proc)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entry point of the detached supervisor process."""
+    parser = argparse.ArgumentParser("pdf_tools.convert.unoserver_daemon")
+    parser.add_argument("--uno-port", type=int, default=_DEFAULT_UNO_PORT)
+    parser.add_argument(
+        "--xmlrpc-port", type=int, default=_DEFAULT_XMLRPC_PORT
+    )
+    parser.add_argument(
+        "--idle-timeout", type=float, default=_DEFAULT_IDLE_TIMEOUT_S
+    )
+    parser.add_argument("--soffice", type=Path, default=None)
+    args = parser.parse_args(argv)
+    _supervise(
+        uno_port=args.uno_port,
+        xmlrpc_port=args.xmlrpc_port,
+        idle_timeout=args.idle_timeout,
+        soffice_path=args.soffice,
+    )
+
+
+if __name__ == "__main__":
+    main()
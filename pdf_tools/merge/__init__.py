@@ -1,3 +1,15 @@
-from .service import merge_pdfs
+from .service import (
+    MergeBackend,
+    MergeProfile,
+    merge_pdfs,
+    merge_pdfs_to_bytes,
+    merge_pdfs_to_stream,
+)
 
-__all__ = ["merge_pdfs"]
+__all__ = [
+    "MergeBackend",
+    "MergeProfile",
+    "merge_pdfs",
+    "merge_pdfs_to_bytes",
+    "merge_pdfs_to_stream",
+]
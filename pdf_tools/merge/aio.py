@@ -0,0 +1,99 @@
+"""Awaitable variants of :mod:`pdf_tools.merge.service`."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+
+from pdf_tools.merge.service import (
+    MergeBackend,
+    MergeProfile,
+    _iter_merge_inputs,
+)
+from pdf_tools.merge.service import merge_pdfs as _merge_pdfs
+from pdf_tools.merge.service import (
+    merge_pdfs_to_bytes as _merge_pdfs_to_bytes,
+)
+from pdf_tools.models.files import File, FilesInput, MergeInput
+
+__all__ = ["merge_pdfs", "merge_pdfs_to_bytes"]
+
+
+async def merge_pdfs(
+    files: FilesInput | Iterable[MergeInput],
+    output_path: str | Path,
+    set_bookmarks: bool = False,
+    overwrite: bool = False,
+    executor: Executor | None = None,
+    backend: MergeBackend = "pypdf",
+    workers: int = 1,
+    dedupe: bool = False,
+    profile: MergeProfile = "fast",
+    append: bool = False,
+) -> File:
+    """Merge PDFs into one document on *executor*.
+
+    Merging is CPU-bound :mod:`pypdf` (or PyMuPDF) work, so it runs on
+    *executor* (the loop's default thread pool when `None`).  Pass a bounded
+    :class:`concurrent.futures.ProcessPoolExecutor` to cap how many merges
+    run at once and keep them off the interpreter running the loop; the
+    inputs are collected into a list first so they can be sent to it.
+
+    The merge cannot be interrupted once it has started.  Cancelling the
+    awaiting task returns at once and drops a merge still queued on
+    *executor*, but one that is already running finishes and still writes
+    *output_path*.
+
+    See :func:`pdf_tools.merge.service.merge_pdfs` for the parameters and
+    errors.
+    """
+    inputs = list(_iter_merge_inputs(files))
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        partial(
+            _merge_pdfs,
+            inputs,
+            output_path,
+            set_bookmarks,
+            overwrite,
+            backend=backend,
+            workers=workers,
+            dedupe=dedupe,
+            profile=profile,
+            append=append,
+        ),
+    )
+
+
+async def merge_pdfs_to_bytes(
+    files: FilesInput | Iterable[MergeInput],
+    set_bookmarks: bool = False,
+    executor: Executor | None = None,
+    backend: MergeBackend = "pypdf",
+    workers: int = 1,
+    dedupe: bool = False,
+    profile: MergeProfile = "fast",
+) -> bytes:
+    """Merge PDFs into one document on *executor* and return its bytes.
+
+    See :func:`merge_pdfs` for *executor* and
+    :func:`pdf_tools.merge.service.merge_pdfs_to_bytes` for the rest.
+    """
+    inputs = list(_iter_merge_inputs(files))
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        partial(
+            _merge_pdfs_to_bytes,
+            inputs,
+            set_bookmarks,
+            backend=backend,
+            workers=workers,
+            dedupe=dedupe,
+            profile=profile,
+        ),
+    )
@@ -8,6 +8,8 @@ This module registers two subcommands under the *merge* namespace:
 
 Each command is deliberately lightweight; it validates inputs and then
 delegates all heavy lifting to :func:`pdf_tools.merge.service.merge_pdfs`.
+An output path of ``-`` writes the merged PDF to stdout instead, through
+:func:`pdf_tools.merge.service.merge_pdfs_to_stream`.
 """
 
 from collections.abc import Sequence
@@ -18,11 +20,16 @@ import typer
 from pydantic import ValidationError
 
 from pdf_tools.cli import AsyncTyper
-from pdf_tools.merge.service import merge_pdfs
+from pdf_tools.merge.service import merge_pdfs, merge_pdfs_to_stream
 from pdf_tools.models.files import File, Files
+from pdf_tools.typings import MergeBackendName, MergeProfileName
+from pdf_tools.walk import walk_files
 
 cli = AsyncTyper(no_args_is_help=True)
 
+STDOUT = Path("-")
+"""Output path that sends the merged PDF to stdout."""
+
 
 @cli.command()
 def pdf_files(
@@ -45,7 +52,7 @@ def pdf_files(
             "--output-path",
             "-o",
             help=(
-                "Destination path for the merged PDF. "
+                "Destination path for the merged PDF, or '-' for stdout. "
                 "Defaults to 'output.pdf' in current directory."
             ),
         ),
@@ -60,6 +67,43 @@ def pdf_files(
         bool,
         typer.Option(help="Overwrite output files if they already exist."),
     ] = False,
+    backend: Annotated[
+        MergeBackendName,
+        typer.Option(
+            help=(
+                "How to merge: pymupdf is faster, stream keeps memory "
+                "bounded by the largest input."
+            )
+        ),
+    ] = MergeBackendName.PYPDF,
+    workers: Annotated[
+        int,
+        typer.Option(min=1, help="Merge groups of inputs in N processes."),
+    ] = 1,
+    dedupe: Annotated[
+        bool,
+        typer.Option(
+            help="Store fonts and images shared by several inputs once."
+        ),
+    ] = False,
+    profile: Annotated[
+        MergeProfileName,
+        typer.Option(
+            help=(
+                "Output size vs. CPU: compact uses object streams and "
+                "deflate, archive also recompresses images and fonts."
+            )
+        ),
+    ] = MergeProfileName.FAST,
+    append: Annotated[
+        bool,
+        typer.Option(
+            help=(
+                "Add the inputs to the end of an existing output as an "
+                "incremental update instead of rebuilding it."
+            )
+        ),
+    ] = False,
 ) -> None:
     """Merge explicit PDF paths or a JSON bundle."""
     if (file_paths is None) == (json_file is None):
@@ -90,7 +134,30 @@ def pdf_files(
         raise ValueError("Either file_paths or json_file must be provided")
     else:
         files = [File.model_validate({"path": p}) for p in file_paths]
-    merge_pdfs(files, output_path, set_bookmarks, overwrite=overwrite_existing)
+    if output_path == STDOUT:
+        if append:
+            raise typer.BadParameter("--append needs an output file.")
+        merge_pdfs_to_stream(
+            files,
+            typer.get_binary_stream("stdout"),
+            set_bookmarks,
+            backend=backend.value,
+            workers=workers,
+            dedupe=dedupe,
+            profile=profile.value,
+        )
+        return
+    merge_pdfs(
+        files,
+        output_path,
+        set_bookmarks,
+        overwrite=overwrite_existing,
+        backend=backend.value,
+        workers=workers,
+        dedupe=dedupe,
+        profile=profile.value,
+        append=append,
+    )
     typer.echo(f"Merged PDFs to {output_path.resolve()}")
 
 
@@ -105,7 +172,7 @@ def pdfs_in_folder(
             "--output-path",
             "-o",
             help=(
-                "Destination path for the merged PDF. "
+                "Destination path for the merged PDF, or '-' for stdout. "
                 "Defaults to 'output.pdf' in current directory."
             ),
         ),
@@ -120,12 +187,81 @@ def pdfs_in_folder(
         bool,
         typer.Option(help="Overwrite output files if they already exist."),
     ] = False,
+    backend: Annotated[
+        MergeBackendName,
+        typer.Option(
+            help=(
+                "How to merge: pymupdf is faster, stream keeps memory "
+                "bounded by the largest input."
+            )
+        ),
+    ] = MergeBackendName.PYPDF,
+    workers: Annotated[
+        int,
+        typer.Option(min=1, help="Merge groups of inputs in N processes."),
+    ] = 1,
+    dedupe: Annotated[
+        bool,
+        typer.Option(
+            help="Store fonts and images shared by several inputs once."
+        ),
+    ] = False,
+    profile: Annotated[
+        MergeProfileName,
+        typer.Option(
+            help=(
+                "Output size vs. CPU: compact uses object streams and "
+                "deflate, archive also recompresses images and fonts."
+            )
+        ),
+    ] = MergeProfileName.FAST,
+    recursive: Annotated[
+        bool,
+        typer.Option(help="Also merge PDFs found in subfolders."),
+    ] = False,
+    include: Annotated[
+        list[str] | None,
+        typer.Option(help="Only use files matching this glob (repeatable)."),
+    ] = None,
+    exclude: Annotated[
+        list[str] | None,
+        typer.Option(help="Skip files and folders matching this glob."),
+    ] = None,
+    max_depth: Annotated[
+        int | None,
+        typer.Option(
+            min=0, help="Subfolder levels to descend with --recursive."
+        ),
+    ] = None,
 ) -> None:
-    """Merge all PDFs found in *input_dir_path*."""
+    """Merge all PDFs found in *input_dir_path*, in name order."""
     if output_path is None:
         output_path = Path().cwd() / "output.pdf"
-    files = [
-        File.model_validate({"path": str(f)}) for f in input_dir_path.iterdir()
-    ]
-    merge_pdfs(files, output_path, set_bookmarks, overwrite=overwrite_existing)
+    files = walk_files(
+        input_dir_path,
+        include=include or (),
+        exclude=exclude or (),
+        max_depth=max_depth if recursive else 0,
+    )
+    if output_path == STDOUT:
+        merge_pdfs_to_stream(
+            files,
+            typer.get_binary_stream("stdout"),
+            set_bookmarks,
+            backend=backend.value,
+            workers=workers,
+            dedupe=dedupe,
+            profile=profile.value,
+        )
+        return
+    merge_pdfs(
+        files,
+        output_path,
+        set_bookmarks,
+        overwrite=overwrite_existing,
+        backend=backend.value,
+        workers=workers,
+        dedupe=dedupe,
+        profile=profile.value,
+    )
     typer.echo(f"Merged PDFs to {output_path.resolve()}")
@@ -0,0 +1,148 @@
+"""Find identical streams in a merged document.
+
+Documents made from the same template embed the same fonts, logos and
+colour profiles.  :func:`duplicate_streams` groups stream objects by a
+SHA-256 of their data and dictionary, so every copy after the first can
+point at the first instead.  References from a dictionary to small objects
+such as colour space arrays are inlined with :func:`inline_references`
+first, because each input has its own copy of those.  A dictionary counts
+as identical once its references to duplicate streams are replaced by
+references to the kept copy, which lets an image and its soft mask both
+collapse.  Non-stream objects are left alone: they are small, and merging
+identical pages would break the page tree.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Callable, Iterable
+
+__all__ = ["duplicate_streams", "inline_references", "renumber_references"]
+
+_REFERENCE = re.compile(rb"(?<![\d.])(\d+) 0 R")
+_PAGE = re.compile(rb"/Type\s*/Pages?(?![A-Za-z])")
+_STRING_START = re.compile(rb"\(|<<|<")
+
+
+def _string_end(source: bytes, start: int) -> int:
+    """Return the index just past the string starting at *start*."""
+    if source[start] == ord("<"):
+        end = source.find(b">", start)
+        return len(source) if end < 0 else end + 1
+    depth, index = 0, start
+    while index < len(source):
+        char = source[index]
+        if char == ord("\\"):
+            index += 1
+        elif char == ord("("):
+            depth += 1
+        elif char == ord(")"):
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return len(source)
+
+
+def _sub_references(
+    replace: Callable[[re.Match[bytes]], bytes], source: bytes
+) -> bytes:
+    """Apply *replace* to the ``N 0 R`` references outside strings.
+
+    Literal ``(...)`` and hex ``<...>`` strings are copied unchanged, so a
+    title such as ``(Exhibit 12 0 R)`` is not mistaken for a reference.
+    """
+    parts: list[bytes] = []
+    position = search = 0
+    while match := _STRING_START.search(source, search):
+        search = match.end()
+        if match[0] == b"<<":
+            continue
+        end = _string_end(source, match.start())
+        parts.append(_REFERENCE.sub(replace, source[position : match.start()]))
+        parts.append(source[match.start() : end])
+        position = search = end
+    parts.append(_REFERENCE.sub(replace, source[position:]))
+    return b"".join(parts)
+
+
+def renumber_references(source: bytes, canonical: dict[int, int]) -> bytes:
+    """Replace ``N 0 R`` references in *source* through *canonical*."""
+
+    def _renumber(match: re.Match[bytes]) -> bytes:
+        number = int(match[1])
+        return b"%d 0 R" % canonical.get(number, number)
+
+    return _sub_references(_renumber, source)
+
+
+def inline_references(
+    source: bytes,
+    resolve: Callable[[int], bytes | None],
+    _seen: frozenset[int] = frozenset(),
+) -> bytes:
+    """Replace ``N 0 R`` references in *source* by the objects they name.
+
+    *resolve* returns the serialised object, or `None` to keep the
+    reference (streams).  Pages and references back to an object already
+    being inlined are kept as well.
+    """
+
+    def _inline(match: re.Match[bytes]) -> bytes:
+        number = int(match[1])
+        target = None if number in _seen else resolve(number)
+        if target is None or _PAGE.search(target):
+            return match[0]
+        return inline_references(target, resolve, _seen | {number})
+
+    return _sub_references(_inline, source)
+
+
+def duplicate_streams(
+    streams: Iterable[tuple[int, bytes, bytes]],
+) -> tuple[dict[int, int], int]:
+    """Map each duplicate stream to the identical stream that is kept.
+
+    Parameters
+    ----------
+    streams : ``Iterable[tuple[int, bytes, bytes]]``
+        ``(object number, serialised dictionary, stream data)`` for every
+        stream object.  The dictionary should leave out ``/Length`` and
+        have its references to other objects than streams inlined.
+
+    Returns
+    -------
+    tuple[dict[int, int], int]
+        Object number of each duplicate mapped to the one that replaces it
+        (the lowest-numbered copy), and the bytes the duplicates'
+        dictionaries and data took up.
+    """
+    dictionaries: dict[int, bytes] = {}
+    digests: dict[int, bytes] = {}
+    sizes: dict[int, int] = {}
+    for number, dictionary, data in streams:
+        dictionaries[number] = dictionary
+        digests[number] = hashlib.sha256(data).digest()
+        sizes[number] = len(dictionary) + len(data)
+
+    canonical: dict[int, int] = {}
+    while True:
+        kept: dict[tuple[bytes, bytes], int] = {}
+        found: dict[int, int] = {}
+        for number in sorted(dictionaries):
+            if number in canonical:
+                continue
+            dictionary = renumber_references(dictionaries[number], canonical)
+            key = (hashlib.sha256(dictionary).digest(), digests[number])
+            first = kept.setdefault(key, number)
+            if first != number:
+                found[number] = first
+        if not found:
+            break
+        canonical.update(found)
+    for number, first in canonical.items():
+        while first in canonical:
+            first = canonical[first]
+        canonical[number] = first
+    return canonical, sum(sizes[number] for number in canonical)
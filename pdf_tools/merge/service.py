@@ -1,16 +1,17 @@
 """
 High-level PDF *merge* operations used by both the CLI and programmatic API.
 
-Only one public helper is exposed—:func:`merge_pdfs`.  It provides a minimal
-yet robust wrapper around :class:`pypdf.PdfWriter` so that downstream layers
-can merge an arbitrary sequence of :class:`pdf_tools.models.files.File`
-objects without fiddling with low-level writer mechanics or conditional
-bookmark logic.
+The public helper is :func:`merge_pdfs`, with :func:`merge_pdfs_to_stream`
+and :func:`merge_pdfs_to_bytes` for callers that send the result on rather
+than keep a file.  They provide a minimal yet robust wrapper around
+:class:`pypdf.PdfWriter` (or, with ``backend="pymupdf"``,
+:meth:`pymupdf.Document.insert_pdf`) so that downstream layers can merge an
+arbitrary sequence of :class:`pdf_tools.models.files.File` objects without
+fiddling with low-level writer mechanics or conditional bookmark logic.
 
-The function deliberately stays synchronous and file-system side-effectful
-(*writes directly to disk*) because the surrounding Typer CLI command is also
-synchronous.  When we need async behaviour we can slap this into a thread
-executor.
+The functions deliberately stay synchronous because the surrounding Typer
+CLI commands are also synchronous.  :mod:`pdf_tools.merge.aio` runs them on
+an executor for callers inside an event loop.
 
 **Design decisions**
 --------------------
@@ -21,39 +22,767 @@ executor.
    :attr:`pdf_tools.models.files.File.bookmark_name` (or fallback to its
    :attr:`pdf_tools.models.files.File.name`) as an outline entry so viewers
    like Acrobat or browser PDF readers render a helpful side panel.
-3. *Pydantic return type* – The function returns a validated
+3. *Three backends* – :mod:`pypdf` is the pure-Python default.  PyMuPDF
+   copies pages in C and is much faster on large or object-heavy inputs;
+   it rebuilds the same outline :mod:`pypdf` would write.  The streaming
+   backend (:mod:`pdf_tools.merge.stream`) writes each input out as it is
+   read, for bundles too large to hold in memory.
+4. *Pydantic return type* – The function returns a validated
    :class:`pdf_tools.models.files.File` describing the newly created output
    path.  This keeps the public API consistent with the rest of the project and
    avoids leaking raw :class:`Path` objects.
 """
 
-from collections.abc import Sequence
+import os
+import re
+import shutil
+import tempfile
+import warnings
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
 from pathlib import Path
+from typing import IO, Any, Literal, TypeAlias, cast
 
+import pymupdf
+import pypdf
 import typer
-from pypdf import PdfWriter
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DictionaryObject,
+    IndirectObject,
+    PdfObject,
+    StreamObject,
+)
 
-from pdf_tools.models.files import File, FilesInput, coerce_files
+from pdf_tools.merge.dedupe import (
+    duplicate_streams,
+    inline_references,
+    renumber_references,
+)
+from pdf_tools.merge.stream import (
+    PdfStreamWriter,
+    StreamedPart,
+    _CountingOutput,
+    _has_raw_stream_data,
+)
+from pdf_tools.models.files import (
+    File,
+    Files,
+    FilesInput,
+    InMemoryPdf,
+    MergeInput,
+    coerce_file,
+    page_indices,
+)
 
 __all__ = [
+    "MergeBackend",
+    "MergeProfile",
     "merge_pdfs",
+    "merge_pdfs_to_bytes",
+    "merge_pdfs_to_stream",
 ]
 
+MergeBackend: TypeAlias = Literal["pypdf", "pymupdf", "stream"]
+MergeProfile: TypeAlias = Literal["fast", "compact", "archive"]
+# (duplicate streams dropped, bytes they took up)
+_Savings: TypeAlias = tuple[int, int]
+# A path to write through a ``.part`` file, or a binary stream to write to.
+_Output: TypeAlias = Path | IO[bytes]
+_LENGTH = re.compile(rb"/Length\s+\d+")
+# PyMuPDF save options for each output profile.  "compact" packs objects
+# into compressed object streams, deflates uncompressed streams and drops
+# unreferenced objects; "archive" also merges identical objects, rewrites
+# each page's content streams as one, and deflates uncompressed images and
+# fonts.  (garbage=4 also compares stream data, but is quadratic in the
+# number of streams.)
+_PROFILES: dict[str, dict[str, Any]] = {
+    "fast": {},
+    "compact": {"garbage": 1, "deflate": True, "use_objstms": True},
+    "archive": {
+        "garbage": 3,
+        "clean": True,
+        "deflate": True,
+        "deflate_images": True,
+        "deflate_fonts": True,
+        "use_objstms": True,
+    },
+}
+
+
+def _iter_merge_inputs(
+    files: FilesInput | Iterable[MergeInput],
+) -> Iterator[File | InMemoryPdf]:
+    if isinstance(files, Files):
+        return iter(files.root)
+    if isinstance(files, (File, InMemoryPdf, str, Path)):
+        raise TypeError("Expected a sequence of files, not a single file.")
+    return (
+        file if isinstance(file, InMemoryPdf) else coerce_file(file)
+        for file in files
+    )
+
+
+def _pdf_inputs(
+    files: FilesInput | Iterable[MergeInput], err: bool = False
+) -> Iterator[File | InMemoryPdf]:
+    for file in _iter_merge_inputs(files):
+        if isinstance(file, File) and file.type.lower() != "pdf":
+            typer.echo(
+                f"Skipping {file.path.resolve()} because it is not a PDF",
+                err=err,
+            )
+            continue
+        yield file
+
+
+def _check_output_path(output_path: Path, overwrite: bool) -> None:
+    if output_path.exists() and overwrite is False:
+        raise FileExistsError(f"File {output_path} already exists. Exiting.")
+    if output_path.parent.exists() is False:
+        raise FileNotFoundError(
+            f"Output directory {output_path.parent} does not exist. "
+            f"Please create it or choose an existing directory."
+        )
+
+
+def _pypdf_streams(
+    writer: PdfWriter,
+) -> Iterator[tuple[int, bytes, bytes]]:
+    def _serialise(obj: PdfObject) -> bytes:
+        output = BytesIO()
+        obj.write_to_stream(output)
+        return output.getvalue()
+
+    def _resolve(number: int) -> bytes | None:
+        if not 0 < number <= len(writer._objects):
+            return None
+        obj = writer._objects[number - 1]
+        if obj is None or isinstance(obj, StreamObject):
+            return None
+        return _serialise(obj)
+
+    for number, obj in enumerate(writer._objects, 1):
+        if isinstance(obj, StreamObject):
+            dictionary = DictionaryObject(
+                (key, value) for key, value in obj.items() if key != "/Length"
+            )
+            yield (
+                number,
+                inline_references(_serialise(dictionary), _resolve),
+                obj._data,
+            )
+
+
+def _replace_references(
+    obj: PdfObject, canonical: dict[int, int], writer: PdfWriter
+) -> None:
+    items: Iterable[tuple[Any, Any]]
+    if isinstance(obj, DictionaryObject):
+        items = list(obj.items())
+    elif isinstance(obj, ArrayObject):
+        items = list(enumerate(obj))
+    else:
+        return
+    for key, value in items:
+        if isinstance(value, IndirectObject):
+            if value.idnum in canonical:
+                obj[key] = IndirectObject(canonical[value.idnum], 0, writer)
+        else:
+            _replace_references(value, canonical, writer)
+
+
+def _can_dedupe_pypdf(writer: PdfWriter) -> bool:
+    """Whether *writer* has the :mod:`pypdf` internals dedupe relies on."""
+    objects = getattr(writer, "_objects", None)
+    return isinstance(objects, list) and _has_raw_stream_data()
+
+
+def _dedupe_pypdf(writer: PdfWriter) -> _Savings:
+    """Point duplicate streams in *writer* at the first copy and drop them.
+
+    :meth:`pypdf.PdfWriter.compress_identical_objects` is not used because
+    it also merges identical pages, which breaks the page tree.  The
+    writer's object table is private, so if this :mod:`pypdf` release lays
+    it out differently a :class:`RuntimeWarning` is issued and nothing is
+    deduplicated.
+    """
+    if not _can_dedupe_pypdf(writer):
+        warnings.warn(
+            f"pypdf {pypdf.__version__} does not expose the objects needed "
+            "to deduplicate streams; merging without deduplication.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return 0, 0
+    canonical, saved = duplicate_streams(_pypdf_streams(writer))
+    if canonical:
+        for obj in writer._objects:
+            if obj is not None:
+                _replace_references(obj, canonical, writer)
+        for number in canonical:
+            writer._objects[number - 1] = None
+    return len(canonical), saved
+
+
+def _merge_with_pypdf(
+    files: Iterable[File | InMemoryPdf],
+    output: _Output,
+    set_bookmarks: bool,
+    overwrite: bool,
+    dedupe: bool = False,
+    profile: MergeProfile = "fast",
+) -> _Savings:
+    merger = PdfWriter()
+    for file in files:
+        _append_pypdf(merger, file, set_bookmarks)
+
+    savings = _dedupe_pypdf(merger) if dedupe else (0, 0)
+    _check_output(output, overwrite)
+    with _output_stream(output, profile) as stream:
+        merger.write(stream)
+
+    merger.close()
+    return savings
+
+
+def _append_pypdf(
+    merger: PdfWriter, file: File | InMemoryPdf, set_bookmarks: bool
+) -> None:
+    """Copy *file*'s selected pages into *merger* and release its reader."""
+    source = _open_pypdf(file)
+    indices = _selected_pages(file, len(source.pages))
+    start = len(merger.pages)
+    if set_bookmarks and isinstance(file, InMemoryPdf) and file.outline:
+        merger.append(source, pages=indices)
+        for title, page in _select_items(file.outline, indices):
+            merger.add_outline_item(title, start + page)
+    elif set_bookmarks:
+        merger.append(
+            source,
+            outline_item=file.bookmark_name or file.name,
+            pages=indices,
+        )
+    else:
+        merger.append(source, pages=indices)
+    _release_reader(merger, source, start)
+
+
+def _can_release_readers(writer: PdfWriter) -> bool:
+    """Whether *writer* has the :mod:`pypdf` internals that pin readers."""
+    return all(
+        hasattr(writer, name)
+        for name in ("_resolve_links", "_unresolved_links", "_merged_in_pages")
+    )
+
+
+def _release_reader(writer: PdfWriter, reader: PdfReader, start: int) -> None:
+    """Drop *writer*'s references to *reader* once its pages are copied.
+
+    :mod:`pypdf` keeps every appended reader (and the input bytes it
+    holds) alive until the writer is written, to resolve links between
+    pages and to recognise objects it has already copied.  Links can only
+    point into their own input, so they are resolved right away instead,
+    and the reader can be freed before the next input is opened.
+
+    This relies on private :mod:`pypdf` state (added in 5.9); on releases
+    without it the reader is left to pypdf, which frees it after writing.
+    """
+    if not _can_release_readers(writer):
+        return
+    writer._resolve_links()
+    writer._unresolved_links.clear()
+    writer._merged_in_pages.clear()
+    writer.reset_translation(reader)
+    for page in writer.pages[start:]:
+        vars(page).pop("original_page", None)
+
+
+def _selected_pages(
+    file: File | InMemoryPdf, page_count: int
+) -> list[int] | None:
+    """Return the indices of *file*'s selected pages, `None` for all."""
+    if file.pages is None:
+        return None
+    try:
+        return page_indices(file.pages, page_count)
+    except ValueError as exc:
+        raise ValueError(f"{file.name}: {exc}") from exc
+
+
+def _select_items(
+    items: Iterable[tuple[str, int]], indices: Sequence[int] | None
+) -> list[tuple[str, int]]:
+    """Renumber ``(title, page index)`` pairs after a page selection."""
+    if indices is None:
+        return list(items)
+    positions = {index: position for position, index in enumerate(indices)}
+    return [
+        (title, positions[page]) for title, page in items if page in positions
+    ]
+
+
+def _select_outline(
+    toc: list[list[Any]], indices: Sequence[int] | None
+) -> list[list[Any]]:
+    """Renumber outline entries after a page selection, as :mod:`pypdf` does.
+
+    Entries on pages that were left out are dropped, unless an entry below
+    them is kept; those stay without a destination (page ``-1``).
+    """
+    if indices is None:
+        return toc
+    positions = {
+        index + 1: position + 1 for position, index in enumerate(indices)
+    }
+    kept: list[list[Any]] = []
+    # Levels whose last entry (so far, walking backwards) has a kept child.
+    below: set[int] = set()
+    for level, title, page, *destination in reversed(toc):
+        if page in positions:
+            kept.append([level, title, positions[page], *destination])
+        elif level in below:
+            kept.append([level, title, -1])
+        else:
+            below = {above for above in below if above < level}
+            continue
+        below = {above for above in below if above < level}
+        below.update(range(1, level))
+    kept.reverse()
+    return kept
+
+
+def _open_pymupdf(
+    file: File | InMemoryPdf,
+) -> tuple[Any, list[list[Any]], list[int] | None]:
+    """Open *file* with only its selected pages, returning its outline too.
+
+    The outline is read before the selection is applied and renumbered
+    with :func:`_select_outline`, so every backend keeps the same entries.
+    """
+    if isinstance(file, InMemoryPdf):
+        doc = pymupdf.open(stream=file.data, filetype="pdf")
+    else:
+        doc = pymupdf.open(file.absolute_path, filetype="pdf")
+    indices = _selected_pages(file, doc.page_count)
+    toc = _select_outline(doc.get_toc(simple=True), indices)
+    if indices is not None:
+        doc.select(indices)
+    return doc, toc, indices
+
+
+def _shift_outline(toc: list[list[Any]], start: int) -> list[list[Any]]:
+    return [
+        [level, title, page + start if page > 0 else page, *destination]
+        for level, title, page, *destination in toc
+    ]
+
+
+def _outline_entries(
+    file: File | InMemoryPdf,
+    source_toc: list[list[Any]],
+    start: int,
+    set_bookmarks: bool,
+    indices: Sequence[int] | None = None,
+) -> list[list[Any]]:
+    """Return *file*'s outline entries the way :mod:`pypdf` would add them.
+
+    Entries are ``[level, title, page, *destination]`` lists with 1-based
+    pages, as in :meth:`pymupdf.Document.get_toc`.  The source's own
+    outline is kept, shifted by *start* pages.  With bookmarks it is nested
+    under one entry for the file, except for an
+    :class:`pdf_tools.models.files.InMemoryPdf` with an ``outline``, whose
+    items on the selected *indices* are added after it instead.
+    """
+    toc = _shift_outline(source_toc, start)
+    if not set_bookmarks:
+        return toc
+    if isinstance(file, InMemoryPdf) and file.outline:
+        return toc + [
+            [1, title, start + page + 1]
+            for title, page in _select_items(file.outline, indices)
+        ]
+    bookmark = file.bookmark_name or file.name
+    return [[1, bookmark, start + 1]] + [
+        [level + 1, *entry] for level, *entry in toc
+    ]
+
+
+def _pymupdf_streams(
+    doc: pymupdf.Document,
+) -> Iterator[tuple[int, bytes, bytes]]:
+    def _resolve(number: int) -> bytes | None:
+        if not 0 < number < doc.xref_length() or doc.xref_is_stream(number):
+            return None
+        target: str = doc.xref_object(number, compressed=True)
+        return target.encode()
+
+    for xref in range(1, doc.xref_length()):
+        if doc.xref_is_stream(xref):
+            dictionary = doc.xref_object(xref, compressed=True).encode()
+            yield (
+                xref,
+                inline_references(_LENGTH.sub(b"", dictionary), _resolve),
+                doc.xref_stream_raw(xref),
+            )
+
+
+def _dedupe_pymupdf(doc: pymupdf.Document) -> _Savings:
+    """Point references to duplicate streams in *doc* at the first copy.
+
+    The duplicates are left unreferenced, so saving with ``garbage=1``
+    drops them.
+    """
+    canonical, saved = duplicate_streams(_pymupdf_streams(doc))
+    if canonical:
+        for xref in range(1, doc.xref_length()):
+            if xref in canonical:
+                continue
+            source = doc.xref_object(xref, compressed=True).encode()
+            renumbered = renumber_references(source, canonical)
+            if renumbered != source:
+                doc.update_object(xref, renumbered.decode())
+    return len(canonical), saved
+
+
+def _merge_with_pymupdf(
+    files: Iterable[File | InMemoryPdf],
+    output: _Output,
+    set_bookmarks: bool,
+    overwrite: bool,
+    dedupe: bool = False,
+    profile: MergeProfile = "fast",
+) -> _Savings:
+    toc: list[list[Any]] = []
+    with pymupdf.open() as merged:
+        for file in files:
+            start = merged.page_count
+            source, source_toc, indices = _open_pymupdf(file)
+            with source:
+                merged.insert_pdf(source)
+            toc += _outline_entries(
+                file, source_toc, start, set_bookmarks, indices
+            )
+        merged.set_toc(toc)
+        savings = _dedupe_pymupdf(merged) if dedupe else (0, 0)
+
+        _check_output(output, overwrite)
+        if merged.page_count == 0:
+            raise ValueError("No PDF pages to merge.")
+        options = dict(_PROFILES[profile])
+        if dedupe:
+            options["garbage"] = max(options.get("garbage", 0), 1)
+        _save_pymupdf(merged, output, options)
+    return savings
+
+
+def _append_with_pymupdf(
+    files: Iterable[File | InMemoryPdf],
+    output_path: Path,
+    set_bookmarks: bool,
+) -> None:
+    """Add *files* to the end of *output_path* as an incremental update.
+
+    The bytes already in *output_path* are left as they are; the new pages,
+    the objects they use, the changed page tree and the outline are written
+    after them with a new cross-reference section.
+    """
+    with pymupdf.open(output_path, filetype="pdf") as merged:
+        if not merged.can_save_incrementally():
+            raise ValueError(
+                f"{output_path} cannot be updated incrementally (it is "
+                "damaged or encrypted); merge it again without append."
+            )
+        toc = merged.get_toc(simple=False)
+        outline_length, page_count = len(toc), merged.page_count
+        for file in files:
+            start = merged.page_count
+            source, source_toc, indices = _open_pymupdf(file)
+            with source:
+                merged.insert_pdf(source)
+            toc += _outline_entries(
+                file, source_toc, start, set_bookmarks, indices
+            )
+        if merged.page_count == page_count:
+            return
+        if len(toc) > outline_length:
+            merged.set_toc(toc)
+        merged.saveIncr()
+
+
+def _open_pypdf(file: File | InMemoryPdf) -> PdfReader:
+    if isinstance(file, InMemoryPdf):
+        return PdfReader(BytesIO(file.data))
+    return PdfReader(file.absolute_path)
+
+
+def _save_to_stream(
+    doc: pymupdf.Document, output: IO[bytes], options: dict[str, Any]
+) -> None:
+    """Save *doc* to a temporary file and copy that into *output*.
+
+    PyMuPDF writes to Python streams through a callback per chunk, which
+    is some twenty times slower than saving to a file.
+    """
+    with tempfile.TemporaryDirectory(prefix=".merge-") as tmp:
+        saved = Path(tmp) / "merged.pdf"
+        doc.save(saved, **options)
+        with open(saved, "rb") as source:
+            shutil.copyfileobj(source, output)
+
+
+def _save_pymupdf(
+    doc: pymupdf.Document, output: _Output, options: dict[str, Any]
+) -> None:
+    """Save *doc* with *options* to a path (via ``.part``) or a stream."""
+    if isinstance(output, Path):
+        with _part_file(output) as tmp:
+            doc.save(tmp, **options)
+    else:
+        _save_to_stream(doc, output, options)
+
+
+def _check_output(output: _Output, overwrite: bool) -> None:
+    if isinstance(output, Path):
+        _check_output_path(output, overwrite)
+
+
+@contextmanager
+def _output_stream(
+    output: _Output, profile: MergeProfile = "fast"
+) -> Iterator[IO[bytes]]:
+    """Yield the binary stream a merge is written to.
+
+    A path is written through :func:`_replace_when_done`.  Other streams
+    are wrapped in a :class:`pdf_tools.merge.stream._CountingOutput`, so
+    writers that ask for their position work on pipes such as stdout.  With
+    a *profile* other than ``"fast"`` the merge goes to a temporary file,
+    which PyMuPDF then saves to *output* with the profile's options.
+    """
+    if profile == "fast":
+        if isinstance(output, Path):
+            with _replace_when_done(output) as stream:
+                yield stream
+        else:
+            yield cast("IO[bytes]", _CountingOutput(output))
+        return
+    directory = output.parent if isinstance(output, Path) else None
+    with tempfile.TemporaryDirectory(prefix=".merge-", dir=directory) as tmp:
+        merged = Path(tmp) / "merged.pdf"
+        with open(merged, "wb") as stream:
+            yield stream
+        with pymupdf.open(merged) as doc:
+            _save_pymupdf(doc, output, _PROFILES[profile])
+
+
+@contextmanager
+def _part_file(output_path: Path) -> Iterator[Path]:
+    """Yield a ``.part`` path that is renamed to *output_path* on success."""
+    tmp = output_path.with_name(f"{output_path.name}.part")
+    try:
+        yield tmp
+        os.replace(tmp, output_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def _replace_when_done(output_path: Path) -> Iterator[IO[bytes]]:
+    """Write to a ``.part`` file renamed to *output_path* on success."""
+    with _part_file(output_path) as tmp, open(tmp, "wb") as output:
+        yield output
+
+
+def _stream_inputs(
+    writer: PdfStreamWriter,
+    files: Iterable[File | InMemoryPdf],
+    set_bookmarks: bool,
+) -> list[list[Any]]:
+    toc: list[list[Any]] = []
+    for file in files:
+        toc += _stream_input(writer, file, set_bookmarks)
+    return toc
+
+
+def _stream_input(
+    writer: PdfStreamWriter, file: File | InMemoryPdf, set_bookmarks: bool
+) -> list[list[Any]]:
+    """Write *file*'s selected pages; its reader is freed on return."""
+    start = writer.page_count
+    source = _open_pypdf(file)
+    indices = _selected_pages(file, len(source.pages))
+    source_toc = _select_outline(writer.append(source, indices), indices)
+    return _outline_entries(file, source_toc, start, set_bookmarks, indices)
+
+
+def _merge_with_stream(
+    files: Iterable[File | InMemoryPdf],
+    output: _Output,
+    set_bookmarks: bool,
+    overwrite: bool,
+    dedupe: bool = False,
+    profile: MergeProfile = "fast",
+) -> _Savings:
+    _check_output(output, overwrite)
+    with _output_stream(output, profile) as stream:
+        writer = PdfStreamWriter(stream, dedupe=dedupe)
+        writer.finish(_stream_inputs(writer, files, set_bookmarks))
+    return writer.duplicates, writer.bytes_saved
+
+
+_BACKENDS = {
+    "pypdf": _merge_with_pypdf,
+    "pymupdf": _merge_with_pymupdf,
+    "stream": _merge_with_stream,
+}
+
+
+def _input_size(file: File | InMemoryPdf) -> int:
+    if isinstance(file, InMemoryPdf):
+        return len(file.data)
+    try:
+        return file.absolute_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _contiguous_groups(
+    files: Sequence[File | InMemoryPdf], count: int
+) -> list[list[File | InMemoryPdf]]:
+    """Split *files* into at most *count* in-order groups of similar size."""
+    sizes = [max(_input_size(file), 1) for file in files]
+    target = sum(sizes) / count
+    groups: list[list[File | InMemoryPdf]] = [[]]
+    filled = 0
+    for file, size in zip(files, sizes, strict=True):
+        if groups[-1] and filled + size / 2 > target * len(groups):
+            groups.append([])
+        groups[-1].append(file)
+        filled += size
+    return groups
+
+
+def _merge_group(
+    backend: MergeBackend,
+    set_bookmarks: bool,
+    dedupe: bool,
+    files: Sequence[File | InMemoryPdf],
+    output_path: Path,
+) -> _Savings:
+    return _BACKENDS[backend](files, output_path, set_bookmarks, True, dedupe)
+
+
+def _stream_group(
+    set_bookmarks: bool,
+    dedupe: bool,
+    files: Sequence[File | InMemoryPdf],
+    output_path: Path,
+) -> tuple[StreamedPart, list[list[Any]], _Savings]:
+    with open(output_path, "wb") as output:
+        writer = PdfStreamWriter(output, part=True, dedupe=dedupe)
+        toc = _stream_inputs(writer, files, set_bookmarks)
+    savings = (writer.duplicates, writer.bytes_saved)
+    return writer.part(output_path), toc, savings
+
+
+def _add(first: _Savings, second: _Savings) -> _Savings:
+    return first[0] + second[0], first[1] + second[1]
+
+
+def _merge_in_parallel(
+    files: Iterable[File | InMemoryPdf],
+    output: _Output,
+    set_bookmarks: bool,
+    overwrite: bool,
+    backend: MergeBackend,
+    workers: int,
+    dedupe: bool,
+    profile: MergeProfile,
+) -> _Savings:
+    """Merge contiguous groups in worker processes, then join the parts.
+
+    Streamed parts are object bodies that are copied into the output as
+    each one finishes, so streams are only deduplicated within a group.
+    Otherwise each group becomes a PDF carrying its bookmarks as its own
+    outline, and PyMuPDF joins them in order (deduplicating across groups
+    too).
+    """
+    groups = _contiguous_groups(list(files), workers)
+    merge = _BACKENDS[backend]
+    if len(groups) <= 1:
+        return merge(
+            groups[0], output, set_bookmarks, overwrite, dedupe, profile
+        )
+    _check_output(output, overwrite)
+    directory = output.parent if isinstance(output, Path) else None
+    with (
+        tempfile.TemporaryDirectory(prefix=".merge-", dir=directory) as tmp,
+        ProcessPoolExecutor(max_workers=len(groups)) as executor,
+    ):
+        parts = [
+            Path(tmp) / f"part-{index:04}.pdf" for index in range(len(groups))
+        ]
+        if backend == "stream":
+            streamed = executor.map(
+                partial(_stream_group, set_bookmarks, dedupe), groups, parts
+            )
+            savings = (0, 0)
+            with _output_stream(output, profile) as stream:
+                writer = PdfStreamWriter(stream)
+                toc: list[list[Any]] = []
+                for part, part_toc, part_savings in streamed:
+                    toc += _shift_outline(part_toc, writer.page_count)
+                    writer.append_part(part)
+                    savings = _add(savings, part_savings)
+                writer.finish(toc)
+            return savings
+        savings = (0, 0)
+        for part_savings in executor.map(
+            partial(_merge_group, backend, set_bookmarks, dedupe),
+            groups,
+            parts,
+        ):
+            savings = _add(savings, part_savings)
+        joined = _merge_with_pymupdf(
+            [File(path=part) for part in parts],
+            output,
+            False,
+            overwrite,
+            dedupe,
+            profile,
+        )
+        return _add(savings, joined)
+
 
 def merge_pdfs(
-    files: FilesInput,
+    files: FilesInput | Iterable[MergeInput],
     output_path: str | Path,
     set_bookmarks: bool = False,
     overwrite: bool = False,
+    backend: MergeBackend = "pypdf",
+    workers: int = 1,
+    dedupe: bool = False,
+    profile: MergeProfile = "fast",
+    append: bool = False,
 ) -> File:
     """Merge multiple PDF files into a single document on disk.
 
     Parameters
     ----------
-    files : :class:`Sequence[File | str | Path]`
-        Ordered iterable of path-like inputs or
-        :class:`pdf_tools.models.files.File` instances to merge. Non-PDF
-        entries are skipped after emitting a warning via :mod:`typer`.
+    files : :class:`Iterable[File | str | Path | InMemoryPdf]`
+        Ordered iterable of path-like inputs,
+        :class:`pdf_tools.models.files.File` instances, or
+        :class:`pdf_tools.models.files.InMemoryPdf` documents to merge.
+        It is consumed lazily, so a generator such as
+        :func:`pdf_tools.walk.walk_files` is appended as it is walked.
+        Non-PDF files are skipped after emitting a warning via :mod:`typer`.
+        Only the pages an input's ``pages`` selects are copied, with the
+        objects they use; its outline is filtered to match.
     output_path: :class:`pathlib.Path`
         Filesystem path where the merged PDF will be written.  A ``.pdf``
         extension is not enforced but is *highly* recommended to avoid viewer
@@ -62,9 +791,49 @@ def merge_pdfs(
         When `True` each source document is inserted as a top-level outline
         (bookmark) in the resulting file.  The outline title is pulled from
         the corresponding :attr:`pdf_tools.models.files.File.bookmark_name`
-        or falls back to :attr:`pdf_tools.models.files.File.name`.
+        or falls back to :attr:`pdf_tools.models.files.File.name`.  An
+        :class:`pdf_tools.models.files.InMemoryPdf` with an ``outline`` gets
+        one entry per outline item instead.
     overwrite : `bool`, default ``False``
         When `True` overwrite output documents if they already exist.
+    backend : ``"pypdf"`` | ``"pymupdf"`` | ``"stream"``, default ``"pypdf"``
+        How pages are copied.  ``"pymupdf"`` is much faster on large
+        merges and produces the same pages and outline.  ``"stream"``
+        writes each input to disk as soon as it is read, so peak memory
+        follows the largest input instead of the whole bundle; document-
+        level data such as forms and named destinations is dropped.  Every
+        backend opens one input at a time and releases it once its pages
+        are copied, so the number of inputs is not bound by the open file
+        limit.
+    workers : `int`, default ``1``
+        With more than one, the inputs are split into that many contiguous
+        groups of similar size, each merged by *backend* in its own
+        process, and the partial documents are then joined in order.
+        Bookmarks keep their order and titles.  Parts of the ``"stream"``
+        backend are joined by copying bytes; the others are joined with
+        PyMuPDF.
+    dedupe : `bool`, default ``False``
+        When `True` streams with identical data and dictionaries (fonts,
+        images, colour profiles shared by several inputs) are written once
+        and every page points at that copy.  The number of duplicates and
+        the bytes saved are echoed.  With ``"stream"`` parts, duplicates are
+        only found within each group.
+    profile : ``"fast"`` | ``"compact"`` | ``"archive"``, default ``"fast"``
+        How much CPU to spend shrinking the output.  ``"fast"`` writes
+        streams as the inputs had them.  ``"compact"`` packs objects into
+        compressed object streams, deflates uncompressed streams and drops
+        unreferenced objects.  ``"archive"`` also merges identical objects,
+        rewrites each page's content streams as one and deflates
+        uncompressed images and fonts.  The
+        ``"pypdf"`` and ``"stream"`` backends apply the profile by
+        rewriting the merged file with PyMuPDF.
+    append : `bool`, default ``False``
+        When `True` and *output_path* exists, add the inputs (and their
+        bookmarks) after its pages as an incremental update: PyMuPDF
+        writes the new objects after the existing bytes, which are not
+        rewritten.  *backend* and *overwrite* do not apply then, and
+        *workers*, *dedupe* and *profile* must keep their defaults.  A
+        missing *output_path* is merged as usual.
 
     Returns
     -------
@@ -80,6 +849,12 @@ def merge_pdfs(
         If `output_path`'s parent directory does not exist.
     OSError
         If the underlying OS call fails during write (e.g., permission error).
+    ValueError
+        If *backend* is ``"pymupdf"`` and no input has any pages; PyMuPDF
+        cannot write an empty document.  Also if an input's page selection
+        does not fit it, or if *append* is combined with *workers*,
+        *dedupe* or *profile*, or the output cannot be updated
+        incrementally.
 
     Examples
     --------
@@ -102,32 +877,114 @@ def merge_pdfs(
     'pdf'
     """
     output_path = Path(output_path)
-    merger = PdfWriter()
-    normalized_files: Sequence[File] = coerce_files(files)
-    for file in normalized_files:
-        if file.type.lower() != "pdf":
-            typer.echo(
-                f"Skipping {file.path.resolve()} because it is not a PDF"
-            )
-            continue
-        if set_bookmarks:
-            merger.append(
-                str(file.absolute_path),
-                outline_item=file.bookmark_name or file.name,
-            )
-        else:
-            merger.append(str(file.absolute_path))
-
-    if output_path.exists() and overwrite is False:
-        raise FileExistsError(f"File {output_path} already exists. Exiting.")
-    if output_path.parent.exists() is False:
-        raise FileNotFoundError(
-            f"Output directory {output_path.parent} does not exist. "
-            f"Please create it or choose an existing directory."
+    if append and (workers > 1 or dedupe or profile != "fast"):
+        raise ValueError(
+            "append adds an incremental update, which cannot be split "
+            "across workers, deduplicated or recompressed."
         )
-    with open(output_path, "wb") as output:
-        merger.write(output)
+    if append and output_path.exists():
+        _append_with_pymupdf(_pdf_inputs(files), output_path, set_bookmarks)
+    else:
+        _merge(
+            files,
+            output_path,
+            set_bookmarks,
+            overwrite,
+            backend,
+            workers,
+            dedupe,
+            profile,
+        )
+    return File.model_validate({"path": output_path})
 
-    merger.close()
 
-    return File.model_validate({"path": output_path})
+def merge_pdfs_to_stream(
+    files: FilesInput | Iterable[MergeInput],
+    output: IO[bytes],
+    set_bookmarks: bool = False,
+    backend: MergeBackend = "pypdf",
+    workers: int = 1,
+    dedupe: bool = False,
+    profile: MergeProfile = "fast",
+) -> None:
+    """Merge PDFs into one document written to the binary stream *output*.
+
+    *output* only needs ``write`` and ``flush``, so it can be a pipe such
+    as ``sys.stdout.buffer``, a socket file or an HTTP response body.  It
+    is not closed.  Messages (skipped inputs, the deduplication report) go
+    to stderr so they cannot mix with the PDF.  The other parameters and
+    errors are those of :func:`merge_pdfs`.  With a *profile* other than
+    ``"fast"``, or with *workers*, intermediate files are written to the
+    temporary directory first.
+    """
+    _merge(
+        files,
+        output,
+        set_bookmarks,
+        True,
+        backend,
+        workers,
+        dedupe,
+        profile,
+    )
+
+
+def merge_pdfs_to_bytes(
+    files: FilesInput | Iterable[MergeInput],
+    set_bookmarks: bool = False,
+    backend: MergeBackend = "pypdf",
+    workers: int = 1,
+    dedupe: bool = False,
+    profile: MergeProfile = "fast",
+) -> bytes:
+    """Merge PDFs into one document and return it as bytes.
+
+    See :func:`merge_pdfs_to_stream`.
+    """
+    output = BytesIO()
+    merge_pdfs_to_stream(
+        files,
+        output,
+        set_bookmarks,
+        backend=backend,
+        workers=workers,
+        dedupe=dedupe,
+        profile=profile,
+    )
+    return output.getvalue()
+
+
+def _merge(
+    files: FilesInput | Iterable[MergeInput],
+    output: _Output,
+    set_bookmarks: bool,
+    overwrite: bool,
+    backend: MergeBackend,
+    workers: int,
+    dedupe: bool,
+    profile: MergeProfile,
+) -> None:
+    err = not isinstance(output, Path)
+    inputs = _pdf_inputs(files, err=err)
+    if workers > 1:
+        duplicates, saved = _merge_in_parallel(
+            inputs,
+            output,
+            set_bookmarks,
+            overwrite,
+            backend,
+            workers,
+            dedupe,
+            profile,
+        )
+    else:
+        merge = _BACKENDS[backend]
+        duplicates, saved = merge(
+            inputs, output, set_bookmarks, overwrite, dedupe, profile
+        )
+    if dedupe:
+        typer.echo(
+            f"Removed {duplicates} duplicate stream(s), "
+            f"saving {saved:,} bytes.",
+            err=err,
+        )
@@ -0,0 +1,552 @@
+"""Write a merged PDF one input at a time.
+
+:class:`pypdf.PdfWriter` keeps every appended page, font and image in
+memory until :meth:`pypdf.PdfWriter.write`.  :class:`PdfStreamWriter`
+instead copies each input's pages, and every object they reference, to
+the output as soon as the input is appended.  Only the byte offset of each
+written object is kept, so peak memory follows the largest input rather
+than the whole bundle.
+
+Objects are renumbered into one classic cross-reference table.  The page
+tree is rebuilt flat and the outline is written last from ``(level, title,
+page, *destination)`` entries, the same shape
+:meth:`pymupdf.Document.get_toc` uses.  Document-level data of the inputs
+(named destinations, forms, structure trees) is not carried over.
+
+For parallel merges a writer created with ``part=True`` writes only object
+bodies and records where each object number sits in them
+(:class:`StreamedPart`).  :meth:`PdfStreamWriter.append_part` then copies
+those bytes into the final document, shifting the recorded numbers,
+without parsing any PDF syntax again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import warnings
+from collections import deque
+from collections.abc import Iterator, Sequence
+from io import BytesIO
+from pathlib import Path
+from typing import IO, Any, cast
+
+import pypdf
+from pydantic import BaseModel
+from pypdf import PdfReader
+from pypdf.generic import (
+    ArrayObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NullObject,
+    NumberObject,
+    PdfObject,
+    StreamObject,
+    TextStringObject,
+)
+
+__all__ = ["PdfStreamWriter", "StreamedPart"]
+
+_HEADER = b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n"
+_FIT: Sequence[PdfObject] = (NameObject("/Fit"),)
+_TYPE = NameObject("/Type")
+# Object numbers of the catalog and page tree root, which every part
+# refers to but only the final document writes.
+_RESERVED = 2
+
+
+class StreamedPart(BaseModel):
+    """Object bodies written by a :class:`PdfStreamWriter` part.
+
+    Attributes
+    ----------
+    path : :class:`pathlib.Path`
+        File holding the objects.
+    offsets : `list[int]`
+        Position in *path* of each object, from object 3 onwards.
+    marks : `list[int]`
+        Positions in *path* where an object number was written, ascending.
+    numbers : `list[int]`
+        The object number written at each mark.
+    pages : `list[int]`
+        Object numbers of the pages, in order.
+    """
+
+    path: Path
+    offsets: list[int]
+    marks: list[int]
+    numbers: list[int]
+    pages: list[int]
+
+
+class _CountingOutput:
+    """Binary output that counts the bytes written instead of seeking.
+
+    Writers ask for their position to fill in the cross-reference table;
+    counting answers that on pipes too, and relative to where the PDF
+    starts in *raw*.
+    """
+
+    def __init__(self, raw: IO[bytes]) -> None:
+        self._raw = raw
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._raw.write(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        self._raw.flush()
+
+
+class _MarkedOutput(_CountingOutput):
+    """Binary output that records where object numbers are written."""
+
+    def __init__(self, raw: IO[bytes]) -> None:
+        super().__init__(raw)
+        self.marks: list[int] = []
+        self.numbers: list[int] = []
+
+    def mark(self, number: int) -> None:
+        self.marks.append(self._position)
+        self.numbers.append(number)
+
+
+class _Reference(IndirectObject):
+    def write_to_stream(
+        self, stream: Any, encryption_key: None | str | bytes = None
+    ) -> None:
+        if isinstance(stream, _MarkedOutput):
+            stream.mark(self.idnum)
+        super().write_to_stream(stream)
+
+
+def _has_raw_stream_data() -> bool:
+    """Whether :mod:`pypdf` streams keep their undecoded data in ``_data``."""
+    return hasattr(StreamObject(), "_data")
+
+
+class PdfStreamWriter:
+    """Append PDFs to *output* without keeping their objects in memory.
+
+    Parameters
+    ----------
+    output : :class:`typing.IO[bytes]`
+        Seekable binary file the merged document is written to.  It is
+        incomplete until :meth:`finish` returns.
+    part : `bool`, default ``False``
+        Write only object bodies, to be collected with :meth:`part` and
+        joined by another writer's :meth:`append_part`.
+    dedupe : `bool`, default ``False``
+        Write each distinct stream once.  A stream whose data and
+        dictionary (with references already renumbered) match one written
+        earlier is replaced by a reference to it; see
+        :mod:`pdf_tools.merge.dedupe`.  Skipped with a
+        :class:`RuntimeWarning` if :mod:`pypdf` does not keep the raw
+        stream data this compares.
+
+    Attributes
+    ----------
+    duplicates, bytes_saved : `int`
+        Streams skipped because an identical one was already written, and
+        the size of their dictionaries and data.
+    """
+
+    def __init__(
+        self, output: IO[bytes], part: bool = False, dedupe: bool = False
+    ) -> None:
+        self._output = output
+        self._offsets: list[int] = []
+        self._catalog = self._reserve()
+        self._pages_root = self._reserve()
+        self._pages: list[int] = []
+        if dedupe and not _has_raw_stream_data():
+            warnings.warn(
+                f"pypdf {pypdf.__version__} does not expose the stream data "
+                "needed to deduplicate streams; merging without "
+                "deduplication.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            dedupe = False
+        self._dedupe = dedupe
+        self._streams: dict[bytes, int] = {}
+        self._visiting: set[tuple[int, int]] = set()
+        self._dropped: set[tuple[int, int]] = set()
+        self.duplicates = 0
+        self.bytes_saved = 0
+        if part:
+            self._output = cast("IO[bytes]", _MarkedOutput(output))
+        else:
+            self._output = cast("IO[bytes]", _CountingOutput(output))
+            self._output.write(_HEADER)
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages written so far."""
+        return len(self._pages)
+
+    def append(
+        self, reader: PdfReader, indices: Sequence[int] | None = None
+    ) -> list[list[Any]]:
+        """Write the pages of *reader* and return its outline entries.
+
+        Only the pages at *indices* (every page when `None`) and the
+        objects they use are written; references to other pages of
+        *reader*, e.g. from links, become null.  Pages keep their inherited
+        attributes.  Outline entries point at page numbers of *reader*
+        (1-based); items whose destination cannot be resolved to a page are
+        dropped.
+        """
+        numbers: dict[tuple[int, int], int] = {}
+        pending: deque[IndirectObject] = deque()
+        pages = list(reader.pages)
+        if indices is not None:
+            self._dropped = {
+                (reference.idnum, reference.generation)
+                for page in pages
+                if (reference := page.indirect_reference) is not None
+            }
+            pages = [pages[index] for index in indices]
+        page_numbers = []
+        for page in pages:
+            reference = page.indirect_reference
+            number = self._reserve()
+            if reference is not None:
+                key = (reference.idnum, reference.generation)
+                numbers[key] = number
+                self._dropped.discard(key)
+            page_numbers.append(number)
+        for page, number in zip(pages, page_numbers, strict=True):
+            entries = DictionaryObject(
+                (key, value) for key, value in page.items() if key != "/Parent"
+            )
+            if self._dropped and "/Annots" in page:
+                entries[NameObject("/Annots")] = ArrayObject(
+                    annotation
+                    for annotation in cast("ArrayObject", page["/Annots"])
+                    if not _links_to(annotation, self._dropped)
+                )
+            copy = self._remap(entries, numbers, pending)
+            copy[NameObject("/Parent")] = _reference(self._pages_root)
+            self._write(number, copy)
+            self._pages.append(number)
+        while pending:
+            reference = pending.popleft()
+            number = numbers[reference.idnum, reference.generation]
+            source = reference.get_object()
+            if source is None:
+                source = NullObject()
+            self._write(number, self._remap(source, numbers, pending))
+        self._dropped = set()
+        return list(_outline(reader, reader.outline, 1))
+
+    def part(self, path: Path) -> StreamedPart:
+        """Describe the objects written so far to *path*, a part file."""
+        if not isinstance(self._output, _MarkedOutput):
+            raise ValueError("Only a writer created with part=True has parts.")
+        return StreamedPart(
+            path=path,
+            offsets=self._offsets[_RESERVED:],
+            marks=self._output.marks,
+            numbers=self._output.numbers,
+            pages=self._pages,
+        )
+
+    def append_part(self, part: StreamedPart) -> None:
+        """Copy the objects of *part*, numbered after those written so far.
+
+        Only the recorded object numbers are rewritten; everything between
+        them is copied byte for byte.
+        """
+        shift = len(self._offsets) - _RESERVED
+        self._offsets.extend(0 for _ in part.offsets)
+        starts = sorted(
+            (offset, number)
+            for number, offset in enumerate(part.offsets, _RESERVED + 1)
+        )
+        base = self._output.tell()
+        growth = 0
+        position = 0
+        start_index = 0
+        with (
+            open(part.path, "rb") as source,
+            mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as body,
+        ):
+            for mark, number in zip(part.marks, part.numbers, strict=True):
+                while start_index < len(starts) and (
+                    starts[start_index][0] <= mark
+                ):
+                    offset, local = starts[start_index]
+                    self._offsets[local + shift - 1] = base + offset + growth
+                    start_index += 1
+                self._output.write(body[position:mark])
+                old = b"%d" % number
+                new = b"%d" % (
+                    number + shift if number > _RESERVED else number
+                )
+                self._output.write(new)
+                growth += len(new) - len(old)
+                position = mark + len(old)
+            self._output.write(body[position:])
+        self._pages.extend(page + shift for page in part.pages)
+
+    def finish(self, outline: Sequence[Sequence[Any]] = ()) -> None:
+        """Write the page tree, *outline*, catalog and cross-references.
+
+        *outline* holds ``[level, title, page, *destination]`` entries with
+        1-based page numbers into the merged document; *destination*
+        defaults to ``/Fit``.
+        """
+        pages = DictionaryObject(
+            {
+                _TYPE: NameObject("/Pages"),
+                NameObject("/Kids"): ArrayObject(
+                    _reference(number) for number in self._pages
+                ),
+                NameObject("/Count"): NumberObject(len(self._pages)),
+            }
+        )
+        self._write(self._pages_root, pages)
+        catalog = DictionaryObject(
+            {
+                _TYPE: NameObject("/Catalog"),
+                NameObject("/Pages"): _reference(self._pages_root),
+            }
+        )
+        if outline:
+            catalog[NameObject("/Outlines")] = _reference(
+                self._write_outline(outline)
+            )
+        self._write(self._catalog, catalog)
+
+        start = self._output.tell()
+        self._output.write(b"xref\n0 %d\n" % (len(self._offsets) + 1))
+        self._output.write(b"0000000000 65535 f \n")
+        for offset in self._offsets:
+            self._output.write(b"%010d 00000 n \n" % offset)
+        self._output.write(b"trailer\n")
+        DictionaryObject(
+            {
+                NameObject("/Size"): NumberObject(len(self._offsets) + 1),
+                NameObject("/Root"): _reference(self._catalog),
+            }
+        ).write_to_stream(self._output)
+        self._output.write(b"\nstartxref\n%d\n%%%%EOF\n" % start)
+
+    def _reserve(self) -> int:
+        self._offsets.append(0)
+        return len(self._offsets)
+
+    def _remap(
+        self,
+        obj: Any,
+        numbers: dict[tuple[int, int], int],
+        pending: deque[IndirectObject],
+    ) -> Any:
+        """Copy *obj* with references renumbered, queueing new targets."""
+        if isinstance(obj, IndirectObject):
+            key = (obj.idnum, obj.generation)
+            if key in self._dropped:
+                return NullObject()
+            if key not in numbers and self._dedupe:
+                self._write_distinct(obj, numbers, pending)
+            if key not in numbers:
+                numbers[key] = self._reserve()
+                pending.append(obj)
+            return _reference(numbers[key])
+        if isinstance(obj, StreamObject):
+            copy = StreamObject()
+            copy.update(
+                (key, self._remap(value, numbers, pending))
+                for key, value in obj.items()
+                if key != "/Length"
+            )
+            copy._data = obj._data
+            return copy
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject(
+                (key, self._remap(value, numbers, pending))
+                for key, value in obj.items()
+            )
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(
+                self._remap(value, numbers, pending) for value in obj
+            )
+        return obj
+
+    def _identity(
+        self,
+        obj: Any,
+        numbers: dict[tuple[int, int], int],
+        pending: deque[IndirectObject],
+        seen: frozenset[int] = frozenset(),
+    ) -> Any:
+        """Copy *obj* with references to objects other than streams inlined.
+
+        Referenced streams are written (or matched) first, so two streams
+        with the same identity can share one output object.  Pages and
+        references back to an object already being inlined keep their
+        number.
+        """
+        if isinstance(obj, IndirectObject):
+            target = obj.get_object()
+            if (
+                isinstance(target, StreamObject)
+                or obj.idnum in seen
+                or (
+                    isinstance(target, DictionaryObject)
+                    and target.get(_TYPE) in ("/Page", "/Pages")
+                )
+            ):
+                return self._remap(obj, numbers, pending)
+            return self._identity(target, numbers, pending, seen | {obj.idnum})
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject(
+                (key, self._identity(value, numbers, pending, seen))
+                for key, value in obj.items()
+            )
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(
+                self._identity(value, numbers, pending, seen) for value in obj
+            )
+        return obj
+
+    def _write_distinct(
+        self,
+        reference: IndirectObject,
+        numbers: dict[tuple[int, int], int],
+        pending: deque[IndirectObject],
+    ) -> None:
+        """Number a stream after an identical one, or write it right away.
+
+        Objects other than streams are left to the caller.  So is a stream
+        reached again through its own references, which cannot be hashed
+        before it has a number.
+        """
+        key = (reference.idnum, reference.generation)
+        source = reference.get_object()
+        if not isinstance(source, StreamObject) or key in self._visiting:
+            return
+        self._visiting.add(key)
+        try:
+            identity = self._identity(
+                DictionaryObject(
+                    (name, value)
+                    for name, value in source.items()
+                    if name != "/Length"
+                ),
+                numbers,
+                pending,
+            )
+        finally:
+            self._visiting.discard(key)
+        if key in numbers:
+            return
+        dictionary = BytesIO()
+        identity.write_to_stream(dictionary)
+        digest = hashlib.sha256(dictionary.getvalue())
+        digest.update(source._data)
+        kept = self._streams.get(digest.digest())
+        if kept is not None:
+            numbers[key] = kept
+            self.duplicates += 1
+            self.bytes_saved += dictionary.tell() + len(source._data)
+            return
+        numbers[key] = self._streams[digest.digest()] = self._reserve()
+        self._write(numbers[key], self._remap(source, numbers, pending))
+
+    def _write(self, number: int, obj: PdfObject) -> None:
+        self._offsets[number - 1] = self._output.tell()
+        if isinstance(self._output, _MarkedOutput):
+            self._output.mark(number)
+        self._output.write(b"%d 0 obj\n" % number)
+        obj.write_to_stream(self._output)
+        self._output.write(b"\nendobj\n")
+
+    def _write_outline(self, outline: Sequence[Sequence[Any]]) -> int:
+        root = self._reserve()
+        nodes = {root: DictionaryObject({_TYPE: NameObject("/Outlines")})}
+        counts = {root: 0}
+        last_child: dict[int, int] = {}
+        stack = [(0, root)]
+        for level, title, page, *destination in outline:
+            number = self._reserve()
+            while stack[-1][0] >= level:
+                stack.pop()
+            parent = stack[-1][1]
+            node = DictionaryObject(
+                {
+                    NameObject("/Title"): TextStringObject(title),
+                    NameObject("/Parent"): _reference(parent),
+                }
+            )
+            if page > 0:
+                node[NameObject("/Dest")] = ArrayObject(
+                    [
+                        _reference(self._pages[page - 1]),
+                        *(destination or _FIT),
+                    ]
+                )
+            previous = last_child.get(parent)
+            if previous is None:
+                nodes[parent][NameObject("/First")] = _reference(number)
+            else:
+                node[NameObject("/Prev")] = _reference(previous)
+                nodes[previous][NameObject("/Next")] = _reference(number)
+            nodes[parent][NameObject("/Last")] = _reference(number)
+            last_child[parent] = number
+            for _, ancestor in stack:
+                counts[ancestor] = counts.get(ancestor, 0) + 1
+            nodes[number] = node
+            stack.append((level, number))
+        for number, node in nodes.items():
+            if counts.get(number):
+                node[NameObject("/Count")] = NumberObject(counts[number])
+            self._write(number, node)
+        return root
+
+
+def _reference(number: int) -> IndirectObject:
+    return _Reference(number, 0, None)
+
+
+def _links_to(annotation: Any, pages: set[tuple[int, int]]) -> bool:
+    """Whether *annotation* is a link whose destination is one of *pages*."""
+    annotation = annotation.get_object()
+    destination = annotation.get("/Dest")
+    action = annotation.get("/A")
+    if destination is None and action is not None:
+        destination = action.get_object().get("/D")
+    if destination is not None:
+        destination = destination.get_object()
+    if not isinstance(destination, ArrayObject) or not destination:
+        return False
+    target = destination[0]
+    return (
+        isinstance(target, IndirectObject)
+        and (target.idnum, target.generation) in pages
+    )
+
+
+def _outline(
+    reader: PdfReader, items: Sequence[Any], level: int
+) -> Iterator[list[Any]]:
+    """Yield ``[level, title, page, *destination]`` for *reader*'s outline.
+
+    In :attr:`pypdf.PdfReader.outline` a nested list holds the children
+    of the item before it.
+    """
+    for item in items:
+        if isinstance(item, list):
+            yield from _outline(reader, item, level + 1)
+            continue
+        page = reader.get_destination_page_number(item)
+        if page is None or page < 0:
+            continue
+        yield [level, item.title, page + 1, *item.dest_array[1:]]
@@ -1,24 +1,34 @@
 from .files import (
     ConversionBatchResult,
+    ConversionEvent,
     File,
     FileInput,
     Files,
     FilesInput,
+    InMemoryPdf,
+    MergeInput,
     SkippedFile,
     coerce_file,
     coerce_files,
+    iter_files,
 )
+from .images import ImageOptions
 from .watermark import WatermarkOptions, WatermarkResult
 
 __all__ = [
     "ConversionBatchResult",
+    "ConversionEvent",
     "File",
     "FileInput",
     "Files",
     "FilesInput",
+    "ImageOptions",
+    "InMemoryPdf",
+    "MergeInput",
     "SkippedFile",
     "WatermarkOptions",
     "WatermarkResult",
     "coerce_file",
     "coerce_files",
+    "iter_files",
 ]
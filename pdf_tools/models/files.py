@@ -17,9 +17,9 @@ paths.  All validations happen eagerly via Pydantic so downstream code can rely
 on type guarantees.
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Any, TypeAlias
+from typing import Annotated, Any, TypeAlias
 
 from pydantic import BaseModel, Field, RootModel, computed_field
 
@@ -28,10 +28,20 @@ __all__ = [
     "Files",
     "FileInput",
     "FilesInput",
+    "InMemoryPdf",
+    "MergeInput",
     "SkippedFile",
     "ConversionBatchResult",
+    "ConversionEvent",
     "coerce_file",
     "coerce_files",
+    "iter_files",
+    "page_indices",
+]
+
+_PAGE_RANGE = r"(?:[1-9]\d*(?:\s*-\s*(?:[1-9]\d*)?)?|-\s*[1-9]\d*)"
+_PageRanges: TypeAlias = Annotated[
+    str, Field(pattern=rf"^\s*{_PAGE_RANGE}(?:\s*,\s*{_PAGE_RANGE})*\s*$")
 ]
 
 
@@ -46,6 +56,11 @@ class File(BaseModel):
     bookmark_name : `str` | `None`, optional
         Optional human-friendly alias that a user may register via the CLI so
         they can reference the path later without typing the full string.
+    pages : `str` | `None`, optional
+        Pages to merge, as 1-based page numbers and inclusive ranges
+        separated by commas, e.g. ``"1-3,7,10-"``.  A range without a start
+        or end runs from the first or to the last page.  `None` merges every
+        page.  See :func:`page_indices`.
 
     Notes
     -----
@@ -56,6 +71,7 @@ class File(BaseModel):
 
     path: Path
     bookmark_name: str | None = None
+    pages: _PageRanges | None = None
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -139,8 +155,36 @@ class Files(RootModel):
         return self.root[item]
 
 
+class InMemoryPdf(BaseModel):
+    """A PDF held in memory, e.g. the result of a bytes-only conversion.
+
+    Parameters
+    ----------
+    data : `bytes`
+        The complete PDF document.
+    name : `str`
+        Display name used in messages and as the fallback bookmark title.
+    bookmark_name : `str` | `None`, optional
+        Outline title used when merging with bookmarks.
+    outline : `list[tuple[str, int]]`, optional
+        ``(title, page index)`` pairs for documents packed into *data*,
+        such as a run of images converted together.  When present, merging
+        with bookmarks adds one outline entry per pair instead of
+        *bookmark_name*.
+    pages : `str` | `None`, optional
+        Pages to merge, as for :attr:`File.pages`.
+    """
+
+    data: bytes
+    name: str
+    bookmark_name: str | None = None
+    outline: list[tuple[str, int]] = Field(default_factory=list)
+    pages: _PageRanges | None = None
+
+
 FileInput: TypeAlias = File | str | Path
-FilesInput: TypeAlias = Files | Sequence[FileInput]
+FilesInput: TypeAlias = Files | Iterable[FileInput]
+MergeInput: TypeAlias = FileInput | InMemoryPdf
 
 
 class SkippedFile(BaseModel):
@@ -155,6 +199,60 @@ class ConversionBatchResult(BaseModel):
 
     converted: list[File] = Field(default_factory=list)
     skipped: list[SkippedFile] = Field(default_factory=list)
+    unchanged: list[File] = Field(default_factory=list)
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+class ConversionEvent(BaseModel):
+    """One finished item of a streaming batch conversion."""
+
+    index: int
+    source: File
+    outcome: File | SkippedFile
+
+    @property
+    def converted(self) -> bool:
+        """Whether the source was converted rather than skipped."""
+        return isinstance(self.outcome, File)
+
+
+def page_indices(pages: str, page_count: int) -> list[int]:
+    """Return the 0-based indices of the pages *pages* selects, in order.
+
+    Parameters
+    ----------
+    pages : `str`
+        Page numbers and ranges as accepted by :attr:`File.pages`.
+    page_count : `int`
+        Number of pages in the document.
+
+    Raises
+    ------
+    ValueError
+        If a range runs backwards or past the last page, or a page is
+        selected more than once.
+
+    Examples
+    --------
+    >>> page_indices("1-3,7,9-", 10)
+    [0, 1, 2, 6, 8, 9]
+    """
+    indices: list[int] = []
+    for item in pages.split(","):
+        first, dash, last = (part.strip() for part in item.partition("-"))
+        start = int(first) if first else 1
+        stop = (int(last) if last else page_count) if dash else start
+        if start > stop:
+            raise ValueError(f"Page range {item.strip()!r} runs backwards.")
+        if stop > page_count:
+            raise ValueError(
+                f"Page {stop} is past the last page ({page_count})."
+            )
+        indices.extend(range(start - 1, stop))
+    if len(set(indices)) != len(indices):
+        raise ValueError(f"Pages {pages!r} select a page more than once.")
+    return indices
 
 
 def coerce_file(file: FileInput) -> File:
@@ -166,8 +264,13 @@ def coerce_file(file: FileInput) -> File:
 
 def coerce_files(files: FilesInput) -> list[File]:
     """Normalize a sequence of path-like objects into :class:`File` models."""
+    return list(iter_files(files))
+
+
+def iter_files(files: FilesInput) -> Iterator[File]:
+    """Lazily normalize path-like objects, e.g. from a directory walk."""
     if isinstance(files, Files):
-        return list(files.root)
+        return iter(files.root)
     if isinstance(files, (File, str, Path)):
         raise TypeError("Expected a sequence of files, not a single file.")
-    return [coerce_file(file) for file in files]
+    return (coerce_file(file) for file in files)
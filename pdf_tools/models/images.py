@@ -0,0 +1,84 @@
+"""pydantic models that describe image-to-PDF conversion settings."""
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+PageSize = Literal["a3", "a4", "letter", "legal"]
+
+# Portrait width and height in PDF points (1/72 inch).
+PAGE_SIZES: dict[str, tuple[float, float]] = {
+    "a3": (841.89, 1190.55),
+    "a4": (595.28, 841.89),
+    "letter": (612.0, 792.0),
+    "legal": (612.0, 1008.0),
+}
+
+
+class ImageOptions(BaseModel):
+    """How images are resampled and encoded before they are wrapped.
+
+    Parameters
+    ----------
+    dpi : `int` | `None`, default `None`
+        Target resolution.  Images with more pixels than *page_size* holds
+        at this resolution are downsampled to fit it (orientation follows
+        the image) and get a page of that physical size.  `None` keeps
+        every image at full resolution.
+    page_size : ``"a3"`` | ``"a4"`` | ``"letter"`` | ``"legal"``
+        Page the *dpi* budget is computed for; default ``"a4"``.
+    jpeg_quality : `int` | `None`, default `None`
+        Re-encode every image as JPEG at this quality (1-95).  With `None`
+        only downsampled images are re-encoded: photos as JPEG at quality
+        85, everything else as lossless PNG.
+    max_pixels : `int` | `None`, default `None`
+        Refuse images with more pixels than this before decoding them.
+        Pillow's own decompression-bomb limit
+        (:data:`PIL.Image.MAX_IMAGE_PIXELS`) applies as well.
+    max_memory_mb : `int` | `None`, default `None`
+        Ceiling for the decoded pixels of one image.  Larger images are
+        embedded undecoded where :mod:`img2pdf` allows it (JPEG,
+        non-interlaced PNG, single-strip CCITT TIFF), decoded at a reduced
+        scale (JPEG) or strip by strip (uncompressed, PackBits and Deflate
+        TIFF), and refused otherwise.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    dpi: Annotated[int, Field(gt=0)] | None = None
+    page_size: PageSize = "a4"
+    jpeg_quality: Annotated[int, Field(ge=1, le=95)] | None = None
+    max_pixels: Annotated[int, Field(gt=0)] | None = None
+    max_memory_mb: Annotated[int, Field(gt=0)] | None = None
+
+    @property
+    def fingerprint(self) -> str:
+        """Identify the settings that change the output; empty if none do."""
+        parts: list[str] = []
+        if self.dpi is not None:
+            parts.append(f"dpi-{self.dpi}-{self.page_size}")
+        if self.jpeg_quality is not None:
+            parts.append(f"jpeg-{self.jpeg_quality}")
+        if self.max_memory_mb is not None:
+            parts.append(f"mem-{self.max_memory_mb}")
+        return ":".join(parts)
+
+    def target_size(self, width: int, height: int) -> tuple[int, int] | None:
+        """Return the downsampled size of a *width* x *height* image.
+
+        `None` means the image already fits and keeps its pixels.
+        """
+        if self.dpi is None:
+            return None
+        page_width, page_height = PAGE_SIZES[self.page_size]
+        if width > height:
+            page_width, page_height = page_height, page_width
+        scale = min(
+            page_width * self.dpi / 72 / width,
+            page_height * self.dpi / 72 / height,
+        )
+        if scale >= 1:
+            return None
+        return max(1, round(width * scale)), max(1, round(height * scale))
@@ -1,5 +1,6 @@
-from .service import convert_and_merge_pdfs
+from .service import convert_and_merge_pdfs, convert_and_merge_pdfs_to_stream
 
 __all__ = [
     "convert_and_merge_pdfs",
+    "convert_and_merge_pdfs_to_stream",
 ]
@@ -0,0 +1,107 @@
+"""Awaitable variant of the convert-and-merge helper."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from pathlib import Path
+
+from pdf_tools.convert import aio as convert_aio
+from pdf_tools.convert.cache import ConversionCache
+from pdf_tools.merge.aio import merge_pdfs
+from pdf_tools.merge.service import MergeBackend, MergeProfile
+from pdf_tools.models.files import File, FilesInput, SkippedFile, coerce_files
+from pdf_tools.models.images import ImageOptions
+from pdf_tools.process.service import (
+    _convert_run,
+    _image_runs,
+    _merge_inputs,
+    _needs_conversion,
+    _remove_temp_files,
+    _segments,
+    _temp_file_jobs,
+)
+
+__all__ = ["convert_and_merge_pdfs"]
+
+
+async def convert_and_merge_pdfs(
+    files: FilesInput,
+    output_path: str | Path,
+    set_bookmarks: bool = False,
+    overwrite: bool = False,
+    xmlrpc_ports: Sequence[int] | None = None,
+    in_memory: bool = False,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    max_concurrency: int | None = None,
+    executor: Executor | None = None,
+    image_options: ImageOptions | None = None,
+    merge_backend: MergeBackend = "pypdf",
+    merge_workers: int = 1,
+    merge_dedupe: bool = False,
+    merge_profile: MergeProfile = "fast",
+) -> File:
+    """Convert *files* to PDFs (if needed) and merge them into one document.
+
+    Conversion goes through :mod:`pdf_tools.convert.aio` (bounded by
+    *xmlrpc_ports*, *image_workers* and *max_concurrency*) and the merge
+    runs on *executor*; see :func:`pdf_tools.merge.aio.merge_pdfs`.  The
+    other parameters match
+    :func:`pdf_tools.process.service.convert_and_merge_pdfs`, including
+    how runs of images are combined (on a worker thread, one run at a
+    time, so cancellation takes effect between runs).  Temporary files are
+    removed even if the call is cancelled; a merge that has already started
+    is not interrupted (see :func:`pdf_tools.merge.aio.merge_pdfs`).
+    """
+    segments = _segments(coerce_files(files), combine_images=cache is None)
+    temp_paths: list[Path] = []
+    outcomes: Sequence[File | bytes | SkippedFile]
+    try:
+        if in_memory:
+            outcomes = await convert_aio.convert_files_to_bytes(
+                _needs_conversion(segments),
+                xmlrpc_ports=xmlrpc_ports,
+                cache=cache,
+                image_workers=image_workers,
+                max_concurrency=max_concurrency,
+                image_options=image_options,
+            )
+        else:
+            jobs = await asyncio.to_thread(
+                _temp_file_jobs, segments, temp_paths
+            )
+            outcomes = await convert_aio.convert_files_to_paths(
+                jobs,
+                overwrite=True,
+                xmlrpc_ports=xmlrpc_ports,
+                cache=cache,
+                image_workers=image_workers,
+                max_concurrency=max_concurrency,
+                image_options=image_options,
+            )
+        run_documents = [
+            await asyncio.to_thread(
+                _convert_run, run, image_workers, image_options
+            )
+            for run in _image_runs(segments)
+        ]
+        converted = _merge_inputs(segments, outcomes, run_documents)
+        if not converted:
+            raise ValueError(
+                "No files successfully converted. Aborting merge."
+            )
+        return await merge_pdfs(
+            converted,
+            output_path,
+            set_bookmarks,
+            overwrite=overwrite,
+            executor=executor,
+            backend=merge_backend,
+            workers=merge_workers,
+            dedupe=merge_dedupe,
+            profile=merge_profile,
+        )
+    finally:
+        _remove_temp_files(temp_paths)
@@ -7,23 +7,41 @@ into a single document.
 This wrapper around :func:`pdf_tools.process.service.convert_and_merge_pdfs`
 provides the simplest possible UX for users who only care about the final PDF.
 They can supply paths directly or hand over a JSON bundle produced by other
-commands.
+commands.  An output path of ``-`` writes the merged PDF to stdout, with
+conversion progress sent to stderr.
 """
 
-from collections.abc import Sequence
-from contextlib import nullcontext
+import sys
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
-from typing import Annotated
+from typing import IO, Annotated, Any
 
 import typer
 from pydantic import ValidationError
 
 from pdf_tools.cli import AsyncTyper
-from pdf_tools.convert.unoserver_ctx import unoserver_listener
+from pdf_tools.convert.cli import (
+    _DEFAULT_CACHE_MAX_SIZE,
+    _DEFAULT_PAGE_SIZE,
+    _CacheDirOption,
+    _CacheMaxSizeOption,
+    _DpiOption,
+    _image_options,
+    _JpegQualityOption,
+    _MaxMemoryOption,
+    _MaxPixelsOption,
+    _open_cache,
+    _PageSizeOption,
+)
+from pdf_tools.convert.unoserver_daemon import office_context
+from pdf_tools.merge.cli import STDOUT
 from pdf_tools.models.files import File, Files
 from pdf_tools.process.service import (
     convert_and_merge_pdfs as _convert_and_merge_pdfs,
 )
+from pdf_tools.process.service import convert_and_merge_pdfs_to_stream
+from pdf_tools.typings import MergeBackendName, MergeProfileName
 
 cli = AsyncTyper(no_args_is_help=True)
 
@@ -32,6 +50,33 @@ def _requires_office(files: Sequence[File]) -> bool:
     return any(file.type.lower() in {"doc", "docx"} for file in files)
 
 
+@contextmanager
+def _merge_output(output_path: Path) -> Iterator[Path | IO[bytes]]:
+    """Yield *output_path*, or stdout when it is ``-``.
+
+    While stdout carries the PDF, progress messages go to stderr.
+    """
+    if output_path != STDOUT:
+        yield output_path
+        return
+    stdout = typer.get_binary_stream("stdout")
+    with redirect_stdout(sys.stderr):
+        yield stdout
+
+
+def _convert_and_merge_to(
+    files: Sequence[File],
+    output: Path | IO[bytes],
+    overwrite: bool,
+    **options: Any,
+) -> None:
+    if not isinstance(output, Path):
+        convert_and_merge_pdfs_to_stream(files, output, **options)
+        return
+    _convert_and_merge_pdfs(files, output, overwrite=overwrite, **options)
+    typer.echo(f"Merged PDFs to {output.resolve()}")
+
+
 @cli.command()
 def convert_and_merge_pdfs(
     file_paths: Annotated[
@@ -54,7 +99,7 @@ def convert_and_merge_pdfs(
             "--output-path",
             "-o",
             help=(
-                "Destination path for the merged PDF. "
+                "Destination path for the merged PDF, or '-' for stdout. "
                 "Defaults to 'output.pdf' in current directory."
             ),
         ),
@@ -69,6 +114,67 @@ def convert_and_merge_pdfs(
         bool,
         typer.Option(help="Overwrite output files if they already exist."),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="Number of LibreOffice workers for Word conversions.",
+        ),
+    ] = 1,
+    image_workers: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="Number of processes for image conversions.",
+        ),
+    ] = 1,
+    in_memory: Annotated[
+        bool,
+        typer.Option(
+            help="Merge converted documents from memory, not temp files."
+        ),
+    ] = False,
+    daemon: Annotated[
+        bool,
+        typer.Option(
+            help="Reuse (or start) a persistent LibreOffice listener."
+        ),
+    ] = False,
+    cache_dir: _CacheDirOption = None,
+    cache_max_size: _CacheMaxSizeOption = _DEFAULT_CACHE_MAX_SIZE,
+    dpi: _DpiOption = None,
+    page_size: _PageSizeOption = _DEFAULT_PAGE_SIZE,
+    jpeg_quality: _JpegQualityOption = None,
+    max_pixels: _MaxPixelsOption = None,
+    max_memory_mb: _MaxMemoryOption = None,
+    merge_backend: Annotated[
+        MergeBackendName,
+        typer.Option(
+            help=(
+                "How to merge: pymupdf is faster, stream keeps memory "
+                "bounded by the largest input."
+            )
+        ),
+    ] = MergeBackendName.PYPDF,
+    merge_workers: Annotated[
+        int,
+        typer.Option(min=1, help="Merge groups of inputs in N processes."),
+    ] = 1,
+    merge_profile: Annotated[
+        MergeProfileName,
+        typer.Option(
+            help=(
+                "Output size vs. CPU: compact uses object streams and "
+                "deflate, archive also recompresses images and fonts."
+            )
+        ),
+    ] = MergeProfileName.FAST,
+    merge_dedupe: Annotated[
+        bool,
+        typer.Option(
+            help="Store fonts and images shared by several inputs once."
+        ),
+    ] = False,
 ) -> None:
     """Convert inputs to PDF, then merge them."""
     if (file_paths is None) == (json_file is None):
@@ -99,13 +205,22 @@ def convert_and_merge_pdfs(
         raise ValueError("Either file_paths or json_file must be provided")
     else:
         files = [File.model_validate({"path": p}) for p in file_paths]
-    context = (
-        unoserver_listener(uno_port=2002)
-        if _requires_office(files)
-        else nullcontext()
-    )
-    with context:
-        _convert_and_merge_pdfs(
-            files, output_path, set_bookmarks, overwrite=overwrite_existing
+    context = office_context(_requires_office(files), workers, daemon)
+    with _merge_output(output_path) as output, context as xmlrpc_ports:
+        _convert_and_merge_to(
+            files,
+            output,
+            overwrite_existing,
+            set_bookmarks=set_bookmarks,
+            xmlrpc_ports=xmlrpc_ports,
+            in_memory=in_memory,
+            cache=_open_cache(cache_dir, cache_max_size),
+            image_workers=image_workers,
+            image_options=_image_options(
+                dpi, page_size, jpeg_quality, max_pixels, max_memory_mb
+            ),
+            merge_backend=merge_backend.value,
+            merge_workers=merge_workers,
+            merge_dedupe=merge_dedupe,
+            merge_profile=merge_profile.value,
         )
-    typer.echo(f"Merged PDFs to {output_path.resolve()}")
@@ -18,29 +18,213 @@ Workflow
 2. **Merge** - The (now mostly PDF) list is forwarded to
    :func:`pdf_tools.merge.service.merge_pdfs`.
 
-The function is intentionally *blocking* and writes the merged PDF to disk.
-Wrap it in a thread executor if you need async I/O.
+The function is intentionally *blocking* and writes the merged PDF to disk;
+:func:`convert_and_merge_pdfs_to_stream` writes it to a binary stream
+instead.  :func:`pdf_tools.process.aio.convert_and_merge_pdfs` is the
+awaitable variant for code running in an event loop.
+
+Runs of two or more consecutive images are converted together by
+:func:`pdf_tools.convert.service.convert_images_to_one_pdf`: one
+:mod:`img2pdf` document with a bookmark per image instead of one PDF per
+image that the merge has to parse again.  Runs are not combined when a
+conversion cache is given, so cached images are still reused one by one.
+
+Other converted PDFs are written to temporary files before merging.
+With ``in_memory=True`` they are produced as bytes (see
+:func:`pdf_tools.convert.service.convert_files_to_bytes`) and merged straight
+from memory, skipping the temp-file write and re-read.
 """
 
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import suppress
+from functools import partial
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from typing import IO, TypeAlias, TypeVar
+
+import typer
 
-from pdf_tools.convert.service import convert_file_to_pdf
-from pdf_tools.merge.service import merge_pdfs
-from pdf_tools.models.files import File, FilesInput, coerce_files
+from pdf_tools.convert.cache import ConversionCache
+from pdf_tools.convert.service import (
+    SUPPORTED_IMAGE_FORMATS,
+    convert_files_to_bytes,
+    convert_files_to_paths,
+    convert_images_to_one_pdf,
+)
+from pdf_tools.merge.service import (
+    MergeBackend,
+    MergeProfile,
+    merge_pdfs,
+    merge_pdfs_to_stream,
+)
+from pdf_tools.models.files import (
+    File,
+    FilesInput,
+    InMemoryPdf,
+    SkippedFile,
+    coerce_files,
+)
+from pdf_tools.models.images import ImageOptions
 
 __all__: Sequence[str] = [
     "convert_and_merge_pdfs",
+    "convert_and_merge_pdfs_to_stream",
 ]
 
 
+_Segment: TypeAlias = File | list[File]
+_T = TypeVar("_T")
+
+
+def _is_image(file: File) -> bool:
+    return file.type.lower() in SUPPORTED_IMAGE_FORMATS
+
+
+def _segments(files: Sequence[File], combine_images: bool) -> list[_Segment]:
+    """Group runs of two or more consecutive images into one segment each.
+
+    Images with a page selection (e.g. of a multi-page TIFF) stay on their
+    own so it can be applied.
+    """
+    segments: list[_Segment] = []
+    run: list[File] = []
+    for file in [*files, None]:
+        if (
+            file is not None
+            and combine_images
+            and _is_image(file)
+            and file.pages is None
+        ):
+            run.append(file)
+            continue
+        if len(run) > 1:
+            segments.append(run)
+        else:
+            segments.extend(run)
+        run = []
+        if file is not None:
+            segments.append(file)
+    return segments
+
+
+def _image_runs(segments: Sequence[_Segment]) -> list[list[File]]:
+    return [segment for segment in segments if isinstance(segment, list)]
+
+
+def _needs_conversion(segments: Sequence[_Segment]) -> list[File]:
+    return [
+        segment
+        for segment in segments
+        if isinstance(segment, File) and segment.type.lower() != "pdf"
+    ]
+
+
+def _temp_file_jobs(
+    segments: Sequence[_Segment], temp_paths: list[Path]
+) -> list[tuple[File, Path]]:
+    """Give every single non-PDF input a temporary output file."""
+    jobs: list[tuple[File, Path]] = []
+    for file in _needs_conversion(segments):
+        with NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
+            temp_paths.append(Path(tmp_pdf.name))
+        jobs.append((file, temp_paths[-1]))
+    return jobs
+
+
+def _echo_skipped(skipped: SkippedFile) -> None:
+    typer.secho(f"Skipping {skipped.path}: {skipped.reason}", fg="yellow")
+
+
+def _merge_inputs(
+    segments: Sequence[_Segment],
+    outcomes: Iterable[File | bytes | SkippedFile],
+    run_documents: Iterable[InMemoryPdf | None],
+) -> list[File | InMemoryPdf]:
+    """Interleave conversion results with the PDFs that passed through.
+
+    *outcomes* holds the result of each single conversion (a temporary
+    file or PDF bytes) and *run_documents* the combined PDF of each image
+    run, both in input order.
+    """
+    remaining = iter(outcomes)
+    documents = iter(run_documents)
+    converted: list[File | InMemoryPdf] = []
+    for segment in segments:
+        if isinstance(segment, list):
+            document = next(documents)
+            if document is not None:
+                converted.append(document)
+            continue
+        if segment.type.lower() == "pdf":
+            converted.append(segment)
+            continue
+        outcome = next(remaining)
+        bookmark_name = segment.bookmark_name or segment.name
+        if isinstance(outcome, File):
+            converted.append(
+                outcome.model_copy(
+                    update={
+                        "bookmark_name": bookmark_name,
+                        "pages": segment.pages,
+                    }
+                )
+            )
+        elif isinstance(outcome, SkippedFile):
+            _echo_skipped(outcome)
+        elif isinstance(outcome, bytes):
+            converted.append(
+                InMemoryPdf(
+                    data=outcome,
+                    name=segment.name,
+                    bookmark_name=bookmark_name,
+                    pages=segment.pages,
+                )
+            )
+    return converted
+
+
+def _convert_run(
+    run: Sequence[File],
+    image_workers: int,
+    image_options: ImageOptions | None,
+) -> InMemoryPdf | None:
+    document, skipped = convert_images_to_one_pdf(
+        run, image_workers=image_workers, image_options=image_options
+    )
+    for skip in skipped:
+        _echo_skipped(skip)
+    return document
+
+
+def _convert_runs(
+    runs: Iterable[Sequence[File]],
+    image_workers: int,
+    image_options: ImageOptions | None,
+) -> Iterator[InMemoryPdf | None]:
+    for run in runs:
+        yield _convert_run(run, image_workers, image_options)
+
+
+def _remove_temp_files(temp_paths: Iterable[Path]) -> None:
+    for temp_path in temp_paths:
+        with suppress(OSError):
+            temp_path.unlink()
+
+
 def convert_and_merge_pdfs(
     files: FilesInput,
     output_path: str | Path,
     set_bookmarks: bool = False,
     overwrite: bool = False,
+    xmlrpc_ports: Sequence[int] | None = None,
+    in_memory: bool = False,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    image_options: ImageOptions | None = None,
+    merge_backend: MergeBackend = "pypdf",
+    merge_workers: int = 1,
+    merge_dedupe: bool = False,
+    merge_profile: MergeProfile = "fast",
 ) -> File:
     """Convert *files* to PDFs (if needed) and merge them into one document.
 
@@ -57,6 +241,29 @@ def convert_and_merge_pdfs(
         document (mirroring :func:`pdf_tools.merge.service.merge_pdfs`).
     overwrite : `bool`, default ``False``
         When `True` overwrite output documents if they already exist.
+    xmlrpc_ports : :class:`Sequence[int]` | `None`, optional
+        XMLRPC ports of running :mod:`unoserver` listeners.  Word documents
+        are converted concurrently when more than one port is given.
+    in_memory : `bool`, default ``False``
+        Convert to PDF bytes and merge from memory instead of writing each
+        converted document to a temporary file.
+    cache : :class:`pdf_tools.convert.cache.ConversionCache` | `None`
+        Reuse earlier conversions of identical inputs.
+    image_workers : `int`, default ``1``
+        Number of processes used to render images.
+    image_options : :class:`pdf_tools.models.images.ImageOptions` | `None`
+        Downsample and recompress images before they are merged.
+    merge_backend : :data:`pdf_tools.merge.MergeBackend`, default ``"pypdf"``
+        Library that merges the converted PDFs; see
+        :func:`pdf_tools.merge.service.merge_pdfs`.
+    merge_workers : `int`, default ``1``
+        Processes that merge contiguous groups of the converted PDFs.
+    merge_dedupe : `bool`, default ``False``
+        Store streams shared by several converted PDFs (fonts, images)
+        once.
+    merge_profile : :data:`pdf_tools.merge.MergeProfile`, default ``"fast"``
+        How much to compress the merged PDF; see
+        :func:`pdf_tools.merge.service.merge_pdfs`.
 
     Returns
     -------
@@ -74,37 +281,106 @@ def convert_and_merge_pdfs(
     >>> final.name
     'bundle.pdf'
     """
-    converted: list[File] = []
-    temp_paths: list[Path] = []
-    for file in coerce_files(files):
-        if file.type.lower() == "pdf":
-            converted.append(file)
-            continue
-        try:
-            with NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
-                tmp_pdf.close()
-                temp_path = Path(tmp_pdf.name)
-                temp_paths.append(temp_path)
-                converted.append(
-                    convert_file_to_pdf(
-                        file,
-                        output_path=temp_path,
-                        overwrite=True,
-                    ),
-                )
-        except (RuntimeError, ValueError, OSError):
-            continue
-    if not converted:
-        for temp_path in temp_paths:
-            with suppress(OSError):
-                temp_path.unlink()
-        raise ValueError("No files successfully converted. Aborting merge.")
+    return _convert_and_merge(
+        files,
+        partial(
+            merge_pdfs,
+            output_path=Path(output_path),
+            set_bookmarks=set_bookmarks,
+            overwrite=overwrite,
+            backend=merge_backend,
+            workers=merge_workers,
+            dedupe=merge_dedupe,
+            profile=merge_profile,
+        ),
+        xmlrpc_ports,
+        in_memory,
+        cache,
+        image_workers,
+        image_options,
+    )
+
+
+def convert_and_merge_pdfs_to_stream(
+    files: FilesInput,
+    output: IO[bytes],
+    set_bookmarks: bool = False,
+    xmlrpc_ports: Sequence[int] | None = None,
+    in_memory: bool = False,
+    cache: ConversionCache | None = None,
+    image_workers: int = 1,
+    image_options: ImageOptions | None = None,
+    merge_backend: MergeBackend = "pypdf",
+    merge_workers: int = 1,
+    merge_dedupe: bool = False,
+    merge_profile: MergeProfile = "fast",
+) -> None:
+    """Convert *files* to PDFs and merge them into the binary stream *output*.
 
+    The parameters match :func:`convert_and_merge_pdfs`; the merge is
+    written by :func:`pdf_tools.merge.service.merge_pdfs_to_stream`.
+    Conversion progress is still reported on stdout, so redirect it (for
+    example with :func:`contextlib.redirect_stdout`) when *output* is
+    stdout itself.
+    """
+    _convert_and_merge(
+        files,
+        partial(
+            merge_pdfs_to_stream,
+            output=output,
+            set_bookmarks=set_bookmarks,
+            backend=merge_backend,
+            workers=merge_workers,
+            dedupe=merge_dedupe,
+            profile=merge_profile,
+        ),
+        xmlrpc_ports,
+        in_memory,
+        cache,
+        image_workers,
+        image_options,
+    )
+
+
+def _convert_and_merge(
+    files: FilesInput,
+    merge: Callable[[list[File | InMemoryPdf]], _T],
+    xmlrpc_ports: Sequence[int] | None,
+    in_memory: bool,
+    cache: ConversionCache | None,
+    image_workers: int,
+    image_options: ImageOptions | None,
+) -> _T:
+    segments = _segments(coerce_files(files), combine_images=cache is None)
+    temp_paths: list[Path] = []
+    outcomes: Sequence[File | bytes | SkippedFile]
     try:
-        return merge_pdfs(
-            converted, Path(output_path), set_bookmarks, overwrite=overwrite
+        if in_memory:
+            outcomes = convert_files_to_bytes(
+                _needs_conversion(segments),
+                xmlrpc_ports=xmlrpc_ports,
+                cache=cache,
+                image_workers=image_workers,
+                image_options=image_options,
+            )
+        else:
+            outcomes = convert_files_to_paths(
+                _temp_file_jobs(segments, temp_paths),
+                overwrite=True,
+                xmlrpc_ports=xmlrpc_ports,
+                cache=cache,
+                image_workers=image_workers,
+                image_options=image_options,
+            )
+        converted = _merge_inputs(
+            segments,
+            outcomes,
+            _convert_runs(_image_runs(segments), image_workers, image_options),
         )
+        if not converted:
+            raise ValueError(
+                "No files successfully converted. Aborting merge."
+            )
+        return merge(converted)
     finally:
-        for temp_path in temp_paths:
-            with suppress(OSError):
-                temp_path.unlink()
+        _remove_temp_files(temp_paths)
@@ -9,3 +9,28 @@ class Align(StrEnum):
     CENTER = "center"
     LEFT = "left"
     RIGHT = "right"
+
+
+class PageSizeName(StrEnum):
+    """CLI selection helper for the page a target DPI applies to."""
+
+    A3 = "a3"
+    A4 = "a4"
+    LETTER = "letter"
+    LEGAL = "legal"
+
+
+class MergeBackendName(StrEnum):
+    """CLI selection helper for the library that merges PDFs."""
+
+    PYPDF = "pypdf"
+    PYMUPDF = "pymupdf"
+    STREAM = "stream"
+
+
+class MergeProfileName(StrEnum):
+    """CLI selection helper for how much to compress merged PDFs."""
+
+    FAST = "fast"
+    COMPACT = "compact"
+    ARCHIVE = "archive"
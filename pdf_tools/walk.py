@@ -0,0 +1,85 @@
+"""Lazy directory walker shared by the folder commands.
+
+:func:`walk_files` yields :class:`pdf_tools.models.files.File` objects one
+at a time from :func:`os.scandir`, so conversion and merge services can
+start on the first file while the rest of a large archive is still being
+listed.  Only the entries of the directory currently being read are held
+in memory (they are sorted by name for a stable order).
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator, Sequence
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from pdf_tools.models.files import File
+
+__all__ = ["walk_files"]
+
+
+def _matches(name: str, relative: str, patterns: Sequence[str]) -> bool:
+    return any(
+        fnmatchcase(name, pattern) or fnmatchcase(relative, pattern)
+        for pattern in patterns
+    )
+
+
+def walk_files(
+    root: str | Path,
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+    max_depth: int | None = None,
+) -> Iterator[File]:
+    """Yield the files below *root*, depth-first in name order.
+
+    Parameters
+    ----------
+    root : `str` | :class:`Path`
+        Directory to walk.
+    include : :class:`Sequence[str]`, optional
+        Glob patterns a file must match to be yielded, e.g. ``"*.docx"``.
+        Patterns are tested against both the file name and the path
+        relative to *root* (``"/"``-separated).  Empty means every file.
+    exclude : :class:`Sequence[str]`, optional
+        Glob patterns for files *and* directories to skip; an excluded
+        directory is not descended into.
+    max_depth : `int` | `None`, optional
+        How many directory levels below *root* to descend.  ``0`` lists
+        only *root* itself; `None` walks the whole tree.
+
+    Yields
+    ------
+    File
+        One entry per matching regular file.  Symlinked directories are
+        not followed.
+    """
+    root = Path(root)
+    yield from _walk(root, root, include, exclude, max_depth, 0)
+
+
+def _walk(
+    root: Path,
+    directory: Path,
+    include: Sequence[str],
+    exclude: Sequence[str],
+    max_depth: int | None,
+    depth: int,
+) -> Iterator[File]:
+    with os.scandir(directory) as entries:
+        ordered = sorted(entries, key=lambda entry: entry.name)
+    for entry in ordered:
+        path = directory / entry.name
+        relative = path.relative_to(root).as_posix()
+        if _matches(entry.name, relative, exclude):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            if max_depth is None or depth < max_depth:
+                yield from _walk(
+                    root, path, include, exclude, max_depth, depth + 1
+                )
+        elif entry.is_file() and (
+            not include or _matches(entry.name, relative, include)
+        ):
+            yield File(path=path)
@@ -0,0 +1,34 @@
+"""Awaitable variant of the text watermark helper."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+
+from pdf_tools.models.watermark import WatermarkOptions, WatermarkResult
+from pdf_tools.watermark.service import (
+    add_text_watermark as _add_text_watermark,
+)
+
+__all__ = ["add_text_watermark"]
+
+
+async def add_text_watermark(
+    *,
+    src: str | Path,
+    dst: str | Path,
+    opts: WatermarkOptions,
+    executor: Executor | None = None,
+) -> WatermarkResult:
+    """Stamp a text watermark onto a PDF on *executor*.
+
+    Rendering runs on *executor* (the loop's default thread pool when
+    `None`); pass a bounded pool to cap concurrent jobs.  See
+    :func:`pdf_tools.watermark.service.add_text_watermark`.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, partial(_add_text_watermark, src=src, dst=dst, opts=opts)
+    )
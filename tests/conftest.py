@@ -6,6 +6,8 @@ import shutil
 from pathlib import Path
 
 import pytest
+from pypdf import PdfReader
+from pypdf.generic import Destination
 from reportlab.pdfgen import canvas
 
 from pdf_tools.models.files import File
@@ -20,6 +22,13 @@ def make_pdf(path: Path, pages: int = 1) -> None:  # pragma: no cover
     c.save()
 
 
+def top_outline(reader: PdfReader) -> list[Destination]:
+    """Return the outline of *reader*, which must have no nested items."""
+    items = reader.outline
+    assert all(isinstance(item, Destination) for item in items)
+    return [item for item in items if isinstance(item, Destination)]
+
+
 def libreoffice_available() -> bool:  # noqa: D401
     """Return True if a LibreOffice CLI tool is on $PATH."""
     return (
@@ -0,0 +1,125 @@
+"""Asyncio-native API tests."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from PIL import Image
+from pypdf import PdfReader
+
+from pdf_tools import aio
+from pdf_tools.convert import aio as convert_aio
+from pdf_tools.models.files import File
+from tests.conftest import make_pdf
+
+
+def test_image_batch_keeps_order_and_skips(tmp_path: Path) -> None:
+    """Awaitable batches mirror the blocking result, in input order."""
+    images = [tmp_path / f"pic{i}.png" for i in range(4)]
+    for image in images:
+        Image.new("RGB", (6, 6), (0, 0, 255)).save(image)
+    notes = tmp_path / "notes.txt"
+    notes.write_text("x")
+    out = tmp_path / "out"
+    out.mkdir()
+
+    result = asyncio.run(
+        aio.convert_files_to_pdfs(
+            [images[0], notes, *images[1:]],
+            output_dir=out,
+            max_concurrency=2,
+        )
+    )
+
+    assert [f.path for f in result.converted] == [
+        out / f"pic{i}.pdf" for i in range(4)
+    ]
+    assert [s.path for s in result.skipped] == [notes]
+
+
+def test_convert_and_merge(tmp_path: Path) -> None:
+    """Conversion and merge run end to end from a coroutine."""
+    pdf = tmp_path / "source.pdf"
+    image = tmp_path / "image.png"
+    out = tmp_path / "merged.pdf"
+    make_pdf(pdf, pages=2)
+    Image.new("RGB", (10, 10), (255, 0, 0)).save(image)
+
+    for in_memory in (False, True):
+        result = asyncio.run(
+            aio.convert_and_merge_pdfs(
+                [image, pdf],
+                output_path=out,
+                overwrite=True,
+                in_memory=in_memory,
+            )
+        )
+        assert result.path == out
+        assert len(PdfReader(out).pages) == 3
+
+
+def test_merge_accepts_generators(
+    sample_pdfs: list[File], tmp_path: Path
+) -> None:
+    """Lazy inputs are collected before being handed to the executor."""
+    out = tmp_path / "merged.pdf"
+
+    asyncio.run(aio.merge_pdfs((f for f in sample_pdfs), out))
+
+    assert len(PdfReader(out).pages) == 6
+
+
+def test_cancellation_kills_unoconvert(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Cancelling a call does not leave its child process running."""
+    spawned: list[asyncio.subprocess.Process] = []
+    create = asyncio.create_subprocess_exec
+
+    async def _spawn(*args: Any, **kwargs: Any) -> Any:
+        spawned.append(await create(*args, **kwargs))
+        return spawned[-1]
+
+    monkeypatch.setattr(convert_aio, "_UNOCONVERT_CMD", sys.executable)
+    monkeypatch.setattr(convert_aio.asyncio, "create_subprocess_exec", _spawn)
+
+    async def _run() -> None:
+        task = asyncio.create_task(
+            convert_aio._unoconvert(["-c", "import time; time.sleep(30)"])
+        )
+        while not spawned:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_run())
+
+    assert spawned[0].returncode is not None
+
+
+def test_cancellation_terminates_image_workers() -> None:
+    """An aborted batch stops the image worker that is still rendering."""
+
+    async def _run() -> int:
+        loop = asyncio.get_running_loop()
+        with pytest.raises(asyncio.CancelledError):
+            async with convert_aio._batch_workers(None, 2, None) as workers:
+                pid = await loop.run_in_executor(workers.executor, os.getpid)
+                workers.executor.submit(time.sleep, 30)
+                raise asyncio.CancelledError
+        return pid
+
+    pid = asyncio.run(_run())
+
+    deadline = time.monotonic() + 10
+    while pid in {p.pid for p in multiprocessing.active_children()}:
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
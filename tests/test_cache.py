@@ -0,0 +1,189 @@
+"""Content-addressed conversion cache."""
+
+from __future__ import annotations
+
+import importlib
+import os
+from functools import partial
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from pdf_tools.convert import cache as cache_module
+from pdf_tools.convert import service
+from pdf_tools.convert.cache import ConversionCache
+from pdf_tools.models.files import File
+
+
+def _image(path: Path, colour: tuple[int, int, int]) -> Path:
+    Image.new("RGB", (20, 20), colour).save(path, "PNG")
+    return path
+
+
+def test_keys_depend_on_content_and_converter(tmp_path: Path) -> None:
+    """Identical bytes share a key unless the converter differs."""
+    first = tmp_path / "a.bin"
+    second = tmp_path / "b.bin"
+    first.write_bytes(b"same content")
+    second.write_bytes(b"same content")
+
+    key = ConversionCache.key_for_path(first, "image")
+    assert ConversionCache.key_for_path(second, "image") == key
+    assert ConversionCache.key_for_bytes(b"same content", "image") == key
+    assert ConversionCache.key_for_path(first, "word") != key
+
+
+def test_batch_hashes_each_image_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Looking images up ahead for the render pool does not rehash them."""
+    images = [_image(tmp_path / f"{n}.png", (n, 0, 0)) for n in range(3)]
+    hashed: list[Path] = []
+    content_digest = cache_module._content_digest
+
+    def _spy(path: Path) -> object:
+        hashed.append(Path(path))
+        return content_digest(path)
+
+    monkeypatch.setattr(cache_module, "_content_digest", _spy)
+    (tmp_path / "out").mkdir()
+    # test_convert re-executes the service module; the render pool pickles
+    # functions by their sys.modules entry.
+    current = importlib.import_module("pdf_tools.convert.service")
+
+    result = current.convert_files_to_pdfs(
+        images,
+        output_dir=tmp_path / "out",
+        cache=ConversionCache(tmp_path / "cache"),
+        image_workers=2,
+    )
+
+    assert len(result.converted) == 3
+    assert sorted(hashed) == images
+
+
+def test_changed_file_is_hashed_again(tmp_path: Path) -> None:
+    """A remembered hash is dropped once the file changes."""
+    cache = ConversionCache(tmp_path / "cache")
+    source = tmp_path / "a.bin"
+    source.write_bytes(b"first")
+    first = cache.key_for_file(source, "image")
+
+    source.write_bytes(b"second!")
+
+    assert cache.key_for_file(source, "image") != first
+    assert cache.key_for_file(source, "image") == (
+        ConversionCache.key_for_path(source, "image")
+    )
+
+
+def test_repeated_input_is_served_from_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A second conversion of identical content skips the converter."""
+    cache = ConversionCache(tmp_path / "cache")
+    source = _image(tmp_path / "logo.png", (255, 0, 0))
+    copy = tmp_path / "copy"
+    copy.mkdir()
+    _image(copy / "logo.png", (255, 0, 0))
+
+    (tmp_path / "out1").mkdir()
+    first = service.convert_files_to_pdfs(
+        [source], output_dir=tmp_path / "out1", cache=cache
+    )
+    assert (first.cache_hits, first.cache_misses) == (0, 1)
+
+    def fail(*_: object, **__: object) -> bytes:
+        raise AssertionError("converter should not run on a cache hit")
+
+    monkeypatch.setattr(service, "_image_to_pdf_bytes", fail)
+    (tmp_path / "out2").mkdir()
+    second = service.convert_files_to_pdfs(
+        [copy / "logo.png"], output_dir=tmp_path / "out2", cache=cache
+    )
+
+    assert (second.cache_hits, second.cache_misses) == (1, 0)
+    produced = second.converted[0].path
+    assert produced == tmp_path / "out2" / "logo.pdf"
+    assert produced.read_bytes() == first.converted[0].path.read_bytes()
+
+
+def test_bytes_conversion_uses_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """In-memory conversions share the cache with path conversions."""
+    cache = ConversionCache(tmp_path / "cache")
+    source = _image(tmp_path / "logo.png", (0, 255, 0))
+    (first,) = service.convert_files_to_bytes([source], cache=cache)
+
+    monkeypatch.setattr(service, "_image_to_pdf_bytes", None)
+    (second,) = service.convert_files_to_bytes([source], cache=cache)
+
+    assert second == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    """Stores beyond *max_bytes* drop the oldest entries first."""
+    cache = ConversionCache(tmp_path / "cache", max_bytes=25)
+    cache.store_bytes("aa01", b"x" * 10)
+    cache.store_bytes("bb02", b"y" * 10)
+    old = cache.directory / "aa" / "aa01.pdf"
+    os.utime(old, (0, 0))
+    assert cache.fetch_bytes("bb02") == b"y" * 10
+
+    cache.store_bytes("cc03", b"z" * 10)
+
+    assert cache.fetch_bytes("aa01") is None
+    assert cache.fetch_bytes("bb02") == b"y" * 10
+    assert cache.fetch_bytes("cc03") == b"z" * 10
+
+
+def test_restoring_a_key_counts_only_the_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Replacing an entry does not inflate the size or trigger eviction."""
+    cache = ConversionCache(tmp_path / "cache", max_bytes=25)
+
+    def _no_evict() -> None:
+        raise AssertionError("cache is within its limit")
+
+    monkeypatch.setattr(cache, "_evict", _no_evict)
+    for _ in range(5):
+        cache.store_bytes("aa01", b"x" * 10)
+    cache.store_bytes("aa01", b"x" * 12)
+
+    assert cache._size == 12
+
+
+def test_word_entries_expire_with_the_libreoffice_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Upgrading LibreOffice turns cached Word PDFs into misses."""
+    converted: list[str] = []
+
+    def _fake_word(
+        file: File,
+        output_path: Path,
+        overwrite: bool = False,
+        xmlrpc_port: int = 2003,
+    ) -> File:
+        converted.append(file.name)
+        Path(output_path).write_bytes(b"%PDF-1.4 fake")
+        return File(path=output_path)
+
+    monkeypatch.setattr(service, "convert_word_to_pdf", _fake_word)
+    cache = ConversionCache(tmp_path / "cache")
+    memo = tmp_path / "memo.docx"
+    memo.write_bytes(b"word document")
+
+    for version in ("LibreOffice 7.6", "LibreOffice 7.6", "LibreOffice 24.2"):
+        monkeypatch.setattr(
+            service, "_libreoffice_version", partial(str, version)
+        )
+        service.convert_files_to_pdfs(
+            [memo], output_dir=tmp_path, overwrite=True, cache=cache
+        )
+
+    assert converted == ["memo.docx", "memo.docx"]
@@ -3,21 +3,27 @@
 from __future__ import annotations
 
 import importlib
+import os
 import sys
+import threading
 import types
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Final
 
 import pytest
 from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
-from PIL import Image
+from PIL import Image, ImageChops, PngImagePlugin, TiffImagePlugin
+from pypdf import PdfReader
 
+from pdf_tools.convert import manifest
 from pdf_tools.convert.service import convert_file_to_pdf
 from pdf_tools.convert.unoserver_ctx import (
     unoserver_listener,
 )
-from pdf_tools.models.files import File
+from pdf_tools.models.files import File, SkippedFile
+from pdf_tools.models.images import ImageOptions
 from tests.conftest import libreoffice_available
 
 requires_libreoffice = pytest.mark.skipif(
@@ -138,7 +144,10 @@ def test_word_directory_output(tmp_path: Path, stub_subprocess: None) -> None:
 
     with unoserver_listener():
         result = service.convert_word_to_pdf(
-            File(path=src), output_path=out_dir, overwrite=True
+            File(path=src),
+            output_path=out_dir,
+            overwrite=True,
+            backend="unoconvert",
         )
     assert result.path == out_dir / "x.pdf"  # covers 116
 
@@ -150,7 +159,9 @@ def test_word_default_path(tmp_path: Path, stub_subprocess: None) -> None:
     src = tmp_path / "y.docx"
     src.touch()
     with unoserver_listener():
-        result = service.convert_word_to_pdf(File(path=src), overwrite=True)
+        result = service.convert_word_to_pdf(
+            File(path=src), overwrite=True, backend="unoconvert"
+        )
     assert result.path == src.with_suffix(".pdf")  # covers 121
 
 
@@ -217,7 +228,9 @@ def test_word_subprocess_failure(
 
     with pytest.raises(RuntimeError):
         with unoserver_listener():
-            service.convert_word_to_pdf(File(path=src), overwrite=True)
+            service.convert_word_to_pdf(
+                File(path=src), overwrite=True, backend="unoconvert"
+            )
 
 
 def test_image_directory_output(tmp_image: File, tmp_path: Path) -> None:
@@ -302,6 +315,86 @@ def test_image_rgb_conversion(
     assert called["converted"] is True
 
 
+def test_jpeg_bytes_embedded_verbatim(tmp_path: Path) -> None:
+    """Baseline JPEGs are passed through without re-encoding."""
+    jpeg = tmp_path / "photo.jpg"
+    Image.new("RGB", (40, 30), (10, 200, 30)).save(jpeg, "JPEG")
+
+    pdf = service.convert_image_to_pdf(File(path=jpeg))
+
+    assert jpeg.read_bytes() in pdf.path.read_bytes()
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L", "P"])
+def test_embeddable_png_skips_reencode(
+    tmp_path: Path, mode: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Alpha-free PNGs never go through the Pillow re-encode."""
+    png = tmp_path / "plain.png"
+    Image.new(mode, (16, 16)).save(png, "PNG")
+
+    def _fail(*_a: Any, **_k: Any) -> None:
+        raise AssertionError("image was re-encoded")
+
+    monkeypatch.setattr(Image.Image, "save", _fail)
+    pdf = service.convert_image_to_pdf(File(path=png))
+    assert pdf.path.stat().st_size > 0
+
+
+@pytest.mark.parametrize("mode", ["1", "RGB", "RGBA"])
+def test_multipage_tiff_keeps_every_frame(tmp_path: Path, mode: str) -> None:
+    """Each TIFF frame becomes its own PDF page."""
+    tiff = tmp_path / "scan.tiff"
+    frames = [Image.new(mode, (20 + i, 30)) for i in range(3)]
+    frames[0].save(tiff, save_all=True, append_images=frames[1:])
+
+    pdf = service.convert_image_to_pdf(File(path=tiff))
+
+    reader = PdfReader(pdf.path)
+    assert len(reader.pages) == 3
+    widths = [float(page.mediabox.width) for page in reader.pages]
+    assert widths == sorted(widths)
+    assert len(set(widths)) == 3
+
+
+def test_multipage_tiff_writes_each_frame_before_the_next(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Frames are encoded and written to the PDF one at a time."""
+    tiff = tmp_path / "scan.tiff"
+    frames = [Image.new("L", (20, 30)) for _ in range(3)]
+    frames[0].save(tiff, save_all=True, append_images=frames[1:])
+    events: list[str] = []
+    frame_page = service._frame_page
+    append = service.PdfStreamWriter.append
+
+    def _encode(*args: Any) -> Any:
+        events.append("encode")
+        return frame_page(*args)
+
+    def _write(self: Any, *args: Any) -> Any:
+        events.append("write")
+        return append(self, *args)
+
+    monkeypatch.setattr(service, "_frame_page", _encode)
+    monkeypatch.setattr(service.PdfStreamWriter, "append", _write)
+
+    service.convert_image_to_pdf(File(path=tiff))
+
+    assert events == ["encode", "write"] * 3
+
+
+def test_transparent_png_is_normalised(tmp_path: Path) -> None:
+    """PNGs with an alpha channel still convert via RGB."""
+    png = tmp_path / "alpha.png"
+    Image.new("RGBA", (16, 16), (0, 0, 255, 100)).save(png, "PNG")
+
+    with Image.open(png) as image:
+        assert service._is_embeddable(image) is False
+    pdf = service.convert_image_to_pdf(File(path=png))
+    assert pdf.path.stat().st_size > 0
+
+
 @requires_libreoffice
 @pytest.mark.slow
 def test_dispatch_to_word(
@@ -446,3 +539,555 @@ def test_listener_with_custom_soffice(
     assert (
         "--soffice" in captured["cmd"] and str(good_soffice) in captured["cmd"]
     )
+
+
+def test_pool_ports_are_distinct_pairs() -> None:
+    """Each worker gets its own UNO/XMLRPC port pair."""
+    assert unoserver_ctx.pool_ports(3) == [
+        (2002, 2003),
+        (2004, 2005),
+        (2006, 2007),
+    ]
+    with pytest.raises(ValueError):
+        unoserver_ctx.pool_ports(2, uno_port=2002, xmlrpc_port=2004)
+    with pytest.raises(ValueError):
+        unoserver_ctx.pool_ports(0)
+
+
+def test_pool_starts_one_listener_per_worker(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``unoserver_pool`` launches N listeners and yields their ports."""
+    monkeypatch.setattr(
+        unoserver_ctx, "_UNOSERVER_CMD", "/usr/bin/unoserver", raising=True
+    )
+    monkeypatch.setattr(
+        unoserver_ctx, "_wait_until_port_listens", lambda *_a, **_kw: None
+    )
+    commands: list[list[str]] = []
+    stopped: list[bool] = []
+
+    class DummyProc:  # noqa: D101
+        def terminate(self) -> None:
+            stopped.append(True)
+
+        def wait(self, timeout: int | None = None) -> None:
+            return None
+
+    def _fake_popen(cmd: list[str], **_kw: Any) -> DummyProc:
+        commands.append(cmd)
+        return DummyProc()
+
+    monkeypatch.setattr(unoserver_ctx.subprocess, "Popen", _fake_popen)
+
+    with unoserver_ctx.unoserver_pool(2) as ports:
+        assert ports == [2003, 2005]
+
+    assert [cmd[cmd.index("--uno-port") + 1] for cmd in commands] == [
+        "2002",
+        "2004",
+    ]
+    assert len(stopped) == 2
+
+
+def test_pooled_word_conversion_keeps_input_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Word jobs run across listeners but results stay in input order."""
+    used_ports: set[int] = set()
+
+    def _fake_word(
+        file: File,
+        output_path: Path,
+        overwrite: bool = False,
+        xmlrpc_port: int = 2003,
+    ) -> File:
+        used_ports.add(xmlrpc_port)
+        if file.name.startswith("bad"):
+            raise RuntimeError("boom")
+        return File(path=output_path)
+
+    monkeypatch.setattr(service, "convert_word_to_pdf", _fake_word)
+    image = tmp_path / "pic.png"
+    Image.new("RGB", (10, 10)).save(image)
+    inputs = [tmp_path / f"doc{i}.docx" for i in range(6)]
+    inputs.insert(2, image)
+    inputs.insert(4, tmp_path / "bad.docx")
+
+    result = service.convert_files_to_pdfs(
+        inputs, output_dir=tmp_path, xmlrpc_ports=[2003, 2005, 2007]
+    )
+
+    expected = [p.with_suffix(".pdf") for p in inputs if p.stem != "bad"]
+    assert [f.path for f in result.converted] == expected
+    assert [s.path for s in result.skipped] == [tmp_path / "bad.docx"]
+    assert used_ports <= {2003, 2005, 2007}
+
+
+def _gated_word(gates: dict[str, threading.Event]) -> Any:
+    def _fake_word(
+        file: File,
+        output_path: Path,
+        overwrite: bool = False,
+        xmlrpc_port: int = 2003,
+    ) -> File:
+        gates[file.name].wait(timeout=5)
+        if file.name.startswith("bad"):
+            raise RuntimeError("boom")
+        return File(path=output_path)
+
+    return _fake_word
+
+
+def test_iter_convert_files_yields_in_completion_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A slow first document does not hold back later results."""
+    gates = {name: threading.Event() for name in ("slow.docx", "fast.docx")}
+    gates["fast.docx"].set()
+    monkeypatch.setattr(service, "convert_word_to_pdf", _gated_word(gates))
+
+    events = service.iter_convert_files(
+        [tmp_path / "slow.docx", tmp_path / "fast.docx"],
+        output_dir=tmp_path,
+        xmlrpc_ports=[2003, 2005],
+    )
+    first = next(events)
+    gates["slow.docx"].set()
+    rest = list(events)
+
+    assert (first.index, first.source.name) == (1, "fast.docx")
+    assert first.converted
+    assert [event.index for event in rest] == [0]
+
+
+def test_iter_convert_files_ordered_and_lazy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ordered events follow the input; input is read only as needed."""
+    names = ["a.docx", "bad.docx", "c.docx", "d.docx", "e.docx"]
+    gates = {name: threading.Event() for name in names}
+    for gate in gates.values():
+        gate.set()
+    monkeypatch.setattr(service, "convert_word_to_pdf", _gated_word(gates))
+    pulled: list[str] = []
+
+    def _inputs() -> Iterator[Path]:
+        for name in names:
+            pulled.append(name)
+            yield tmp_path / name
+
+    events = service.iter_convert_files(
+        _inputs(),
+        output_dir=tmp_path,
+        xmlrpc_ports=[2003, 2005],
+        ordered=True,
+        max_in_flight=2,
+    )
+    first = next(events)
+    assert first.index == 0
+    assert len(pulled) <= 3
+
+    rest = list(events)
+    assert [event.index for event in rest] == [1, 2, 3, 4]
+    skipped = rest[0].outcome
+    assert isinstance(skipped, SkippedFile)
+    assert skipped.path == tmp_path / "bad.docx"
+    assert all(event.converted for event in rest[1:])
+
+
+def test_wait_until_port_listens_backs_off(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Polling starts fast and doubles its delay between probes."""
+    probes = iter([False, False, False, True])
+    delays: list[float] = []
+    monkeypatch.setattr(
+        unoserver_ctx, "_port_is_open", lambda _p: next(probes)
+    )
+    monkeypatch.setattr(unoserver_ctx.time, "sleep", delays.append)
+
+    unoserver_ctx._wait_until_port_listens(port=9999, timeout=10)
+
+    assert delays == pytest.approx([0.05, 0.1, 0.2], rel=0.05)
+
+
+def test_assert_ready_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A successful probe is reused for subsequent files."""
+    waits: list[int] = []
+    monkeypatch.setattr(unoserver_ctx.shutil, "which", lambda _: "/bin/x")
+    monkeypatch.setattr(
+        unoserver_ctx,
+        "_wait_until_port_listens",
+        lambda port, _timeout: waits.append(port),
+    )
+    monkeypatch.setattr(unoserver_ctx, "_ready_since", {})
+
+    for _ in range(3):
+        unoserver_ctx.assert_office_ready(4321)
+
+    assert waits == [4321]
+
+
+def test_recover_office_restarts_dead_listener(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A managed listener whose process exited is started again."""
+
+    class DummyProc:  # noqa: D101
+        def __init__(self, returncode: int | None) -> None:
+            self.returncode = returncode
+
+        def poll(self) -> int | None:
+            return self.returncode
+
+        def terminate(self) -> None:
+            return None
+
+        def wait(self, timeout: int | None = None) -> None:
+            return None
+
+    procs = iter([DummyProc(1), DummyProc(None)])
+    monkeypatch.setattr(
+        unoserver_ctx, "_start_unoserver", lambda _c: next(procs)
+    )
+    monkeypatch.setattr(
+        unoserver_ctx, "_wait_until_port_listens", lambda *_a: None
+    )
+    monkeypatch.setattr(unoserver_ctx, "_port_is_open", lambda _p: True)
+    listener = unoserver_ctx._ManagedListener(["unoserver"], 4323)
+    monkeypatch.setitem(unoserver_ctx._listeners, 4323, listener)
+
+    assert unoserver_ctx.recover_office(4323) is True
+    assert listener.restarts == 1
+    assert unoserver_ctx.recover_office(4323) is False
+
+
+def test_word_conversion_retries_after_crash(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The in-flight document is retried once the listener is back."""
+    attempts: list[int] = []
+
+    def _flaky(_src: Path, dst: Path, port: int) -> None:
+        attempts.append(port)
+        if len(attempts) == 1:
+            raise RuntimeError("connection reset")
+        dst.write_bytes(b"%PDF-")
+
+    monkeypatch.setattr(service, "assert_office_ready", lambda *_a, **_k: None)
+    monkeypatch.setattr(service, "_run_xmlrpc", _flaky)
+    monkeypatch.setattr(service, "recover_office", lambda _port: True)
+    src = tmp_path / "memo.docx"
+    src.touch()
+
+    result = service.convert_word_to_pdf(src, xmlrpc_port=4325)
+
+    assert attempts == [4325, 4325]
+    assert result.path.read_bytes() == b"%PDF-"
+
+
+def test_incremental_folder_skips_unchanged_sources(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only new or modified sources are converted on the next run."""
+    src = tmp_path / "src"
+    out = tmp_path / "out"
+    src.mkdir()
+    out.mkdir()
+    Image.new("RGB", (10, 10), (255, 0, 0)).save(src / "a.png")
+    Image.new("RGB", (10, 10), (0, 255, 0)).save(src / "b.png")
+
+    first = service.convert_folder_to_pdfs(src, out, incremental=True)
+    assert sorted(f.name for f in first.converted) == ["a.pdf", "b.pdf"]
+    assert (out / ".pdf-tools-manifest.json").is_file()
+
+    Image.new("RGB", (12, 12), (0, 0, 255)).save(src / "b.png")
+    hashed: list[Path] = []
+    real_sha256 = manifest.file_sha256
+
+    def _spy(path: Path) -> str:
+        hashed.append(path)
+        return real_sha256(path)
+
+    monkeypatch.setattr(manifest, "file_sha256", _spy)
+    second = service.convert_folder_to_pdfs(src, out, incremental=True)
+
+    assert [f.name for f in second.converted] == ["b.pdf"]
+    assert [f.name for f in second.unchanged] == ["a.pdf"]
+    assert second.skipped == []
+    assert src / "a.png" not in [p.resolve() for p in hashed]
+
+
+def test_incremental_folder_reconverts_when_image_options_change(
+    tmp_path: Path,
+) -> None:
+    """Outputs made with other image settings are not considered current."""
+    src = tmp_path / "src"
+    src.mkdir()
+    Image.new("RGB", (10, 10)).save(src / "a.png")
+    service.convert_folder_to_pdfs(src, tmp_path, incremental=True)
+
+    options = ImageOptions(jpeg_quality=70)
+    first = service.convert_folder_to_pdfs(
+        src, tmp_path, incremental=True, image_options=options
+    )
+    second = service.convert_folder_to_pdfs(
+        src, tmp_path, incremental=True, image_options=options
+    )
+
+    assert [f.name for f in first.converted] == ["a.pdf"]
+    assert [f.name for f in second.unchanged] == ["a.pdf"]
+
+
+def test_incremental_folder_ignores_touch_only_changes(
+    tmp_path: Path,
+) -> None:
+    """A new mtime with identical content does not trigger conversion."""
+    src = tmp_path / "src"
+    src.mkdir()
+    image = src / "a.png"
+    Image.new("RGB", (10, 10)).save(image)
+    service.convert_folder_to_pdfs(src, tmp_path, incremental=True)
+
+    stat = image.stat()
+    os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    result = service.convert_folder_to_pdfs(src, tmp_path, incremental=True)
+
+    assert result.converted == []
+    assert [f.name for f in result.unchanged] == ["a.pdf"]
+
+
+def test_incremental_folder_adopts_fresh_outputs(tmp_path: Path) -> None:
+    """Outputs newer than their source count as done on the first run."""
+    src = tmp_path / "src"
+    src.mkdir()
+    Image.new("RGB", (10, 10)).save(src / "a.png")
+    service.convert_folder_to_pdfs(src, tmp_path)
+
+    result = service.convert_folder_to_pdfs(src, tmp_path, incremental=True)
+
+    assert result.converted == []
+    assert [f.name for f in result.unchanged] == ["a.pdf"]
+
+
+def test_recursive_folder_mirrors_subfolders(tmp_path: Path) -> None:
+    """Recursive conversion writes PDFs into matching output subfolders."""
+    src = tmp_path / "src"
+    (src / "nested").mkdir(parents=True)
+    Image.new("RGB", (10, 10)).save(src / "top.png")
+    Image.new("RGB", (10, 10)).save(src / "nested" / "inner.png")
+    Image.new("RGB", (10, 10)).save(src / "nested" / "skip.jpg")
+    out = tmp_path / "out"
+    out.mkdir()
+
+    flat = service.convert_folder_to_pdfs(src, out)
+    assert [f.path for f in flat.converted] == [out / "top.pdf"]
+
+    result = service.convert_folder_to_pdfs(
+        src, out, overwrite=True, recursive=True, exclude=["*.jpg"]
+    )
+
+    assert [f.path for f in result.converted] == [
+        out / "nested" / "inner.pdf",
+        out / "top.pdf",
+    ]
+    assert result.skipped == []
+
+
+def test_folder_starts_office_before_first_word_document(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``start_office`` runs once, only when a Word document is reached."""
+    events: list[str] = []
+
+    def _fake_word(
+        file: File,
+        output_path: Path,
+        overwrite: bool = False,
+        xmlrpc_port: int = 2003,
+    ) -> File:
+        events.append(file.name)
+        return File(path=output_path)
+
+    monkeypatch.setattr(service, "convert_word_to_pdf", _fake_word)
+    src = tmp_path / "src"
+    src.mkdir()
+    Image.new("RGB", (10, 10)).save(src / "a.png")
+    service.convert_folder_to_pdfs(
+        src, tmp_path, start_office=lambda: events.append("start")
+    )
+    assert events == []
+
+    (src / "b.docx").touch()
+    (src / "c.docx").touch()
+    service.convert_folder_to_pdfs(
+        src,
+        tmp_path,
+        overwrite=True,
+        start_office=lambda: events.append("start"),
+    )
+    assert events == ["start", "b.docx", "c.docx"]
+
+
+def _embedded_image(pdf: Path, page: int = 0) -> Any:
+    resources: Any = PdfReader(pdf).pages[page]["/Resources"]
+    return next(iter(resources["/XObject"].values())).get_object()
+
+
+def test_target_dpi_downsamples_large_photos(tmp_path: Path) -> None:
+    """An oversized JPEG is shrunk to fit the page at the requested DPI."""
+    photo = tmp_path / "photo.jpg"
+    Image.effect_noise((2400, 1800), 64).convert("RGB").save(photo, quality=95)
+    full = service.convert_image_to_pdf(photo, tmp_path / "full.pdf")
+
+    small = service.convert_image_to_pdf(
+        photo,
+        tmp_path / "small.pdf",
+        options=ImageOptions(dpi=72, page_size="a4"),
+    )
+
+    image = _embedded_image(small.path)
+    assert (image["/Width"], image["/Height"]) == (794, 595)
+    assert image["/Filter"] == "/DCTDecode"
+    box = PdfReader(small.path).pages[0].mediabox
+    assert round(float(box.width)) == 794
+    assert small.path.stat().st_size < full.path.stat().st_size / 2
+
+
+def test_jpeg_quality_recompresses_lossless_images(tmp_path: Path) -> None:
+    """A quality setting re-encodes images that would be kept as PNG."""
+    image = tmp_path / "scan.png"
+    Image.new("RGBA", (40, 30), (10, 200, 30, 255)).save(image)
+
+    result = service.convert_image_to_pdf(
+        image, options=ImageOptions(jpeg_quality=60)
+    )
+
+    embedded = _embedded_image(result.path)
+    assert embedded["/Filter"] == "/DCTDecode"
+    assert (embedded["/Width"], embedded["/Height"]) == (40, 30)
+
+
+def test_target_dpi_applies_to_every_tiff_frame(tmp_path: Path) -> None:
+    """Multi-page TIFFs are downsampled frame by frame."""
+    tiff = tmp_path / "fax.tiff"
+    frames = [Image.new("1", (3400, 2200), 1) for _ in range(2)]
+    frames[0].save(tiff, save_all=True, append_images=frames[1:])
+
+    result = service.convert_image_to_pdf(
+        tiff, options=ImageOptions(dpi=50, page_size="letter")
+    )
+
+    for page in range(2):
+        image = _embedded_image(result.path, page)
+        assert (image["/Width"], image["/Height"]) == (550, 356)
+
+
+def test_images_to_one_pdf_keeps_pages_and_outline(tmp_path: Path) -> None:
+    """A run of images becomes one PDF with a bookmark per image."""
+    photo = tmp_path / "photo.jpg"
+    scan = tmp_path / "scan.tiff"
+    broken = tmp_path / "broken.png"
+    Image.new("RGB", (40, 30), (0, 128, 255)).save(photo)
+    frames = [Image.new("L", (20, 20), shade) for shade in (0, 128, 255)]
+    frames[0].save(scan, save_all=True, append_images=frames[1:])
+    broken.write_bytes(b"not an image")
+
+    document, skipped = service.convert_images_to_one_pdf(
+        [File(path=photo, bookmark_name="Photo"), broken, scan]
+    )
+
+    assert document is not None
+    assert document.outline == [("Photo", 0), ("scan.tiff", 1)]
+    out = tmp_path / "run.pdf"
+    out.write_bytes(document.data)
+    assert len(PdfReader(out).pages) == 4
+    assert _embedded_image(out).get_data() == photo.read_bytes()
+    assert [item.path for item in skipped] == [broken]
+
+
+def test_memory_limit_decodes_large_tiffs_in_strips(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """TIFFs over the memory limit are never decoded whole."""
+    plot = tmp_path / "plot.tiff"
+    source = Image.effect_noise((1200, 1000), 64).convert("RGB")
+    source.save(plot, compression="tiff_adobe_deflate", dpi=(300, 300))
+
+    def _no_full_decode(*_a: Any, **_kw: Any) -> None:
+        raise AssertionError("decoded the whole TIFF")
+
+    monkeypatch.setattr(TiffImagePlugin.TiffImageFile, "load", _no_full_decode)
+    out = service.convert_image_to_pdf(
+        plot, tmp_path / "plot.pdf", options=ImageOptions(max_memory_mb=1)
+    )
+
+    page = PdfReader(out.path).pages[0]
+    assert round(float(page.mediabox.width)) == 288  # 1200 px at 300 DPI
+    embedded = page.images[0].image
+    assert embedded is not None
+    assert ImageChops.difference(embedded, source).getbbox() is None
+
+
+def test_memory_limit_embeds_large_pngs_undecoded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Large PNGs are embedded without Pillow decoding their pixels."""
+    scan = tmp_path / "scan.png"
+    Image.effect_noise((1200, 1000), 64).convert("L").save(scan)
+
+    def _no_decode(*_a: Any, **_kw: Any) -> None:
+        raise AssertionError("decoded the PNG")
+
+    monkeypatch.setattr(PngImagePlugin.PngImageFile, "load", _no_decode)
+    out = service.convert_image_to_pdf(
+        scan, tmp_path / "scan.pdf", options=ImageOptions(max_memory_mb=1)
+    )
+
+    assert _embedded_image(out.path)["/Width"] == 1200
+
+
+def test_memory_limit_decodes_jpegs_at_reduced_scale(tmp_path: Path) -> None:
+    """JPEGs that must be re-encoded use DCT scaling to fit the limit."""
+    photo = tmp_path / "photo.jpg"
+    Image.effect_noise((2000, 1600), 64).convert("RGB").save(photo)
+
+    out = service.convert_image_to_pdf(
+        photo,
+        tmp_path / "photo.pdf",
+        options=ImageOptions(jpeg_quality=80, max_memory_mb=1),
+    )
+
+    assert _embedded_image(out.path)["/Width"] == 500
+    page = PdfReader(out.path).pages[0]
+    assert round(float(page.mediabox.width)) == 1500  # unchanged page size
+
+
+def test_memory_limit_checks_the_size_jpegs_decode_at(
+    tmp_path: Path,
+) -> None:
+    """Odd sizes round up when decoded and still fit the limit."""
+    photo = tmp_path / "photo.jpg"
+    Image.effect_noise((2001, 1601), 64).convert("RGB").save(photo)
+    with Image.open(photo) as image:
+        image.draft(None, service._draft_size(image, None, service._MB))
+        assert image.size == (501, 401)
+        assert len(image.tobytes()) <= service._MB
+
+
+def test_max_pixels_skips_oversized_images(tmp_path: Path) -> None:
+    """Images over the pixel limit are skipped before decoding."""
+    small = tmp_path / "small.png"
+    large = tmp_path / "large.png"
+    Image.new("RGB", (10, 10)).save(small)
+    Image.new("RGB", (100, 100)).save(large)
+
+    result = service.convert_files_to_pdfs(
+        [small, large],
+        output_dir=tmp_path,
+        image_options=ImageOptions(max_pixels=1000),
+    )
+
+    assert [file.name for file in result.converted] == ["small.pdf"]
+    assert "10000 pixels" in result.skipped[0].reason
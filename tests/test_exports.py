@@ -12,6 +12,7 @@ def test_top_level_exports() -> None:
         convert_file_to_pdf,
         convert_files_to_pdfs,
         merge_pdfs,
+        merge_pdfs_to_bytes,
     )
 
     assert File is not None
@@ -20,6 +21,7 @@ def test_top_level_exports() -> None:
     assert convert_file_to_pdf is not None
     assert convert_files_to_pdfs is not None
     assert merge_pdfs is not None
+    assert merge_pdfs_to_bytes is not None
 
 
 def test_watermark_package_exports() -> None:
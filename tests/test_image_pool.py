@@ -0,0 +1,89 @@
+"""Process-pool image rendering."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from pypdf import PdfReader
+
+from pdf_tools.convert.image_pool import ImageRenderPool, image_render_pool
+from pdf_tools.models.files import SkippedFile
+
+
+def _fake_render(path: Path) -> bytes:
+    if path.name.startswith("bad"):
+        raise ValueError(f"cannot decode {path.name}")
+    return path.name.encode()
+
+
+def test_render_pool_returns_results_in_request_order() -> None:
+    """Chunked results come back per position, errors included."""
+    names = ("a", "bad", "c", "d", "e")
+    paths = [Path(f"{name}.png") for name in names]
+    pulled: list[int] = []
+
+    def _items() -> Iterator[tuple[int, Path]]:
+        for position, path in enumerate(paths):
+            pulled.append(position)
+            yield position, path
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pool = ImageRenderPool(
+            executor, _fake_render, _items(), workers=1, chunk_size=2
+        )
+        # Only the in-flight window is pulled from the stream up front.
+        assert pulled == [0, 1, 2, 3]
+        assert pool.bind(0)(paths[0]) == b"a.png"
+        with pytest.raises(ValueError, match="bad.png"):
+            pool.bind(1)(paths[1])
+        assert [pool.bind(i)(paths[i]) for i in (2, 3, 4)] == [
+            b"c.png",
+            b"d.png",
+            b"e.png",
+        ]
+        # Unannounced or already consumed positions render inline.
+        assert pool.bind(9)(Path("z.png")) == b"z.png"
+        assert pool.bind(0)(paths[0]) == b"a.png"
+
+
+def test_single_worker_skips_the_pool() -> None:
+    """One worker renders inline without touching the stream."""
+    items = iter([(0, Path("a.png"))])
+    with image_render_pool(items, _fake_render, 1) as renderers:
+        assert renderers.bind(0) is _fake_render
+    assert next(items) == (0, Path("a.png"))
+
+
+def test_batch_with_image_workers_keeps_order_and_skips(
+    tmp_path: Path,
+) -> None:
+    """Images rendered on processes keep input order and skip failures."""
+    service = importlib.import_module("pdf_tools.convert.service")
+    inputs = []
+    for index in range(6):
+        path = tmp_path / f"img{index}.png"
+        Image.new("RGB", (8, 8), (index * 40, 0, 0)).save(path)
+        inputs.append(path)
+    broken = tmp_path / "broken.jpg"
+    broken.write_bytes(b"not a jpeg")
+    inputs.insert(3, broken)
+    out = tmp_path / "out"
+    out.mkdir()
+
+    outcomes = service.convert_files_to_paths(
+        [(path, out) for path in inputs], image_workers=2
+    )
+
+    assert [o.path for o in outcomes] == [
+        broken if path == broken else out / f"{path.stem}.pdf"
+        for path in inputs
+    ]
+    assert isinstance(outcomes[3], SkippedFile)
+    assert "broken.jpg" in outcomes[3].reason
+    page = PdfReader(outcomes[0].path).pages[0]
+    assert (page.mediabox.width, page.mediabox.height) == (6, 6)
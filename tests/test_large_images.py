@@ -0,0 +1,156 @@
+"""Strip-by-strip TIFF decoding."""
+
+from __future__ import annotations
+
+import struct
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageChops
+
+from pdf_tools.convert.large_images import (
+    iter_bands,
+    png_from_bands,
+    png_with_exif,
+    reduce_bands,
+)
+
+
+def _same(left: Image.Image, right: Image.Image) -> bool:
+    return ImageChops.difference(left, right).getbbox() is None
+
+
+def _tiled_tiff(path: Path, image: Image.Image, tile: int) -> None:
+    """Write *image* (RGB) as an uncompressed tiled TIFF."""
+    tiles = []
+    for top in range(0, image.height, tile):
+        for left in range(0, image.width, tile):
+            box = (left, top, left + tile, top + tile)
+            tiles.append(image.crop(box).tobytes())
+    data_offset = 8
+    offsets = []
+    for data in tiles:
+        offsets.append(data_offset)
+        data_offset += len(data)
+    bits_offset = data_offset
+    offsets_offset = bits_offset + 6
+    counts_offset = offsets_offset + 4 * len(tiles)
+    ifd_offset = counts_offset + 4 * len(tiles)
+    entries = [
+        (256, 4, 1, image.width),
+        (257, 4, 1, image.height),
+        (258, 3, 3, bits_offset),
+        (259, 3, 1, 1),
+        (262, 3, 1, 2),
+        (277, 3, 1, 3),
+        (322, 3, 1, tile),
+        (323, 3, 1, tile),
+        (324, 4, len(tiles), offsets_offset),
+        (325, 4, len(tiles), counts_offset),
+    ]
+    with open(path, "wb") as out:
+        out.write(struct.pack("<2sHI", b"II", 42, ifd_offset))
+        out.write(b"".join(tiles))
+        out.write(struct.pack("<3H", 8, 8, 8))
+        out.write(struct.pack(f"<{len(tiles)}I", *offsets))
+        out.write(struct.pack(f"<{len(tiles)}I", *map(len, tiles)))
+        out.write(struct.pack("<H", len(entries)))
+        for tag, kind, count, value in entries:
+            out.write(struct.pack("<HHII", tag, kind, count, value))
+        out.write(struct.pack("<I", 0))
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L", "1"])
+@pytest.mark.parametrize(
+    "compression", ["raw", "packbits", "tiff_adobe_deflate"]
+)
+def test_png_from_bands_matches_full_decode(
+    tmp_path: Path, mode: str, compression: str
+) -> None:
+    """Strips streamed into a PNG give the pixels of a full decode."""
+    source = Image.effect_noise((301, 203), 64).convert(mode)
+    path = tmp_path / "plot.tiff"
+    source.save(path, compression=compression)
+
+    with Image.open(path) as image:
+        png = png_from_bands(
+            image.size, image.mode, iter_bands(image, 1 << 20)
+        )
+
+    with Image.open(BytesIO(png)) as decoded:
+        assert decoded.mode == mode
+        assert _same(decoded, source)
+
+
+def test_uncompressed_strips_are_split_to_fit(tmp_path: Path) -> None:
+    """A single raw strip is read a few rows at a time."""
+    source = Image.effect_noise((200, 100), 64).convert("RGB")
+    path = tmp_path / "plot.tiff"
+    source.save(path, compression="raw")
+
+    with Image.open(path) as image:
+        bands = list(iter_bands(image, 200 * 3 * 16))
+
+    assert [band.height for band in bands] == [16] * 6 + [4]
+    stitched = Image.new("RGB", source.size)
+    for index, band in enumerate(bands):
+        stitched.paste(band, (0, 16 * index))
+    assert _same(stitched, source)
+
+
+def test_tiles_are_decoded_one_row_at_a_time(tmp_path: Path) -> None:
+    """Tiled TIFFs yield one band per row of tiles."""
+    source = Image.effect_noise((100, 70), 64).convert("RGB")
+    path = tmp_path / "tiled.tiff"
+    _tiled_tiff(path, source, tile=32)
+
+    with Image.open(path) as image:
+        bands = list(iter_bands(image, 1 << 20))
+        png = png_from_bands(image.size, image.mode, iter(bands))
+
+    assert [band.height for band in bands] == [32, 32, 6]
+    with Image.open(BytesIO(png)) as decoded:
+        assert _same(decoded, source)
+
+
+def test_reduce_bands_matches_whole_image_reduce(tmp_path: Path) -> None:
+    """Buffering rows across strips keeps the box filter exact."""
+    source = Image.effect_noise((301, 203), 64).convert("RGB")
+    path = tmp_path / "plot.tiff"
+    source.save(path, compression="tiff_adobe_deflate")
+
+    with Image.open(path) as image:
+        reduced = reduce_bands(
+            image.size, image.mode, iter_bands(image, 1 << 20), 4
+        )
+
+    assert _same(reduced, source.reduce(4))
+
+
+def test_unsupported_layouts_raise(tmp_path: Path) -> None:
+    """LZW strips and oversized compressed strips are refused."""
+    source = Image.effect_noise((300, 200), 64).convert("RGB")
+    lzw = tmp_path / "lzw.tiff"
+    deflate = tmp_path / "deflate.tiff"
+    source.save(lzw, compression="tiff_lzw")
+    source.save(deflate, compression="tiff_adobe_deflate")
+
+    with Image.open(lzw) as image, pytest.raises(ValueError, match="5"):
+        next(iter_bands(image, 1 << 20))
+    with Image.open(deflate) as image, pytest.raises(ValueError, match="fit"):
+        next(iter_bands(image, 1000))
+
+
+def test_png_with_exif_adds_chunk_without_decoding() -> None:
+    """The eXIf chunk lets Pillow report EXIF data before any decode."""
+    source = Image.effect_noise((64, 48), 64).convert("RGB")
+    buffer = BytesIO()
+    source.save(buffer, format="PNG")
+
+    data = png_with_exif(buffer.getvalue())
+
+    assert png_with_exif(data) == data
+    with Image.open(BytesIO(data)) as image:
+        assert "exif" in image.info
+        assert _same(image, source)
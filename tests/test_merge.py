@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import gc
+import weakref
+from collections.abc import Iterator, Sequence
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
+import pymupdf
 import pytest
 from pypdf import PdfReader, PdfWriter
 
-from pdf_tools.merge.service import merge_pdfs
-from pdf_tools.models.files import File
+from pdf_tools.merge import service, stream
+from pdf_tools.merge.dedupe import (
+    duplicate_streams,
+    inline_references,
+    renumber_references,
+)
+from pdf_tools.merge.service import (
+    MergeBackend,
+    MergeProfile,
+    merge_pdfs,
+    merge_pdfs_to_bytes,
+    merge_pdfs_to_stream,
+)
+from pdf_tools.models.files import File, InMemoryPdf
+from tests.conftest import top_outline
 
 
 def _make_blank_pdf(path: Path) -> None:
@@ -143,3 +160,674 @@ def test_merge_pdfs_raises_when_parent_dir_missing(
     # Act / Assert
     with pytest.raises(FileNotFoundError):
         merge_pdfs(files=files, output_path=out_path)
+
+
+@pytest.mark.parametrize("backend", ["pypdf", "pymupdf", "stream"])
+def test_merge_pdfs_accepts_in_memory_documents(
+    tmp_path: Path, backend: MergeBackend
+) -> None:
+    """In-memory PDFs merge alongside files on disk."""
+    on_disk = tmp_path / "a.pdf"
+    _make_blank_pdf(on_disk)
+    _make_blank_pdf(tmp_path / "b.pdf")
+    in_memory = InMemoryPdf(
+        data=(tmp_path / "b.pdf").read_bytes(), name="b.docx"
+    )
+    out = tmp_path / "merged.pdf"
+
+    merge_pdfs(
+        [on_disk, in_memory],
+        output_path=out,
+        set_bookmarks=True,
+        backend=backend,
+    )
+
+    reader = PdfReader(out)
+    assert len(reader.pages) == 2
+    assert [item.title for item in top_outline(reader)] == ["a.pdf", "b.docx"]
+
+
+def test_merge_consumes_a_walk(tmp_path: Path) -> None:
+    """A lazy directory walk can be merged directly, in name order."""
+    from pdf_tools.walk import walk_files  # noqa: PLC0415
+
+    (tmp_path / "in" / "sub").mkdir(parents=True)
+    _make_blank_pdf(tmp_path / "in" / "b.pdf")
+    _make_blank_pdf(tmp_path / "in" / "sub" / "a.pdf")
+    out = tmp_path / "merged.pdf"
+
+    merge_pdfs(walk_files(tmp_path / "in"), out, set_bookmarks=True)
+
+    titles = [item.title for item in top_outline(PdfReader(out))]
+    assert titles == ["b.pdf", "a.pdf"]
+
+
+def _make_pdf_with_toc(path: Path, pages: int) -> None:
+    """Create a PDF of *pages* pages with a two-level outline."""
+    with pymupdf.open() as doc:
+        for _ in range(pages):
+            doc.new_page(width=72, height=72)
+        doc.set_toc([[1, "Part", 1], [2, "Section", pages], [1, "End", 1]])
+        doc.save(path)
+
+
+@pytest.mark.parametrize("set_bookmarks", [True, False])
+def test_merge_backends_write_the_same_outline(
+    tmp_path: Path, set_bookmarks: bool
+) -> None:
+    """Every backend writes pypdf's outline, including source TOCs."""
+    _make_pdf_with_toc(tmp_path / "a.pdf", 2)
+    _make_pdf_with_toc(tmp_path / "b.pdf", 3)
+    images = InMemoryPdf(
+        data=(tmp_path / "a.pdf").read_bytes(),
+        name="scans",
+        outline=[("scan1.png", 0), ("scan2.png", 1)],
+    )
+    inputs: list[File | InMemoryPdf] = [
+        File(path=tmp_path / "a.pdf", bookmark_name="First"),
+        images,
+        File(path=tmp_path / "b.pdf"),
+    ]
+
+    tocs = []
+    backends: tuple[MergeBackend, ...] = ("pypdf", "pymupdf", "stream")
+    for backend in backends:
+        out = tmp_path / f"{backend}.pdf"
+        merge_pdfs(inputs, out, set_bookmarks, backend=backend)
+        with pymupdf.open(out) as merged:
+            assert merged.page_count == 7
+            tocs.append(merged.get_toc())
+
+    assert tocs[0] == tocs[1] == tocs[2]
+
+
+def test_stream_backend_copies_pages_and_links(tmp_path: Path) -> None:
+    """Streamed pages keep their content, inherited boxes and links."""
+    with pymupdf.open() as doc:
+        for number in range(3):
+            page = doc.new_page(width=200, height=100 + number)
+            page.insert_text((10, 50), f"page {number}")
+        doc[0].insert_link(
+            {"kind": pymupdf.LINK_GOTO, "page": 2, "from": doc[0].rect}
+        )
+        doc.save(tmp_path / "a.pdf")
+    out = tmp_path / "merged.pdf"
+
+    merge_pdfs([tmp_path / "a.pdf"] * 2, out, backend="stream")
+
+    reader = PdfReader(out, strict=True)
+    assert [page.extract_text() for page in reader.pages] == [
+        f"page {number}" for number in (0, 1, 2, 0, 1, 2)
+    ]
+    assert [page.mediabox.height for page in reader.pages] == [
+        100,
+        101,
+        102,
+    ] * 2
+    with pymupdf.open(out) as merged:
+        assert [link["page"] for link in merged[3].get_links()] == [5]
+
+
+def test_pymupdf_backend_rejects_an_empty_merge(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    """PyMuPDF cannot write a document without pages."""
+    (tmp_path / "notes.txt").write_text("not a pdf")
+    monkeypatch.setattr(
+        "pdf_tools.merge.service.typer.echo", lambda *_args, **_kw: None
+    )
+
+    with pytest.raises(ValueError, match="No PDF pages"):
+        merge_pdfs(
+            [tmp_path / "notes.txt"], tmp_path / "out.pdf", backend="pymupdf"
+        )
+
+
+@pytest.mark.parametrize("backend", ["pypdf", "pymupdf", "stream"])
+def test_parallel_merge_matches_serial_merge(
+    tmp_path: Path, backend: MergeBackend
+) -> None:
+    """Merging groups in workers keeps page and bookmark order."""
+    inputs = []
+    for number in range(5):
+        path = tmp_path / f"{number}.pdf"
+        _make_pdf_with_toc(path, number + 1)
+        inputs.append(File(path=path, bookmark_name=f"Doc {number}"))
+
+    tocs = []
+    for workers in (1, 3):
+        out = tmp_path / f"out-{workers}.pdf"
+        merge_pdfs(inputs, out, True, backend=backend, workers=workers)
+        with pymupdf.open(out) as merged:
+            assert merged.page_count == 15
+            tocs.append(merged.get_toc())
+
+    assert tocs[0] == tocs[1]
+    assert [title for level, title, _ in tocs[1] if level == 1] == [
+        f"Doc {number}" for number in range(5)
+    ]
+    assert not list(tmp_path.glob(".merge-*"))
+
+
+def test_contiguous_groups_balance_by_size(tmp_path: Path) -> None:
+    """Groups keep input order and split where the sizes even out."""
+    from pdf_tools.merge.service import _contiguous_groups  # noqa: PLC0415
+
+    files = [
+        InMemoryPdf(data=b"x" * size, name=str(index))
+        for index, size in enumerate([10, 10, 10, 30, 5, 5, 10])
+    ]
+
+    groups = _contiguous_groups(files, 3)
+
+    assert [[file.name for file in group] for group in groups] == [
+        ["0", "1", "2"],
+        ["3"],
+        ["4", "5", "6"],
+    ]
+
+
+def _make_pdf_with_logo(path: Path, logo: bytes, text: str) -> None:
+    """Create a one-page PDF showing *logo* and *text*."""
+    with pymupdf.open() as doc:
+        page = doc.new_page(width=200, height=200)
+        page.insert_image(pymupdf.Rect(0, 0, 100, 100), stream=logo)
+        page.insert_text((20, 150), text)
+        doc.save(path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("backend", ["pypdf", "pymupdf", "stream"])
+def test_dedupe_stores_shared_images_once(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    backend: MergeBackend,
+    workers: int,
+) -> None:
+    """An image embedded by every input is written once."""
+    logo = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 64, 64), False)
+    for x in range(64):
+        pixel = (x * 4, 255 - x * 4, (x * 37) % 256)
+        for y in range(64):
+            logo.set_pixel(x, y, pixel)
+    for number in range(4):
+        _make_pdf_with_logo(
+            tmp_path / f"{number}.pdf", logo.tobytes("png"), f"Page {number}"
+        )
+    inputs = sorted(tmp_path.glob("*.pdf"))
+
+    plain = merge_pdfs(
+        inputs, tmp_path / "plain.pdf", backend=backend, workers=workers
+    )
+    capsys.readouterr()
+    deduped = merge_pdfs(
+        inputs,
+        tmp_path / "deduped.pdf",
+        backend=backend,
+        workers=workers,
+        dedupe=True,
+    )
+
+    assert "duplicate stream(s)" in capsys.readouterr().out
+    with pymupdf.open(deduped.path) as doc:
+        assert doc.page_count == 4
+        images = {page.get_images()[0][0] for page in doc}
+        assert len(images) == (1 if backend != "stream" else workers)
+        texts = [page.get_text().strip() for page in doc]
+        assert texts == [f"Page {number}" for number in range(4)]
+    assert deduped.path.stat().st_size < plain.path.stat().st_size
+
+
+def test_references_inside_strings_are_left_alone() -> None:
+    """Text that looks like ``N 0 R`` in a string is not rewritten."""
+    source = (
+        b"<</T (Exhibit 12 0 R \\) (see 12 0 R)) /A 12 0 R /H <3132>"
+        b" /K [12 0 R] /D <</X 12 0 R>>>>"
+    )
+
+    assert renumber_references(source, {12: 3}) == (
+        b"<</T (Exhibit 12 0 R \\) (see 12 0 R)) /A 3 0 R /H <3132>"
+        b" /K [3 0 R] /D <</X 3 0 R>>>>"
+    )
+    assert inline_references(source, {12: b"/DeviceRGB"}.get) == (
+        b"<</T (Exhibit 12 0 R \\) (see 12 0 R)) /A /DeviceRGB /H <3132>"
+        b" /K [/DeviceRGB] /D <</X /DeviceRGB>>>>"
+    )
+
+
+def test_pymupdf_dedupe_keeps_titles_that_look_like_references(
+    tmp_path: Path,
+) -> None:
+    """Outline titles are copied as written, whatever they contain."""
+    logo = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 16, 16), False)
+    logo.clear_with(200)
+    title = " ".join(f"{number} 0 R" for number in range(1, 80))
+    for number in range(3):
+        _make_pdf_with_logo(
+            tmp_path / f"{number}.pdf", logo.tobytes("png"), str(number)
+        )
+    inputs = [
+        File(path=tmp_path / f"{number}.pdf", bookmark_name=title)
+        for number in range(3)
+    ]
+
+    merged = merge_pdfs(
+        inputs,
+        tmp_path / "merged.pdf",
+        set_bookmarks=True,
+        backend="pymupdf",
+        dedupe=True,
+    )
+
+    with pymupdf.open(merged.path) as doc:
+        assert [entry[1] for entry in doc.get_toc()] == [title] * 3
+
+
+def test_dedupe_is_skipped_on_unknown_pypdf_internals(
+    tmp_path: Path,
+    sample_pdfs: Sequence[File],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without the expected pypdf internals, dedupe warns and is skipped."""
+    monkeypatch.setattr(service, "_can_dedupe_pypdf", lambda _writer: False)
+    out = tmp_path / "merged.pdf"
+
+    with pytest.warns(RuntimeWarning, match="without deduplication"):
+        merge_pdfs(sample_pdfs, out, dedupe=True)
+
+    assert len(PdfReader(out).pages) == 6
+
+
+def test_stream_dedupe_is_skipped_on_unknown_pypdf_internals(
+    tmp_path: Path,
+    sample_pdfs: Sequence[File],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The stream backend warns and skips dedupe without raw stream data."""
+    monkeypatch.setattr(stream, "_has_raw_stream_data", lambda: False)
+    out = tmp_path / "merged.pdf"
+
+    with pytest.warns(RuntimeWarning, match="without deduplication"):
+        merge_pdfs(sample_pdfs, out, dedupe=True, backend="stream")
+
+    assert len(PdfReader(out).pages) == 6
+
+
+def test_duplicate_streams_follow_duplicate_references() -> None:
+    """Images become duplicates once their soft masks are."""
+    streams = [
+        (1, b"<</SMask 2 0 R>>", b"image"),
+        (2, b"<<>>", b"mask"),
+        (3, b"<</SMask 4 0 R>>", b"image"),
+        (4, b"<<>>", b"mask"),
+        (5, b"<</SMask 2 0 R>>", b"other"),
+    ]
+
+    canonical, saved = duplicate_streams(streams)
+
+    assert canonical == {3: 1, 4: 2}
+    assert saved == len(b"<</SMask 4 0 R>>image") + len(b"<<>>mask")
+
+
+@pytest.mark.parametrize("profile", ["compact", "archive"])
+@pytest.mark.parametrize("backend", ["pypdf", "pymupdf", "stream"])
+def test_profiles_compress_the_output(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    backend: MergeBackend,
+    profile: MergeProfile,
+) -> None:
+    """Compressed profiles use object streams and keep pages and TOC."""
+    for number in range(3):
+        with pymupdf.open() as doc:
+            page = doc.new_page()
+            page.insert_text((72, 72), "\n".join(["Page text"] * 40))
+            doc.set_toc([[1, f"Doc {number}", 1]])
+            doc.save(tmp_path / f"{number}.pdf")
+    inputs = sorted(tmp_path.glob("*.pdf"))
+    targets: list[Any] = []
+    save = pymupdf.Document.save
+
+    def _save(self: pymupdf.Document, target: Any, **options: Any) -> Any:
+        targets.append(target)
+        return save(self, target, **options)
+
+    monkeypatch.setattr(pymupdf.Document, "save", _save)
+
+    fast = merge_pdfs(inputs, tmp_path / "fast.pdf", backend=backend)
+    small = merge_pdfs(
+        inputs, tmp_path / "small.pdf", backend=backend, profile=profile
+    )
+
+    # PyMuPDF saves to file objects through a slow per-chunk callback.
+    assert targets and all(isinstance(t, (str, Path)) for t in targets)
+    assert b"/ObjStm" in small.path.read_bytes()
+    assert small.path.stat().st_size < fast.path.stat().st_size
+    with pymupdf.open(fast.path) as before, pymupdf.open(small.path) as after:
+        assert after.get_toc() == before.get_toc()
+        assert [page.get_text() for page in after] == [
+            page.get_text() for page in before
+        ]
+    assert not list(tmp_path.glob("*.part"))
+
+
+@pytest.mark.parametrize("backend", ["pypdf", "pymupdf", "stream"])
+def test_failed_save_keeps_the_existing_output(
+    tmp_path: Path,
+    sample_pdfs: Sequence[File],
+    monkeypatch: pytest.MonkeyPatch,
+    backend: MergeBackend,
+) -> None:
+    """Every backend writes through a ``.part`` file replaced on success."""
+    out = tmp_path / "merged.pdf"
+    out.write_bytes(b"previous")
+
+    def _fail(_self: Any, target: Any = None, **_kw: Any) -> None:
+        if isinstance(target, (str, Path)):
+            Path(target).write_bytes(b"trunc")
+        elif target is not None:
+            target.write(b"trunc")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pymupdf.Document, "save", _fail)
+    monkeypatch.setattr(PdfWriter, "write", _fail)
+    monkeypatch.setattr(
+        service.PdfStreamWriter, "finish", lambda *_a: _fail(None)
+    )
+
+    with pytest.raises(OSError, match="disk full"):
+        merge_pdfs(sample_pdfs, out, overwrite=True, backend=backend)
+
+    assert out.read_bytes() == b"previous"
+    assert not list(tmp_path.glob("*.part"))
+
+
+def _make_pdf_with_images(path: Path, pages: int) -> None:
+    """Create a PDF whose pages each show their own image and link onward."""
+    with pymupdf.open() as doc:
+        for number in range(pages):
+            page = doc.new_page(width=100, height=100)
+            image = pymupdf.Pixmap(
+                pymupdf.csRGB, pymupdf.IRect(0, 0, 8, 8), False
+            )
+            image.set_rect(image.irect, (number * 40, 0, 0))
+            page.insert_image(page.rect, pixmap=image)
+            page.insert_text((10, 50), f"Page {number + 1}")
+        for number in range(pages - 1):
+            doc[number].insert_link(
+                {
+                    "kind": pymupdf.LINK_GOTO,
+                    "from": pymupdf.Rect(0, 0, 20, 20),
+                    "page": number + 1,
+                }
+            )
+        doc.set_toc(
+            [[1, "Start", 1], [2, "Second", 2], [1, "Later", 4], [2, "End", 5]]
+        )
+        doc.save(path)
+
+
+@pytest.mark.parametrize("backend", ["pypdf", "pymupdf", "stream"])
+def test_page_ranges_copy_only_selected_pages(
+    tmp_path: Path, backend: MergeBackend
+) -> None:
+    """Selected pages keep their order, images, outline and inner links."""
+    _make_pdf_with_images(tmp_path / "a.pdf", 5)
+    out = tmp_path / "out.pdf"
+
+    merge_pdfs(
+        [
+            File(path=tmp_path / "a.pdf", pages="5,2-3"),
+            InMemoryPdf(
+                data=(tmp_path / "a.pdf").read_bytes(),
+                name="scans",
+                outline=[("first", 0), ("fourth", 3)],
+                pages="4-",
+            ),
+        ],
+        out,
+        set_bookmarks=True,
+        backend=backend,
+    )
+
+    with pymupdf.open(out) as doc:
+        assert [page.get_text().strip() for page in doc] == [
+            "Page 5",
+            "Page 2",
+            "Page 3",
+            "Page 4",
+            "Page 5",
+        ]
+        images = [
+            xref
+            for xref in range(1, doc.xref_length())
+            if doc.xref_get_key(xref, "Subtype")[1] == "/Image"
+        ]
+        assert len(images) == 5
+        assert [link["page"] for link in doc[1].get_links()] == [2]
+        assert doc[0].get_links() == []
+        assert doc.get_toc() == [
+            [1, "a.pdf", 1],
+            [2, "Start", -1],
+            [3, "Second", 2],
+            [2, "Later", -1],
+            [3, "End", 1],
+            [1, "Later", 4],
+            [2, "End", 5],
+            [1, "fourth", 4],
+        ]
+
+
+def test_page_ranges_past_the_end_name_the_file(tmp_path: Path) -> None:
+    """A selection past the last page fails before anything is written."""
+    _make_blank_pdf(tmp_path / "a.pdf")
+
+    with pytest.raises(ValueError, match=r"a\.pdf: Page 2 is past"):
+        merge_pdfs(
+            [File(path=tmp_path / "a.pdf", pages="1-2")], tmp_path / "o.pdf"
+        )
+
+    assert not (tmp_path / "o.pdf").exists()
+
+
+@pytest.mark.parametrize("backend", ["pypdf", "pymupdf", "stream"])
+def test_append_adds_an_incremental_update(
+    tmp_path: Path, backend: MergeBackend
+) -> None:
+    """Appended inputs follow the existing bytes, which stay untouched."""
+    _make_pdf_with_toc(tmp_path / "a.pdf", 2)
+    _make_pdf_with_toc(tmp_path / "b.pdf", 3)
+    out = tmp_path / "bundle.pdf"
+    merge_pdfs([tmp_path / "a.pdf"], out, set_bookmarks=True, backend=backend)
+    before = out.read_bytes()
+
+    merge_pdfs(
+        [File(path=tmp_path / "b.pdf", bookmark_name="Exhibit B")],
+        out,
+        set_bookmarks=True,
+        append=True,
+    )
+
+    assert out.read_bytes().startswith(before)
+    assert len(PdfReader(out, strict=True).pages) == 5
+    with pymupdf.open(out) as doc:
+        assert doc.get_toc() == [
+            [1, "a.pdf", 1],
+            [2, "Part", 1],
+            [3, "Section", 2],
+            [2, "End", 1],
+            [1, "Exhibit B", 3],
+            [2, "Part", 3],
+            [3, "Section", 5],
+            [2, "End", 3],
+        ]
+
+
+def test_append_creates_a_missing_output(tmp_path: Path) -> None:
+    """Appending to a missing output merges as usual."""
+    _make_blank_pdf(tmp_path / "a.pdf")
+    out = tmp_path / "bundle.pdf"
+
+    merge_pdfs([tmp_path / "a.pdf"], out, append=True)
+    merge_pdfs([tmp_path / "a.pdf"], out, append=True)
+
+    assert len(PdfReader(out).pages) == 2
+    with pytest.raises(ValueError, match="incremental update"):
+        merge_pdfs([tmp_path / "a.pdf"], out, append=True, dedupe=True)
+
+
+@pytest.mark.parametrize("profile", ["fast", "compact"])
+@pytest.mark.parametrize("backend", ["pypdf", "pymupdf", "stream"])
+def test_merge_to_bytes_matches_the_merged_file(
+    sample_pdfs: Sequence[File],
+    tmp_path: Path,
+    backend: MergeBackend,
+    profile: MergeProfile,
+) -> None:
+    """Merging to bytes writes the same document as merging to a file."""
+    out = merge_pdfs(
+        sample_pdfs,
+        tmp_path / "merged.pdf",
+        set_bookmarks=True,
+        backend=backend,
+        profile=profile,
+    )
+
+    before = sorted(tmp_path.iterdir())
+    data = merge_pdfs_to_bytes(
+        sample_pdfs, set_bookmarks=True, backend=backend, profile=profile
+    )
+
+    with pymupdf.open(out.path) as disk, pymupdf.open("pdf", data) as memory:
+        assert memory.page_count == disk.page_count
+        assert memory.get_toc() == disk.get_toc()
+    assert sorted(tmp_path.iterdir()) == before
+
+
+class _Pipe:
+    """A write-only stream, like stdout piped to another program."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("backend", ["pypdf", "pymupdf", "stream"])
+def test_merge_to_stream_needs_no_seek(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    backend: MergeBackend,
+    workers: int,
+) -> None:
+    """Streams without tell or seek work and messages go to stderr."""
+    for name in ("a.pdf", "b.pdf"):
+        _make_blank_pdf(tmp_path / name)
+    (tmp_path / "notes.txt").write_text("not a PDF")
+    inputs = [tmp_path / name for name in ("a.pdf", "notes.txt", "b.pdf")]
+    pipe = _Pipe()
+
+    merge_pdfs_to_stream(
+        inputs,
+        pipe,  # type: ignore[arg-type]
+        backend=backend,
+        workers=workers,
+        dedupe=True,
+    )
+
+    assert len(PdfReader(BytesIO(b"".join(pipe.chunks))).pages) == 2
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "notes.txt" in captured.err
+
+
+@pytest.mark.parametrize("backend", ["pypdf", "stream"])
+def test_each_reader_is_released_before_the_next(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, backend: MergeBackend
+) -> None:
+    """Each input is freed before the next is read; links still resolve."""
+    if backend == "pypdf" and not service._can_release_readers(PdfWriter()):
+        pytest.skip("this pypdf release keeps readers until writing")
+    _make_pdf_with_images(tmp_path / "a.pdf", 5)
+    readers: list[weakref.ref[PdfReader]] = []
+    alive: list[int] = []
+    open_pypdf = service._open_pypdf
+
+    def _spy(file: File | InMemoryPdf) -> PdfReader:
+        gc.collect()
+        alive.append(sum(ref() is not None for ref in readers))
+        reader = open_pypdf(file)
+        readers.append(weakref.ref(reader))
+        return reader
+
+    monkeypatch.setattr(service, "_open_pypdf", _spy)
+    out = tmp_path / "merged.pdf"
+
+    merge_pdfs(
+        [tmp_path / "a.pdf"] * 3, out, set_bookmarks=True, backend=backend
+    )
+
+    assert alive == [0, 0, 0]
+    with pymupdf.open(out) as merged:
+        links = [
+            [link["page"] for link in page.get_links()] for page in merged
+        ]
+    assert links == [
+        [start + offset + 1] if offset < 4 else []
+        for start in (0, 5, 10)
+        for offset in range(5)
+    ]
+
+
+def test_readers_are_kept_without_pypdf_link_internals(
+    tmp_path: Path,
+    sample_pdfs: Sequence[File],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Older pypdf releases merge as before, keeping every reader."""
+    monkeypatch.setattr(service, "_can_release_readers", lambda _w: False)
+    out = tmp_path / "merged.pdf"
+
+    merge_pdfs(sample_pdfs, out, set_bookmarks=True)
+
+    assert len(PdfReader(out).pages) == 6
+    assert len(top_outline(PdfReader(out))) == 3
+
+
+@pytest.fixture
+def few_file_descriptors() -> Iterator[None]:
+    """Lower the open file limit like ``ulimit -n 64``."""
+    resource = pytest.importorskip("resource")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(64, soft), hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("few_file_descriptors")
+@pytest.mark.parametrize("backend", ["pypdf", "stream"])
+def test_merge_twenty_thousand_inputs(
+    tmp_path: Path, backend: MergeBackend
+) -> None:
+    """Inputs are opened one at a time, so the file limit is no bound."""
+    _make_blank_pdf(tmp_path / "blank.pdf")
+    blank = (tmp_path / "blank.pdf").read_bytes()
+    inputs = []
+    for number in range(20_000):
+        inputs.append(tmp_path / f"{number:05}.pdf")
+        inputs[-1].write_bytes(blank)
+    out = tmp_path / "merged.pdf"
+
+    merge_pdfs(inputs, out, backend=backend)
+
+    with pymupdf.open(out) as merged:
+        assert merged.page_count == 20_000
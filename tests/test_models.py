@@ -9,7 +9,8 @@ import pytest
 from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
 
-from pdf_tools.models.files import File
+from pdf_tools.models.files import File, Files, page_indices
+from pdf_tools.models.images import ImageOptions
 from pdf_tools.models.watermark import WatermarkOptions
 
 
@@ -43,3 +44,37 @@ def test_validate_color() -> None:
     """Color field validator ensures correct formatting."""
     with pytest.raises(ValueError):
         WatermarkOptions(text="TEST", color="bad_color")
+
+
+def test_image_options_target_size() -> None:
+    """Images are fitted to the page at the target DPI, never enlarged."""
+    options = ImageOptions(dpi=100, page_size="letter")
+
+    assert options.target_size(4000, 3000) == (1100, 825)
+    assert options.target_size(3000, 4000) == (825, 1100)
+    assert options.target_size(800, 600) is None
+    assert ImageOptions().target_size(4000, 3000) is None
+    assert ImageOptions().fingerprint == ""
+    assert options.fingerprint == "dpi-100-letter"
+
+
+def test_page_ranges_select_pages_in_order() -> None:
+    """Page ranges are 1-based, inclusive and may be open-ended."""
+    assert page_indices("1-3,7,9-", 10) == [0, 1, 2, 6, 8, 9]
+    assert page_indices(" -2 , 5 - 6", 10) == [0, 1, 4, 5]
+    assert page_indices("4,1", 4) == [3, 0]
+    for pages in ("3-1", "11", "1-3,2"):
+        with pytest.raises(ValueError):
+            page_indices(pages, 10)
+
+
+def test_page_ranges_round_trip_through_json() -> None:
+    """Page ranges are checked on validation and kept in bundles."""
+    bundle = Files([File(path=Path("deposition.pdf"), pages="1-3")])
+
+    restored = Files.model_validate_json(bundle.model_dump_json())
+
+    assert restored[0].pages == "1-3"
+    for pages in ("", "0", "1-3,", "a-b", "1--3"):
+        with pytest.raises(ValueError):
+            File(path=Path("deposition.pdf"), pages=pages)
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
+import pytest
 from PIL import Image
 from pypdf import PdfReader
 
+from pdf_tools.convert import service as convert_service
+from pdf_tools.models.files import File
 from pdf_tools.process import convert_and_merge_pdfs
-from tests.conftest import make_pdf
+from pdf_tools.process import service as process_service
+from tests.conftest import make_pdf, top_outline
 
 
 def test_convert_and_merge_accepts_paths_and_existing_pdfs(
@@ -25,3 +30,132 @@ def test_convert_and_merge_accepts_paths_and_existing_pdfs(
 
     assert result.path == out
     assert len(PdfReader(out).pages) == 3
+
+
+def test_convert_and_merge_in_memory_skips_temp_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The in-memory path never creates temporary PDFs."""
+    pdf = tmp_path / "source.pdf"
+    image = tmp_path / "image.png"
+    out = tmp_path / "merged.pdf"
+    make_pdf(pdf, pages=2)
+    Image.new("RGB", (10, 10), (255, 0, 0)).save(image)
+
+    def _no_temp(*_a: Any, **_kw: Any) -> None:
+        raise AssertionError("temporary file created")
+
+    monkeypatch.setattr(process_service, "NamedTemporaryFile", _no_temp)
+
+    convert_and_merge_pdfs(
+        [image, pdf], output_path=out, set_bookmarks=True, in_memory=True
+    )
+
+    reader = PdfReader(out)
+    assert len(reader.pages) == 3
+    assert [item.title for item in top_outline(reader)] == [
+        "image.png",
+        "source.pdf",
+    ]
+
+
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_convert_and_merge_combines_image_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, in_memory: bool
+) -> None:
+    """Consecutive images skip per-image PDFs and keep their bookmarks."""
+    pdf = tmp_path / "source.pdf"
+    out = tmp_path / "merged.pdf"
+    make_pdf(pdf, pages=2)
+    images = [tmp_path / f"{name}.png" for name in ("a", "b", "c", "d")]
+    for image in images:
+        Image.new("RGB", (10, 10), (255, 0, 0)).save(image)
+
+    def _no_single_image(*_a: Any, **_kw: Any) -> None:
+        raise AssertionError("image converted on its own")
+
+    monkeypatch.setattr(
+        process_service, "NamedTemporaryFile", _no_single_image
+    )
+    monkeypatch.setattr(
+        convert_service, "_image_to_pdf_bytes", _no_single_image
+    )
+
+    convert_and_merge_pdfs(
+        [*images[:2], pdf, *images[2:]],
+        output_path=out,
+        set_bookmarks=True,
+        in_memory=in_memory,
+    )
+
+    reader = PdfReader(out)
+    assert len(reader.pages) == 6
+    assert [
+        (item.title, reader.get_destination_page_number(item))
+        for item in top_outline(reader)
+    ] == [
+        ("a.png", 0),
+        ("b.png", 1),
+        ("source.pdf", 2),
+        ("c.png", 4),
+        ("d.png", 5),
+    ]
+
+
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_convert_and_merge_applies_page_ranges(
+    tmp_path: Path, in_memory: bool
+) -> None:
+    """Page ranges apply to PDFs and to converted documents alike."""
+    pdf = tmp_path / "source.pdf"
+    scan = tmp_path / "scan.tiff"
+    image = tmp_path / "image.png"
+    out = tmp_path / "merged.pdf"
+    make_pdf(pdf, pages=3)
+    frames = [Image.new("RGB", (10, 10 + n), "white") for n in range(3)]
+    frames[0].save(scan, save_all=True, append_images=frames[1:])
+    Image.new("RGB", (10, 10), (255, 0, 0)).save(image)
+
+    convert_and_merge_pdfs(
+        [
+            File(path=pdf, pages="3,1"),
+            File(path=scan, pages="2-"),
+            File(path=image),
+            File(path=image),
+        ],
+        output_path=out,
+        in_memory=in_memory,
+    )
+
+    reader = PdfReader(out)
+    assert [page.extract_text().strip() for page in reader.pages[:2]] == [
+        "Page 3",
+        "Page 1",
+    ]
+    assert len(reader.pages) == 6
+
+
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_convert_and_merge_reports_skipped_files(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], in_memory: bool
+) -> None:
+    """Failed images inside a run are reported like other skipped files."""
+    images = [tmp_path / f"{name}.png" for name in ("a", "broken", "c")]
+    for image in images:
+        Image.new("RGB", (10, 10), (255, 0, 0)).save(image)
+    images[1].write_bytes(b"not an image")
+    notes = tmp_path / "notes.txt"
+    notes.write_text("x")
+    out = tmp_path / "merged.pdf"
+
+    convert_and_merge_pdfs(
+        [*images, notes], output_path=out, in_memory=in_memory
+    )
+
+    assert len(PdfReader(out).pages) == 2
+    skipped = [
+        line.split(":")[0]
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith("Skipping ")
+    ]
+    assert skipped == [f"Skipping {images[1]}", f"Skipping {notes}"]
@@ -0,0 +1,175 @@
+"""Native XMLRPC client against an in-process fake unoserver."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from xmlrpc.client import Binary
+from xmlrpc.server import SimpleXMLRPCServer
+
+import pytest
+
+from pdf_tools.convert import aio, service
+from pdf_tools.convert.unoserver_client import (
+    AsyncUnoserverClient,
+    OfficeProtocolError,
+    UnoserverClient,
+    get_client,
+)
+
+
+@pytest.fixture()
+def fake_unoserver() -> Iterator[tuple[int, list[tuple[Any, ...]]]]:
+    """Serve a ``convert`` method that mimics unoserver's signature."""
+    calls: list[tuple[Any, ...]] = []
+    server = SimpleXMLRPCServer(
+        ("127.0.0.1", 0), allow_none=True, logRequests=False
+    )
+
+    def convert(
+        inpath: str | None = None,
+        indata: Binary | None = None,
+        outpath: str | None = None,
+        convert_to: str | None = None,
+    ) -> Binary | None:
+        calls.append((inpath, indata, outpath, convert_to))
+        if inpath is not None and inpath.endswith("broken.docx"):
+            raise RuntimeError("could not load document")
+        payload = b"%PDF-" + (indata.data if indata else b"path")
+        if outpath is None:
+            return Binary(payload)
+        Path(outpath).write_bytes(payload)
+        return None
+
+    server.register_function(convert)
+    thread = threading.Thread(
+        target=server.serve_forever, args=(0.05,), daemon=True
+    )
+    thread.start()
+    try:
+        yield server.server_address[1], calls
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_converts_paths_and_bytes(
+    fake_unoserver: tuple[int, list[tuple[Any, ...]]], tmp_path: Path
+) -> None:
+    """Path jobs write on the server; byte jobs return the result."""
+    port, calls = fake_unoserver
+    client = UnoserverClient(port=port)
+    src = tmp_path / "memo.docx"
+    src.touch()
+
+    assert client.convert(inpath=src, outpath=tmp_path / "memo.pdf") is None
+    assert (tmp_path / "memo.pdf").read_bytes() == b"%PDF-path"
+    assert client.convert(indata=b"abc") == b"%PDF-abc"
+    assert calls[0][0] == str(src.resolve())
+
+
+def test_client_maps_faults(
+    fake_unoserver: tuple[int, list[tuple[Any, ...]]], tmp_path: Path
+) -> None:
+    """Server errors become RuntimeError; bad signatures a protocol error."""
+    port, _ = fake_unoserver
+    client = UnoserverClient(port=port)
+    with pytest.raises(RuntimeError, match="could not load"):
+        client.convert(inpath=tmp_path / "broken.docx")
+    client._proxy = UnoserverClient(port=port)._proxy.no_such_method  # type: ignore[assignment]
+    with pytest.raises(OfficeProtocolError):
+        client.convert(indata=b"x")
+
+
+def test_get_client_is_cached_per_thread() -> None:
+    """Each thread reuses one client per port."""
+    assert get_client(4003) is get_client(4003)
+    assert get_client(4003) is not get_client(4005)
+    other: list[UnoserverClient] = []
+    thread = threading.Thread(target=lambda: other.append(get_client(4003)))
+    thread.start()
+    thread.join()
+    assert other[0] is not get_client(4003)
+
+
+def test_word_conversion_uses_xmlrpc(
+    fake_unoserver: tuple[int, list[tuple[Any, ...]]],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """No ``unoconvert`` process is spawned on the XMLRPC path."""
+    port, calls = fake_unoserver
+
+    def _no_subprocess(*_a: Any, **_kw: Any) -> None:
+        raise AssertionError("unoconvert should not run")
+
+    monkeypatch.setattr(service.subprocess, "run", _no_subprocess)
+    src = tmp_path / "memo.docx"
+    src.touch()
+
+    result = service.convert_word_to_pdf(src, xmlrpc_port=port)
+
+    assert result.path == src.with_suffix(".pdf")
+    assert result.path.read_bytes() == b"%PDF-path"
+    assert len(calls) == 1
+
+
+def test_word_bytes_round_trip(
+    fake_unoserver: tuple[int, list[tuple[Any, ...]]],
+) -> None:
+    """Bytes go to the listener and PDF bytes come back."""
+    port, calls = fake_unoserver
+
+    assert service.convert_word_bytes_to_pdf(b"docx", port) == b"%PDF-docx"
+    assert calls[0][0] is None and calls[0][2] is None
+
+
+def test_async_client_matches_sync_client(
+    fake_unoserver: tuple[int, list[tuple[Any, ...]]], tmp_path: Path
+) -> None:
+    """The asyncio client sends the same call and maps the same faults."""
+    port, calls = fake_unoserver
+    client = AsyncUnoserverClient(port=port)
+    src = tmp_path / "memo.docx"
+    src.touch()
+
+    async def _run() -> tuple[bytes | None, bytes | None]:
+        written = await client.convert(
+            inpath=src, outpath=tmp_path / "memo.pdf"
+        )
+        return written, await client.convert(indata=b"abc")
+
+    assert asyncio.run(_run()) == (None, b"%PDF-abc")
+    assert (tmp_path / "memo.pdf").read_bytes() == b"%PDF-path"
+    assert calls[0][0] == str(src.resolve())
+    with pytest.raises(RuntimeError, match="could not load"):
+        asyncio.run(client.convert(inpath=tmp_path / "broken.docx"))
+
+
+def test_async_word_batch_spreads_over_listener(
+    fake_unoserver: tuple[int, list[tuple[Any, ...]]], tmp_path: Path
+) -> None:
+    """Awaitable batches convert Word files without spawning processes."""
+    port, calls = fake_unoserver
+    sources = [tmp_path / f"memo{i}.docx" for i in range(3)]
+    for src in sources:
+        src.touch()
+    out = tmp_path / "out"
+    out.mkdir()
+
+    result = asyncio.run(
+        aio.convert_files_to_pdfs(
+            [*sources, tmp_path / "broken.docx"],
+            output_dir=out,
+            xmlrpc_ports=[port],
+        )
+    )
+
+    assert [f.path for f in result.converted] == [
+        out / f"memo{i}.pdf" for i in range(3)
+    ]
+    assert [s.path for s in result.skipped] == [tmp_path / "broken.docx"]
+    assert len(calls) == 4
@@ -0,0 +1,167 @@
+"""Persistent unoserver daemon bookkeeping (no LibreOffice required)."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import socket
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pdf_tools.convert import unoserver_ctx, unoserver_daemon
+from pdf_tools.convert.unoserver_daemon import DaemonInfo
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep PID, lock and lease files inside the test's tmp dir."""
+    monkeypatch.setenv("PDF_TOOLS_STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setattr(
+        unoserver_ctx, "_UNOSERVER_CMD", "/usr/bin/unoserver", raising=True
+    )
+    return tmp_path / "state"
+
+
+@pytest.fixture()
+def listening_port() -> Iterator[int]:
+    """Open a TCP listener standing in for the XMLRPC server."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+def _write_pid_file(port: int, pid: int) -> None:
+    info = DaemonInfo(
+        pid=pid, uno_port=port + 1, xmlrpc_port=port, idle_timeout=60
+    )
+    unoserver_daemon._pid_file(port).write_text(info.model_dump_json())
+
+
+def test_attaches_to_running_daemon(
+    listening_port: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A live PID file plus an open port means no new process is spawned."""
+    _write_pid_file(listening_port, os.getpid())
+
+    def _no_spawn(*_a: Any, **_kw: Any) -> None:
+        raise AssertionError("daemon should not be started")
+
+    monkeypatch.setattr(unoserver_daemon.subprocess, "Popen", _no_spawn)
+
+    with unoserver_daemon.office_daemon(
+        uno_port=listening_port + 1, xmlrpc_port=listening_port
+    ) as ports:
+        assert ports == [listening_port]
+        assert unoserver_daemon._has_live_leases(listening_port)
+
+    assert not unoserver_daemon._has_live_leases(listening_port)
+    assert unoserver_daemon._activity_file(listening_port).exists()
+
+
+def test_waits_for_a_restarting_daemon(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A live supervisor with its port closed is waited on, not replaced."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    _write_pid_file(port, os.getpid())
+
+    def _no_spawn(*_a: Any, **_kw: Any) -> None:
+        raise AssertionError("a second supervisor was started")
+
+    monkeypatch.setattr(unoserver_daemon.subprocess, "Popen", _no_spawn)
+    restarted = threading.Event()
+
+    def _restart() -> None:
+        time.sleep(0.3)
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", port))
+            sock.listen()
+            restarted.wait(10)
+
+    listener = threading.Thread(target=_restart)
+    listener.start()
+    try:
+        info = unoserver_daemon.start_daemon(
+            uno_port=port + 1, xmlrpc_port=port
+        )
+    finally:
+        restarted.set()
+        listener.join()
+
+    assert info.pid == os.getpid()
+
+
+def test_attaching_resets_the_idle_clock(listening_port: int) -> None:
+    """An idle daemon that is attached to cannot time out before a lease."""
+    _write_pid_file(listening_port, os.getpid())
+    activity = unoserver_daemon._activity_file(listening_port)
+    activity.touch()
+    os.utime(activity, (0, 0))
+
+    unoserver_daemon.start_daemon(
+        uno_port=listening_port + 1, xmlrpc_port=listening_port
+    )
+
+    assert not unoserver_daemon._idle(activity, 60)
+
+
+def test_module_imports_without_fcntl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The CLI imports office_context on Windows, where fcntl is missing."""
+    monkeypatch.setitem(sys.modules, "fcntl", None)
+    spec = importlib.util.find_spec("pdf_tools.convert.unoserver_daemon")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+
+    spec.loader.exec_module(module)
+
+    with module.office_context(needed=False) as ports:
+        assert ports is None
+
+
+def test_stale_pid_file_is_removed(listening_port: int) -> None:
+    """A PID file left by a dead supervisor is discarded."""
+    _write_pid_file(listening_port, 2**22 + 12345)
+
+    assert unoserver_daemon.daemon_status(listening_port) is None
+    assert not unoserver_daemon._pid_file(listening_port).exists()
+
+
+def test_supervisor_exits_when_idle(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With no leases and a zero idle timeout the supervisor shuts down."""
+    stopped: list[bool] = []
+
+    class DummyProc:  # noqa: D101
+        def poll(self) -> None:
+            return None
+
+    monkeypatch.setattr(
+        unoserver_daemon, "_start_unoserver", lambda _cmd: DummyProc()
+    )
+    monkeypatch.setattr(
+        unoserver_daemon,
+        "_stop_unoserver",
+        lambda _proc: stopped.append(True),
+    )
+    monkeypatch.setattr(
+        unoserver_daemon, "_wait_until_port_listens", lambda *_a: None
+    )
+    monkeypatch.setattr(unoserver_daemon, "_POLL_INTERVAL_S", 0.01)
+    monkeypatch.setattr(unoserver_daemon.signal, "signal", lambda *_a: None)
+
+    unoserver_daemon.main(["--xmlrpc-port", "4103", "--idle-timeout", "0"])
+
+    assert stopped == [True]
+    assert not unoserver_daemon._pid_file(4103).exists()
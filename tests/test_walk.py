@@ -0,0 +1,72 @@
+"""Lazy directory walking."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pdf_tools.walk import walk_files
+
+
+@pytest.fixture()
+def tree(tmp_path: Path) -> Path:
+    """Build a small nested tree of empty files."""
+    for relative in (
+        "b.docx",
+        "a.png",
+        "notes.txt",
+        "sub/c.pdf",
+        "sub/deeper/d.jpg",
+        "archive/old.docx",
+    ):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return tmp_path
+
+
+def _relative(root: Path, walk: object) -> list[str]:
+    return [f.path.relative_to(root).as_posix() for f in walk]  # type: ignore[attr-defined]
+
+
+def test_walk_is_depth_first_in_name_order(tree: Path) -> None:
+    """Every file is yielded once, sorted per directory."""
+    assert _relative(tree, walk_files(tree)) == [
+        "a.png",
+        "archive/old.docx",
+        "b.docx",
+        "notes.txt",
+        "sub/c.pdf",
+        "sub/deeper/d.jpg",
+    ]
+
+
+def test_walk_depth_limit(tree: Path) -> None:
+    """``max_depth`` bounds how far subfolders are descended."""
+    assert _relative(tree, walk_files(tree, max_depth=0)) == [
+        "a.png",
+        "b.docx",
+        "notes.txt",
+    ]
+    assert "sub/c.pdf" in _relative(tree, walk_files(tree, max_depth=1))
+    assert "sub/deeper/d.jpg" not in _relative(
+        tree, walk_files(tree, max_depth=1)
+    )
+
+
+def test_walk_include_and_exclude(tree: Path) -> None:
+    """Include filters files; exclude also prunes folders."""
+    walk = walk_files(tree, include=["*.docx", "*.jpg"], exclude=["archive"])
+    assert _relative(tree, walk) == ["b.docx", "sub/deeper/d.jpg"]
+    walk = walk_files(tree, include=["sub/*"])
+    assert _relative(tree, walk) == ["sub/c.pdf", "sub/deeper/d.jpg"]
+
+
+def test_walk_is_lazy(tree: Path) -> None:
+    """Subfolders are only listed once the walk reaches them."""
+    walk = walk_files(tree)
+    first = next(walk)
+    assert first.name == "a.png"
+    (tree / "sub" / "zz.png").touch()
+    assert "zz.png" in [f.name for f in walk]